@@ -0,0 +1,6 @@
+"""
+Benchmarks for the hot paths of `interface_meta`.
+
+Run with `python -m benchmarks` from the root of the repository (see
+`python -m benchmarks --help` for options).
+"""
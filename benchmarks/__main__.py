@@ -0,0 +1,86 @@
+"""
+Run the `interface_meta` benchmarks, optionally saving or comparing against
+stored baselines.
+
+Examples:
+    python -m benchmarks                       # run and report
+    python -m benchmarks --quick --compare     # check for regressions
+    python -m benchmarks --save                # update stored baselines
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+from pathlib import Path
+
+from .cases import CASES, quiet
+
+BASELINE_PATH = Path(__file__).parent / "baselines.json"
+
+# Upper bounds on the ratios between pairs of results (measured in the same
+# run), checked when comparing. Production mode should keep the per-class
+# cost of `InterfaceMeta` close to that of plain `ABCMeta`.
+RATIO_LIMITS = {
+    ("class_creation[production,members=10]", "class_creation[abcmeta,members=10]"): 1.25,
+}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("cases", nargs="*", choices=[[], *CASES], help="The cases to run (default: all).")
+    parser.add_argument("--quick", action="store_true", help="Run a reduced set of shapes with fewer repetitions.")
+    parser.add_argument("--save", action="store_true", help="Save the results as the new baselines.")
+    parser.add_argument("--compare", action="store_true", help="Compare the results against the stored baselines.")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="The permitted relative slowdown before a comparison fails (default: 0.5).")
+    parser.add_argument("--baselines", type=Path, default=BASELINE_PATH, help="The baselines file (default: %(default)s).")
+    args = parser.parse_args(argv)
+
+    results: dict[str, float] = {}
+    with quiet():
+        for name in args.cases or CASES:
+            print(f"# {name}: {CASES[name].__doc__}")
+            for key, value in CASES[name](args.quick).items():
+                results[key] = value
+                print(f"{key:<60} {value * 1e6:>12.3f} us")
+
+    status = 0
+    if args.compare:
+        baselines = json.loads(args.baselines.read_text())["results"]
+        print(f"\n# Comparison against {args.baselines} (tolerance: {args.tolerance:.0%})")
+        for key, value in results.items():
+            if key not in baselines:
+                continue
+            ratio = value / baselines[key]
+            regressed = ratio > 1 + args.tolerance
+            status |= regressed
+            print(f"{key:<60} {ratio:>8.2f}x {'REGRESSED' if regressed else ''}")
+        for (key, ref_key), limit in RATIO_LIMITS.items():
+            if key not in results or ref_key not in results:
+                continue
+            ratio = results[key] / results[ref_key]
+            exceeded = ratio > limit
+            status |= exceeded
+            print(f"{key + ' / ' + ref_key:<60} {ratio:>8.2f}x {f'EXCEEDS {limit:.2f}x' if exceeded else ''}")
+
+    if args.save:
+        args.baselines.write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "results": dict(sorted(results.items())),
+                },
+                indent=4,
+            )
+            + "\n"
+        )
+        print(f"\nSaved baselines to {args.baselines}.")
+
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
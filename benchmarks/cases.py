@@ -0,0 +1,186 @@
+"""
+Benchmark cases.
+
+Each case is a function that returns a mapping from benchmark names to the
+measured time (in seconds) per operation. Cases are registered via the
+`case` decorator, and are run in registration order.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any
+
+from interface_meta import InterfaceMeta
+from interface_meta.utils.conformance import check_signatures_compatible, verify_conformance, verify_signature
+from interface_meta.utils.docs import doc_join
+from interface_meta.utils.inspection import SIGNATURE_CACHE, get_functional_signature, get_functional_wrapper
+
+from .hierarchies import make_hierarchy, make_implementation, make_interface
+
+CASES: dict[str, Callable[[bool], dict[str, float]]] = {}
+
+
+def case(f: Callable[[bool], dict[str, float]]) -> Callable[[bool], dict[str, float]]:
+    CASES[f.__name__] = f
+    return f
+
+
+def timeit(f: Callable[[], Any], number: int, repeat: int = 5, setup: Callable[[], Any] | None = None) -> float:
+    """
+    Return the best time per call of `f` (in seconds) over `repeat` runs of
+    `number` calls each. If provided, `setup` is called (untimed) before each run.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            f()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+@contextmanager
+def quiet() -> Iterator[None]:
+    """Suppress logged conformance violations while benchmarking."""
+    logging.disable(logging.WARNING)
+    try:
+        yield
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+@case
+def class_creation(quick: bool) -> dict[str, float]:
+    """Time per class created, across hierarchy depth x width x members."""
+    results = {}
+    shapes = [(1, 1, 10), (4, 4, 10), (4, 4, 50)] if quick else [(d, w, m) for d in (1, 4, 16) for w in (1, 4) for m in (10, 50)]
+    for depth, width, members in shapes:
+        interface = make_interface(members)
+        per_hierarchy = timeit(
+            lambda depth=depth, width=width, members=members, interface=interface: make_hierarchy(depth, width, members, interface=interface),
+            number=1,
+            repeat=3 if quick else 5,
+        )
+        results[f"class_creation[depth={depth},width={width},members={members}]"] = per_hierarchy / (depth * width)
+    results["class_creation[abcmeta,members=10]"] = _abcmeta_class_creation(10)
+    results["class_creation[production,members=10]"] = _production_class_creation(10)
+    return results
+
+
+@case
+def docs_rendering(quick: bool) -> dict[str, float]:
+    """Time per class spent rendering documentation."""
+    results = {}
+    for depth, members in [(4, 10)] if quick else [(1, 10), (4, 10), (16, 10), (4, 50)]:
+        interface = make_interface(members, INTERFACE_LAZY_DOCS=True)
+        classes: list[type] = []
+
+        def setup(classes: list[type] = classes, interface: type = interface, depth: int = depth, members: int = members) -> None:
+            classes[:] = make_hierarchy(depth, 1, members, interface=interface)
+
+        def render(classes: list[type] = classes) -> None:
+            for cls in classes:
+                InterfaceMeta.render_docs(cls)
+
+        results[f"docs_rendering[depth={depth},members={members}]"] = timeit(render, number=1, setup=setup) / depth
+
+    sections = ["Docstring.", ["Section:", "    Body text\n    over lines."], ["Other Section:", "More text."]]
+    results["doc_join"] = timeit(lambda: doc_join(*sections), number=1000 if quick else 10000)
+    return results
+
+
+@case
+def conformance(quick: bool) -> dict[str, float]:
+    """Time per call of the conformance checking primitives."""
+    number = 1000 if quick else 10000
+    interface = make_interface(2)
+    impl = make_implementation(interface, "Impl", 2)
+    member, ref_member = impl.__dict__["method_0"], interface.__dict__["method_0"]
+    sig, ref_sig = get_functional_signature(member), get_functional_signature(ref_member)
+
+    results = {}
+    results["verify_conformance"] = timeit(lambda: verify_conformance("method_0", "Impl", member, "Interface", ref_member), number=number)
+    results["check_signatures_compatible"] = timeit(lambda: check_signatures_compatible(sig, ref_sig), number=number)
+    results["get_functional_signature[uncached]"] = timeit(lambda: get_functional_signature(member), number=1, repeat=number, setup=SIGNATURE_CACHE.clear)
+    results["get_functional_signature[cached]"] = timeit(lambda: get_functional_signature(member), number=number)
+
+    # Distinct overrides (with their own code) of a shared interface method
+    overrides: list[Any] = []
+
+    def make_overrides() -> None:
+        overrides.clear()
+        for _ in range(number):
+            namespace: dict[str, Any] = {}
+            exec(compile("def method_0(self, a, b, c=1, d=None):\n    return a\n", "<benchmark>", "exec"), namespace)
+            overrides.append(namespace["method_0"])
+
+    def verify_overrides() -> None:
+        for override in overrides:
+            verify_signature("method_0", "Impl", override, "Interface", ref_member)
+
+    results["verify_signature[distinct overrides]"] = timeit(verify_overrides, number=1, setup=make_overrides) / number
+    return results
+
+
+@case
+def wrapped_call(quick: bool) -> dict[str, float]:
+    """Runtime cost of calling methods inherited via `get_functional_wrapper`."""
+    number = 10000 if quick else 100000
+
+    class Original:
+        def method(self, a: int, b: int = 1) -> int:
+            return a
+
+    obj = Original()
+    copied = get_functional_wrapper(Original.__dict__["method"])
+    wrapped = get_functional_wrapper(Original.__dict__["method"], copy_function=False)
+
+    return {
+        "wrapped_call[original]": timeit(lambda: Original.method(obj, 1), number=number),
+        "wrapped_call[copy]": timeit(lambda: copied(obj, 1), number=number),
+        "wrapped_call[wrapper]": timeit(lambda: wrapped(obj, 1), number=number),
+    }
+
+
+@case
+def threaded_class_creation(quick: bool) -> dict[str, float]:
+    """Wall time per class created when creating classes concurrently from N threads."""
+    results = {}
+    members = 10
+    per_thread = 25 if quick else 100
+    interface = make_interface(members)
+    for threads in (1, 2, 4, 8):
+
+        def create(thread: int, threads: int = threads) -> None:
+            for i in range(per_thread):
+                make_implementation(interface, f"Impl_{threads}_{thread}_{i}", members)
+
+        def run(threads: int = threads, create: Callable[[int], None] = create) -> None:
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                list(executor.map(create, range(threads)))
+
+        results[f"threaded_class_creation[threads={threads}]"] = timeit(run, number=1, repeat=3) / (threads * per_thread)
+    return results
+
+
+def _production_class_creation(members: int) -> float:
+    interface = make_interface(members)
+    InterfaceMeta.set_production_mode(True)
+    try:
+        return timeit(lambda: make_implementation(interface, "Impl", members, overrides=False), number=100)
+    finally:
+        InterfaceMeta.set_production_mode(False)
+
+
+def _abcmeta_class_creation(members: int) -> float:
+    from abc import ABCMeta
+
+    interface = make_interface(members, metaclass=ABCMeta)
+    return timeit(lambda: make_implementation(interface, "Impl", members, overrides=False), number=100)
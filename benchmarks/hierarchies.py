@@ -0,0 +1,69 @@
+"""
+Generators for synthetic `InterfaceMeta` class hierarchies.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from interface_meta import InterfaceMeta, inherit_docs, override
+
+
+def make_interface(members: int, metaclass: type = InterfaceMeta, **config: Any) -> type:
+    """
+    Create an interface with `members` documented methods.
+
+    Every other method delegates its quirks documentation to a private
+    method, so that both documentation code paths are exercised.
+    """
+    dct: dict[str, Any] = {
+        "__doc__": "A synthetic interface.",
+        "_Interface__doc_attrs": "ATTRIBUTE (str): A documented attribute.",
+        "ATTRIBUTE": "value",
+        **config,
+    }
+    for i in range(members):
+        dct[f"method_{i}"] = _make_method(f"Interface method {i}.", quirks=f"_method_{i}" if i % 2 else None)
+        if i % 2:
+            dct[f"_method_{i}"] = _make_method(None)
+    return metaclass("Interface", (), dct)
+
+
+def make_implementation(parent: type, name: str, members: int, overrides: bool = True) -> type:
+    """
+    Create a subclass of `parent` that overrides `members` of its methods.
+    """
+    dct: dict[str, Any] = {"__doc__": f"Implementation {name}."}
+    for i in range(members):
+        key = f"_method_{i}" if i % 2 else f"method_{i}"
+        method = _make_method(f"Quirks of {name}.{key}.")
+        dct[key] = override(method) if overrides else method
+    return type(parent)(name, (parent,), dct)
+
+
+def make_hierarchy(depth: int, width: int, members: int, interface: type | None = None) -> list[type]:
+    """
+    Create a hierarchy `depth` levels deep below an interface, with `width`
+    sibling implementations at each level (each subclassing the first sibling
+    of the previous level).
+
+    Returns:
+        All classes in the hierarchy (excluding the interface), in creation order.
+    """
+    parent = interface if interface is not None else make_interface(members)
+    classes = []
+    for level in range(depth):
+        siblings = [make_implementation(parent, f"Impl_{level}_{i}", members) for i in range(width)]
+        classes.extend(siblings)
+        parent = siblings[0]
+    return classes
+
+
+def _make_method(doc: str | None, quirks: str | None = None) -> Any:
+    def method(self: Any, a: Any, b: Any, c: Any = 1) -> Any:
+        return a
+
+    method.__doc__ = doc
+    if quirks is not None:
+        return inherit_docs(method=quirks)(method)
+    return method
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections.abc import Sequence
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m interface_meta", description="Tooling for `interface_meta` interfaces.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = commands.add_parser(
+        "build-doc-cache",
+        help="Write the rendered documentation of the interfaces in the nominated packages to a cache file.",
+    )
+    build_parser.add_argument("packages", nargs="+", help="The packages (or modules) to import.")
+    build_parser.add_argument("-o", "--output", required=True, help="The path of the cache file to write.")
+
+    check = commands.add_parser(
+        "check",
+        help="Statically check the conformance of the interfaces in the nominated source files or directories (without importing them).",
+    )
+    check.add_argument("paths", nargs="+", help="The source files or directories to check.")
+    check.add_argument(
+        "--search-path",
+        action="append",
+        default=[],
+        help="Additional source files or directories used only to resolve class hierarchies.",
+    )
+    check.add_argument("--json", action="store_true", help="Output violations as JSON.")
+
+    verify = commands.add_parser(
+        "verify",
+        help="Import all submodules of the nominated packages (in parallel), and report all conformance violations as JSON.",
+    )
+    verify.add_argument("packages", nargs="+", help="The packages (or modules) to verify.")
+    verify.add_argument("-j", "--jobs", type=int, default=None, help="The number of worker processes to use (default: the number of CPUs).")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build-doc-cache":
+        from .utils.doc_cache import build_doc_cache
+
+        count = build_doc_cache(args.packages, args.output)
+        print(f"Wrote documentation for {count} classes to `{args.output}`.")
+    elif args.command == "check":
+        from .utils.static import check_paths
+
+        violations = check_paths(args.paths, search_paths=args.search_path)
+        if args.json:
+            print(json.dumps([violation.as_dict() for violation in violations], indent=2))
+        else:
+            for violation in violations:
+                print(violation)
+        return 1 if violations else 0
+    elif args.command == "verify":
+        from .utils.verification import verify_packages
+
+        results = verify_packages(args.packages, jobs=args.jobs)
+        print(json.dumps(results, indent=2))
+        return 1 if results["violations"] or results["errors"] else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
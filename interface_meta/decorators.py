@@ -39,8 +39,9 @@ def inherit_docs(
             definition.
 
     Returns:
-        A function wrapper that attaches attributes `_quirks_method` and
-        `_quirks_mro` to the method, for interpretation by `InterfaceMeta`.
+        A function wrapper that records `method` and `mro` in the interface
+        metadata of the method (see `InterfaceMetadata`), for interpretation
+        by `InterfaceMeta`.
     """
     return InterfaceMeta.inherit_docs(method=method, mro=mro)
 
@@ -1,22 +1,42 @@
 from __future__ import annotations
 
+import functools
+import os
+import sys
 from abc import ABCMeta
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+from time import perf_counter
 from typing import Any, TypeVar, overload
 
-from .utils.conformance import verify_conformance, verify_not_overridden
-from .utils.docs import update_docs
-from .utils.inspection import (
-    set_explicit_override,
-    set_forced_override,
-    set_quirk_docs_method,
-    set_quirk_docs_mro,
-    should_skip,
+from .utils.conformance import defer_conformance, verify_conformance, verify_not_overridden, verify_pending
+from .utils.docs import defer_docs, invalidate_doc_state, render_docs, update_docs
+from .utils.events import CLASS_CREATED, DOCS_RENDERED, MEMBER_VERIFIED, REGISTERED, emit, has_subscribers
+from .utils.inspection import should_skip, update_metadata
+from .utils.members import (
+    INDEX_ATTR,
+    SLOTS_ATTR,
+    MemberOrigin,
+    get_declared_slots,
+    get_inherited_member_index,
+    invalidate_member_index,
+    update_member_index,
 )
+from .utils.registry import ImplementationRegistry, get_registry, register_implementation
 
 _FuncT = TypeVar("_FuncT")
 
 
+def _production_mode_from_environment() -> bool:
+    env = os.environ.get("INTERFACE_META_PRODUCTION")
+    if env is not None:
+        return env.strip().lower() in ("1", "true", "yes", "on")
+    # Docstrings are stripped under `python -OO`, so there is nothing to render.
+    return sys.flags.optimize >= 2
+
+
+_PRODUCTION_MODE = _production_mode_from_environment()
+
+
 class InterfaceMeta(ABCMeta):
     """
     A metaclass that helps subclasses of a class to conform to its API.
@@ -33,6 +53,27 @@ class InterfaceMeta(ABCMeta):
     INTERFACE_EXPLICIT_OVERRIDES = True
     INTERFACE_RAISE_ON_VIOLATION = False
     INTERFACE_SKIPPED_NAMES = set()  # type: ignore  # noqa: RUF012
+    INTERFACE_LAZY_DOCS = False
+    INTERFACE_CHECK_MODE = "eager"
+    INTERFACE_REGISTRY = False
+    INTERFACE_SLOTS = False
+    INTERFACE_ENTRY_POINT_GROUP = None
+    INTERFACE_PLUGIN_MANIFEST = None
+    INTERFACE_CHECK_ANNOTATIONS = False
+
+    def __new__(
+        mcls,
+        name: str,
+        bases: tuple[type, ...],
+        dct: dict[str, Any],
+        /,
+        **kwargs: Any,
+    ) -> InterfaceMeta:
+        # Generate `__slots__` from declared attributes
+        if "__slots__" not in dct and mcls.__get_config(bases, dct, "INTERFACE_SLOTS"):
+            slots = get_declared_slots(bases, dct)
+            dct = {**dct, "__slots__": slots, SLOTS_ATTR: frozenset(slots)}
+        return super().__new__(mcls, name, bases, dct, **kwargs)
 
     def __init__(
         cls,
@@ -46,65 +87,72 @@ class InterfaceMeta(ABCMeta):
 
         # Register interface class for subclasses
         if not hasattr(cls, "__interface__"):
-            cls.__interface__ = cls
-
-        # Read configuration
-        explicit_overrides = cls.__get_config(bases, dct, "INTERFACE_EXPLICIT_OVERRIDES")
-        raise_on_violation = cls.__get_config(bases, dct, "INTERFACE_RAISE_ON_VIOLATION")
-        skipped_names = cls.__get_config(bases, dct, "INTERFACE_SKIPPED_NAMES")
-
-        # Iterate over names in `dct` and check for conformance to interface
-        for key, value in dct.items():
-            # Skip any key corresponding to Python magic methods
-            if key.startswith("__") and key.endswith("__"):
-                continue
-
-            # Skip any key in skipped_names
-            if key in skipped_names or should_skip(value):  # pragma: no cover
-                continue
-
-            # Identify the first instance of this key in the MRO, if it exists, and check conformance
-            is_override = False
-            for base in cls.__mro__[1:]:
-                if base is object:
-                    continue
-                if key in base.__dict__:
-                    is_override = True
-                    cls.__verify_conformance(
-                        key,
-                        name,
-                        value,
-                        base.__name__,
-                        base.__dict__[key],
-                        explicit_overrides=explicit_overrides,
-                        raise_on_violation=raise_on_violation,
-                    )
-                    break
-                if key in getattr(base, "__annotations__", {}):  # Declared but as yet unspecified attributes
-                    is_override = True
-                    cls.__verify_conformance(
-                        key,
-                        name,
-                        value,
-                        name,
-                        None,
-                        explicit_overrides=explicit_overrides,
-                        raise_on_violation=raise_on_violation,
-                    )
-                    break
-
-            if not is_override:
-                verify_not_overridden(key, name, value, raise_on_violation=raise_on_violation)
+            type.__setattr__(cls, "__interface__", cls)  # Bypasses `InterfaceMeta.__setattr__`
+
+        # In production mode, conformance checks and documentation are skipped
+        if _PRODUCTION_MODE:
+            cls.__register(cls, bases, dct)
+            cls.__register_implementation__()
+            if has_subscribers(REGISTERED):
+                emit(REGISTERED, cls)
+            return
+
+        observed = has_subscribers()
+        timings: dict[str, float] = {}
+
+        # Check for conformance to interface
+        start = perf_counter() if observed else 0.0
+        inherited = get_inherited_member_index(cls)
+        count = 0
+        check_mode = cls.__get_config(bases, dct, "INTERFACE_CHECK_MODE")
+        if check_mode == "eager":
+            count = cls.__verify_members(cls, name, bases, dct, inherited)
+        elif check_mode == "deferred":
+            defer_conformance(cls, functools.partial(cls.__verify_members, cls, name, bases, dct, inherited))
+        elif check_mode != "off":
+            raise ValueError(f"Invalid `INTERFACE_CHECK_MODE` for `{name}`: {check_mode!r}. Valid modes are: 'eager', 'deferred' and 'off'.")
+        if observed:
+            timings["conformance"] = perf_counter() - start
 
         # Update documentation
-        cls.__update_docs(cls, name, bases, dct)
-
-        # Call subclass registration hook
+        start = perf_counter() if observed else 0.0
+        if cls.__get_config(bases, dct, "INTERFACE_LAZY_DOCS"):
+            defer_docs(cls, functools.partial(cls.__update_docs, cls, name, bases, dct))
+        else:
+            cls.__update_docs(cls, name, bases, dct)
+        if observed:
+            timings["docs"] = perf_counter() - start
+
+        # Index members for fast lookup during the creation of subclasses
+        update_member_index(cls, inherited)
+
+        # Register implementation and call subclass registration hook
+        start = perf_counter() if observed else 0.0
+        cls.__register(cls, bases, dct)
         cls.__register_implementation__()
+        if observed:
+            timings["registration"] = perf_counter() - start
+            emit(REGISTERED, cls, timings["registration"])
+            emit(CLASS_CREATED, cls, sum(timings.values()), count, timings=timings)
 
     def __register_implementation__(cls) -> None:
         pass
 
+    # Keep the member indices of created classes (and their subclasses) in
+    # sync with members added, replaced or removed after creation.
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if INDEX_ATTR in cls.__dict__ and not (name.startswith("__") and name.endswith("__")):
+            invalidate_member_index(cls)
+            invalidate_doc_state(cls)
+
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        if INDEX_ATTR in cls.__dict__ and not (name.startswith("__") and name.endswith("__")):
+            invalidate_member_index(cls)
+            invalidate_doc_state(cls)
+
     @classmethod
     def __get_config(
         mcls,
@@ -117,6 +165,76 @@ class InterfaceMeta(ABCMeta):
             default = getattr(bases[0], key, default)
         return dct.get(key, default)
 
+    @classmethod
+    def __register(mcls, cls: type, bases: tuple[type, ...], dct: dict[str, Any]) -> None:
+        if mcls.__get_config(bases, dct, "INTERFACE_REGISTRY"):
+            register_implementation(cls, keys=dct.get("INTERFACE_REGISTRY_KEYS"))
+
+    @classmethod
+    def __verify_members(
+        mcls,
+        cls: type,
+        name: str,
+        bases: tuple[type, ...],
+        dct: dict[str, Any],
+        inherited: Mapping[str, MemberOrigin],
+    ) -> int:
+        # Read configuration
+        explicit_overrides = mcls.__get_config(bases, dct, "INTERFACE_EXPLICIT_OVERRIDES")
+        raise_on_violation = mcls.__get_config(bases, dct, "INTERFACE_RAISE_ON_VIOLATION")
+        skipped_names = mcls.__get_config(bases, dct, "INTERFACE_SKIPPED_NAMES")
+        check_annotations = mcls.__get_config(bases, dct, "INTERFACE_CHECK_ANNOTATIONS")
+        observed = has_subscribers(MEMBER_VERIFIED)
+        qualname = f"{cls.__module__}.{cls.__qualname__}"
+
+        # Iterate over names in `dct` and check for conformance to interface
+        count = 0
+        for key, value in dct.items():
+            # Skip any key corresponding to Python magic methods
+            if key.startswith("__") and key.endswith("__"):
+                continue
+
+            # Skip any key in skipped_names
+            if key in skipped_names or should_skip(value):  # pragma: no cover
+                continue
+
+            start = perf_counter() if observed else 0.0
+
+            # Identify the first instance of this key in the MRO, if it exists, and check conformance
+            origin = inherited.get(key)
+            if origin is None:
+                verify_not_overridden(key, name, value, raise_on_violation=raise_on_violation, qualname=qualname)
+            elif origin.annotation_only:  # Declared but as yet unspecified attributes
+                mcls.__verify_conformance(
+                    key,
+                    name,
+                    value,
+                    name,
+                    None,
+                    explicit_overrides=explicit_overrides,
+                    raise_on_violation=raise_on_violation,
+                    check_annotations=check_annotations,
+                    qualname=qualname,
+                )
+            else:
+                mcls.__verify_conformance(
+                    key,
+                    name,
+                    value,
+                    origin.owner.__name__,
+                    origin.member,
+                    explicit_overrides=explicit_overrides,
+                    raise_on_violation=raise_on_violation,
+                    check_annotations=check_annotations,
+                    qualname=qualname,
+                )
+
+            count += 1
+            if observed:
+                emit(MEMBER_VERIFIED, cls, perf_counter() - start, 1, name=key, origin=origin)
+
+        return count
+
     @classmethod
     def __verify_conformance(
         mcls,
@@ -127,6 +245,8 @@ class InterfaceMeta(ABCMeta):
         base_value: object | None,
         explicit_overrides: bool = True,
         raise_on_violation: bool = False,
+        check_annotations: bool = False,
+        qualname: str | None = None,
     ) -> None:
         verify_conformance(
             key,
@@ -136,6 +256,8 @@ class InterfaceMeta(ABCMeta):
             base_value,
             explicit_overrides=explicit_overrides,
             raise_on_violation=raise_on_violation,
+            check_annotations=check_annotations,
+            qualname=qualname,
         )
 
     @classmethod
@@ -147,7 +269,88 @@ class InterfaceMeta(ABCMeta):
         dct: dict[str, Any],
     ) -> None:
         skipped_names = mcls.__get_config(bases, dct, "INTERFACE_SKIPPED_NAMES")
-        update_docs(cls, name, bases, dct, skipped_names=skipped_names)
+        if not has_subscribers(DOCS_RENDERED):
+            update_docs(cls, name, bases, dct, skipped_names=skipped_names)
+            return
+        start = perf_counter()
+        count = update_docs(cls, name, bases, dct, skipped_names=skipped_names)
+        emit(DOCS_RENDERED, cls, perf_counter() - start, count)
+
+    @classmethod
+    def set_production_mode(mcls, enabled: bool = True) -> None:
+        """
+        Enable or disable production mode.
+
+        In production mode, `InterfaceMeta` skips all conformance checking and
+        documentation rewriting for subsequently created classes (which are
+        assumed to have been verified elsewhere, e.g. by CI), leaving only the
+        registration of `__interface__` and the `__register_implementation__`
+        hook. This should be called before the relevant classes are imported.
+
+        Production mode is enabled by default if the `INTERFACE_META_PRODUCTION`
+        environment variable is set to a truthy value (`1`, `true`, `yes` or
+        `on`), or if Python is run with `-OO` and this variable is not set.
+
+        Args:
+            enabled: Whether production mode should be enabled.
+        """
+        global _PRODUCTION_MODE
+        _PRODUCTION_MODE = enabled
+
+    @classmethod
+    def is_production_mode(mcls) -> bool:
+        """
+        Return whether production mode is enabled (see `set_production_mode`).
+        """
+        return _PRODUCTION_MODE
+
+    @classmethod
+    def verify_pending(mcls, cls: type | None = None) -> None:
+        """
+        Run conformance checks deferred by `INTERFACE_CHECK_MODE = "deferred"`.
+
+        Deferred checks are otherwise run the first time that a class (or one
+        of its subclasses) is instantiated.
+
+        Args:
+            cls: The class for which to run pending checks (along with those
+                of the classes in its MRO). If not specified, all pending checks
+                are run.
+        """
+        verify_pending(cls)
+
+    @classmethod
+    def get_registry(mcls, cls: type) -> ImplementationRegistry | None:
+        """
+        Return the registry of implementations of the interface of `cls`.
+
+        Registries are maintained for interfaces with `INTERFACE_REGISTRY = True`,
+        and allow implementations to be looked up by name, or by the keys they
+        declare via `INTERFACE_REGISTRY_KEYS`.
+
+        Args:
+            cls: The interface (or any of its implementations).
+
+        Returns:
+            The registry, or `None` if the interface does not have one.
+        """
+        return get_registry(cls)
+
+    @classmethod
+    def render_docs(mcls, cls: type | None = None) -> None:
+        """
+        Render documentation deferred by `INTERFACE_LAZY_DOCS`.
+
+        Documentation for classes with lazy documentation is otherwise rendered
+        the first time that the class `__doc__` attribute is accessed. Use
+        this method to render it eagerly (e.g. before introspecting the
+        documentation of individual members).
+
+        Args:
+            cls: The class for which to render the documentation. If not
+                specified, all pending documentation is rendered.
+        """
+        render_docs(cls)
 
     @classmethod
     def inherit_docs(
@@ -182,14 +385,13 @@ class InterfaceMeta(ABCMeta):
                 definition.
 
         Returns:
-            A function wrapper that attaches attributes `_quirks_method` and
-            `_quirks_mro` to the method, for interpretation by `InterfaceMeta`.
+            A function wrapper that records `method` and `mro` in the interface
+            metadata of the method (see `InterfaceMetadata`), for
+            interpretation by `InterfaceMeta`.
         """
 
         def doc_wrapper(f: _FuncT) -> _FuncT:
-            set_quirk_docs_method(f, method)
-            set_quirk_docs_mro(f, mro)
-            return f
+            return update_metadata(f, quirks_method=method, has_quirks_method=True, quirks_mro=mro)
 
         return doc_wrapper
 
@@ -229,9 +431,7 @@ class InterfaceMeta(ABCMeta):
         """
 
         def _override(f: _FuncT) -> _FuncT:
-            set_explicit_override(f)
-            set_forced_override(f, force)
-            return f
+            return update_metadata(f, override=True, force=force)
 
         if func is not None:
             return _override(func)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Generic, NamedTuple, TypeVar
+
+_ValueT = TypeVar("_ValueT")
+
+_MISSING: Any = object()
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class WeakLRUCache(Generic[_ValueT]):
+    """
+    A bounded least-recently-used cache keyed by weak references.
+
+    Entries are evicted either when the cache grows beyond `maxsize`, or when
+    the object used as a key is garbage collected. This makes it suitable for
+    caching information about functions and classes (which may be dynamically
+    generated) without extending their lifetime.
+
+    The cache is safe to use from multiple threads (including on free-threaded
+    builds of Python). Lookups do not acquire a lock (relying on individual
+    dictionary operations being atomic), so that concurrent readers are not
+    serialised; only insertions and evictions are. As a result, hit/miss
+    statistics are approximate under concurrent use.
+
+    Args:
+        maxsize: The maximum number of entries to retain.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[weakref.ref[Any], _ValueT] = OrderedDict()
+        # Re-entrant, since eviction callbacks may run during garbage collection
+        # triggered while the lock is held.
+        self._lock = threading.RLock()
+
+    def get(self, key: object, default: _ValueT | None = None) -> _ValueT | None:
+        """
+        Retrieve the value associated with `key`, or `default` if not present.
+
+        Keys that cannot be weakly referenced (or hashed) are never present in
+        the cache.
+        """
+        try:
+            ref = weakref.ref(key)
+            value = self._data.get(ref, _MISSING)
+        except TypeError:
+            value = _MISSING
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self.hits += 1
+        try:
+            self._data.move_to_end(ref)
+        except KeyError:  # pragma: no cover; evicted concurrently
+            pass
+        return value  # type: ignore[no-any-return]
+
+    def set(self, key: object, value: _ValueT) -> None:
+        """
+        Associate `value` with `key`, evicting the least recently used entry if
+        necessary. Keys that cannot be weakly referenced (or hashed) are silently
+        ignored.
+        """
+        try:
+            ref = weakref.ref(key, self._evict)
+            hash(ref)
+        except TypeError:
+            return
+        with self._lock:
+            self._data[ref] = value
+            self._data.move_to_end(ref)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the hit/miss statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return the current hit/miss statistics and size of the cache."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _evict(self, ref: weakref.ref[Any]) -> None:
+        with self._lock:
+            self._data.pop(ref, None)
@@ -1,16 +1,37 @@
+import functools
 import inspect
-import logging
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
 from inspect import Parameter, Signature
+from typing import Any
 
+from .caching import WeakLRUCache
 from .inspection import (
+    SignatureFingerprint,
+    _DefaultRef,
+    _get_member,
+    get_functional_fingerprint,
     get_functional_signature,
+    get_functional_type_hints,
     has_explicit_override,
     has_forced_override,
+    has_same_signature,
     is_functional_member,
     is_method,
     should_skip,
 )
-from .reporting import report_violation
+from .reporting import (
+    ANNOTATION_MISMATCH,
+    MISSING_OVERRIDE,
+    SIGNATURE_MISMATCH,
+    TYPE_CHANGE,
+    UNKNOWN_OVERRIDE,
+    Violation,
+    collect_violations,
+    report_violation,
+)
 
 
 def verify_conformance(
@@ -21,6 +42,8 @@ def verify_conformance(
     ref_member: object | None,
     explicit_overrides: bool = True,
     raise_on_violation: bool = False,
+    check_annotations: bool = False,
+    qualname: str | None = None,
 ) -> None:
     """
     Verify that a member conforms to a nominated interface.
@@ -34,6 +57,12 @@ def verify_conformance(
         explicit_overrides: Whether to require explicit overrides. (default: True)
         raise_on_violation: Whether any non-conformance should cause an
             exception to be raised. (default: False)
+        check_annotations: Whether the type hints of methods should be
+            checked for compatibility (see `verify_annotations`).
+            (default: False)
+        qualname: The qualified name (including the module) of the class
+            parent of the checked member, used to deduplicate reported
+            violations. (default: `clsname`)
     """
     if hasattr(ref_member, "__objclass__"):  # pragma: no cover; Method is attached to metaclass, so should not be checked.
         return
@@ -41,6 +70,57 @@ def verify_conformance(
     if ref_member is None or has_forced_override(member) or should_skip(ref_member):
         return
 
+    # Skip members already known to conform to this reference member
+    function = _get_member(member)
+    key = _get_conformance_key(member, ref_member, explicit_overrides, check_annotations)
+    if key is None:
+        _verify_conformance(
+            name,
+            clsname,
+            member,
+            ref_clsname,
+            ref_member,
+            explicit_overrides=explicit_overrides,
+            raise_on_violation=raise_on_violation,
+            check_annotations=check_annotations,
+            qualname=qualname,
+        )
+        return
+    if key in (CONFORMANCE_CACHE.get(function) or ()):
+        return
+
+    with collect_violations() as violations:
+        _verify_conformance(
+            name,
+            clsname,
+            member,
+            ref_clsname,
+            ref_member,
+            explicit_overrides=explicit_overrides,
+            raise_on_violation=raise_on_violation,
+            check_annotations=check_annotations,
+            qualname=qualname,
+        )
+
+    if not violations:
+        conformant = CONFORMANCE_CACHE.get(function)
+        if conformant is None:
+            conformant = set()
+            CONFORMANCE_CACHE.set(function, conformant)
+        conformant.add(key)
+
+
+def _verify_conformance(
+    name: str,
+    clsname: str,
+    member: object,
+    ref_clsname: str,
+    ref_member: object,
+    explicit_overrides: bool,
+    raise_on_violation: bool,
+    check_annotations: bool,
+    qualname: str | None,
+) -> None:
     # Check that type of member has not changed.
     if type(member) is not type(ref_member):
         if isinstance(member, property) and not is_method(ref_member):
@@ -50,7 +130,7 @@ def verify_conformance(
             # This means we are replacing a fixed attribute with a method,
             # or between different types of functional members
             report_violation(
-                f"`{clsname}.{name}` changes the type of `{ref_clsname}.{name}` (`{type(member)}` instead of `{type(ref_member)}`) without using `@override(force=True)` decorator.",
+                Violation(TYPE_CHANGE, clsname, name, ref_clsname, (type(member), type(ref_member)), qualname=qualname),
                 raise_on_violation,
             )
         else:  # Most other type changes should be fine
@@ -60,7 +140,7 @@ def verify_conformance(
     if is_functional_member(member) or inspect.isdatadescriptor(member) or inspect.ismethoddescriptor(member):
         if explicit_overrides and not has_explicit_override(member):
             report_violation(
-                f"`{clsname}.{name}` overrides interface `{ref_clsname}.{name}` without using the `@override` decorator.",
+                Violation(MISSING_OVERRIDE, clsname, name, ref_clsname, qualname=qualname),
                 raise_on_violation,
             )
 
@@ -72,7 +152,40 @@ def verify_conformance(
             ref_clsname,
             ref_member,
             raise_on_violation=raise_on_violation,
+            qualname=qualname,
         )
+        if check_annotations:
+            verify_annotations(
+                name,
+                clsname,
+                member,
+                ref_clsname,
+                ref_member,
+                raise_on_violation=raise_on_violation,
+                qualname=qualname,
+            )
+
+
+# Conformance outcomes are cached for members that were found to conform to a
+# given reference member, so that classes that are repeatedly generated from
+# the same functions need only be checked once. The cache is keyed by the
+# underlying function of the checked member, and stores a set of keys
+# identifying the reference members (and configuration) it conforms to.
+CONFORMANCE_CACHE: WeakLRUCache[set[tuple[Any, ...]]] = WeakLRUCache(maxsize=4096)
+
+
+def _get_conformance_key(member: object, ref_member: object, explicit_overrides: bool, check_annotations: bool) -> tuple[Any, ...] | None:
+    # Only functional members are cached, since other attributes (e.g.
+    # arbitrary class attribute values) may be unhashable, may not support
+    # weak references, or may override equality.
+    if not (is_functional_member(member) and is_functional_member(ref_member)):
+        return None
+    try:
+        ref = weakref.ref(_get_member(ref_member))
+        hash(ref)
+    except TypeError:
+        return None
+    return (ref, type(member), type(ref_member), explicit_overrides, check_annotations)
 
 
 def verify_signature(
@@ -82,6 +195,7 @@ def verify_signature(
     ref_clsname: str,
     ref_member: object,
     raise_on_violation: bool = False,
+    qualname: str | None = None,
 ) -> None:
     """
     Verify that the signature of a member is compatible with some reference member.
@@ -94,16 +208,26 @@ def verify_signature(
         ref_member: The referece member to be treated as an interface definition.
         raise_on_violation: Whether any non-conformance should cause an
             exception to be raised. (default: False)
+        qualname: The qualified name (including the module) of the class
+            parent of the checked member, used to deduplicate reported
+            violations. (default: `clsname`)
     """
-    sig = get_functional_signature(member)
-    ref_sig = get_functional_signature(ref_member)
+    # Members sharing code with the reference member trivially conform
+    if has_same_signature(member, ref_member):
+        return
 
-    if not check_signatures_compatible(sig, ref_sig):
-        message = f"Signature `{clsname}.{name}{sig}` does not conform to interface `{ref_clsname}.{name}{ref_sig}`."
-        if raise_on_violation:
-            raise RuntimeError(message)
-        else:
-            logging.warning(message)
+    if not check_fingerprints_compatible(get_functional_fingerprint(member), get_functional_fingerprint(ref_member)):
+        report_violation(
+            Violation(
+                SIGNATURE_MISMATCH,
+                clsname,
+                name,
+                ref_clsname,
+                (get_functional_signature(member), get_functional_signature(ref_member)),
+                qualname=qualname,
+            ),
+            raise_on_violation=raise_on_violation,
+        )
 
 
 def check_signatures_compatible(sig: Signature, ref_sig: Signature) -> bool:
@@ -117,23 +241,25 @@ def check_signatures_compatible(sig: Signature, ref_sig: Signature) -> bool:
     Returns:
         `True` if the signatures are compatible, and `False` otherwise.
     """
+    # Parameters are compared directly, since fingerprinting signatures that
+    # are only compared once would cost more than it saves (see
+    # `check_fingerprints_compatible` for the equivalent check of fingerprints).
     params = iter(sig.parameters.values())
-    base_params = iter(ref_sig.parameters.values())
 
     try:
-        for bp in base_params:
-            cp = next(params)
+        for ref_param in ref_sig.parameters.values():
+            param = next(params)
 
-            while bp.kind is Parameter.VAR_POSITIONAL and cp.kind is Parameter.POSITIONAL_OR_KEYWORD:
-                cp = next(params)
+            while ref_param.kind is Parameter.VAR_POSITIONAL and param.kind is Parameter.POSITIONAL_OR_KEYWORD:
+                param = next(params)
 
-            while bp.kind is Parameter.VAR_KEYWORD and cp.kind is not Parameter.VAR_KEYWORD:
-                cp = next(params)
+            while ref_param.kind is Parameter.VAR_KEYWORD and param.kind is not Parameter.VAR_KEYWORD:
+                param = next(params)
 
-            if not (cp.name == bp.name and bp.kind == cp.kind and bp.default == cp.default):
-                raise ValueError(bp, cp)
+            if not (param.name == ref_param.name and param.kind == ref_param.kind and _defaults_equal(param.default, ref_param.default)):
+                return False
 
-    except (StopIteration, ValueError):
+    except StopIteration:
         return False
 
     for param in params:
@@ -143,11 +269,190 @@ def check_signatures_compatible(sig: Signature, ref_sig: Signature) -> bool:
     return True
 
 
+def check_fingerprints_compatible(fingerprint: SignatureFingerprint, ref_fingerprint: SignatureFingerprint) -> bool:
+    """
+    Check whether two signatures are compatible, given their fingerprints
+    (as returned by `get_signature_fingerprint`).
+
+    Args:
+        fingerprint: The fingerprint of a signature to check for
+            compatibility with `ref_fingerprint`.
+        ref_fingerprint: The fingerprint of the reference signature.
+
+    Returns:
+        `True` if the signatures are compatible, and `False` otherwise.
+    """
+    if fingerprint == ref_fingerprint:
+        return True
+    key = (fingerprint, ref_fingerprint)
+    compatible = _COMPATIBILITY_MEMO.get(key)
+    if compatible is None:
+        compatible = _check_fingerprints(fingerprint, ref_fingerprint)
+        # Fingerprints holding references to arbitrary default values are not
+        # memoized, so that the memo never extends the lifetime of those values.
+        if not (_has_referenced_defaults(fingerprint) or _has_referenced_defaults(ref_fingerprint)):
+            with _COMPATIBILITY_MEMO_LOCK:
+                _COMPATIBILITY_MEMO[key] = compatible
+                if len(_COMPATIBILITY_MEMO) > _COMPATIBILITY_MEMO_MAXSIZE:
+                    _COMPATIBILITY_MEMO.popitem(last=False)
+    return compatible
+
+
+# Since many implementations share a handful of interface signatures, the
+# outcome of each pairwise comparison of fingerprints is memoized.
+_COMPATIBILITY_MEMO: OrderedDict[tuple[SignatureFingerprint, SignatureFingerprint], bool] = OrderedDict()
+_COMPATIBILITY_MEMO_MAXSIZE = 4096
+_COMPATIBILITY_MEMO_LOCK = threading.Lock()
+
+
+def _has_referenced_defaults(fingerprint: SignatureFingerprint) -> bool:
+    for _name, _kind, default in fingerprint:
+        if type(default) is _DefaultRef:
+            return True
+    return False
+
+
+def _check_fingerprints(fingerprint: SignatureFingerprint, ref_fingerprint: SignatureFingerprint) -> bool:
+    # As for `check_signatures_compatible`, but comparing the
+    # `(name, kind, default)` triples of fingerprints.
+    remaining = iter(fingerprint)
+
+    try:
+        for ref_name, ref_kind, ref_default in ref_fingerprint:
+            name, kind, default = next(remaining)
+
+            while ref_kind is Parameter.VAR_POSITIONAL and kind is Parameter.POSITIONAL_OR_KEYWORD:
+                name, kind, default = next(remaining)
+
+            while ref_kind is Parameter.VAR_KEYWORD and kind is not Parameter.VAR_KEYWORD:
+                name, kind, default = next(remaining)
+
+            if not (name == ref_name and kind == ref_kind and (default is ref_default or _defaults_equal(default, ref_default))):
+                return False
+
+    except StopIteration:
+        return False
+
+    for _name, kind, default in remaining:
+        if kind is Parameter.POSITIONAL_ONLY or (kind is Parameter.POSITIONAL_OR_KEYWORD and default is Parameter.empty):
+            return False
+
+    return True
+
+
+def _defaults_equal(default: object, ref_default: object) -> bool:
+    if default is ref_default:
+        return True
+    if isinstance(default, _DefaultRef):
+        default = default.value
+    if isinstance(ref_default, _DefaultRef):
+        ref_default = ref_default.value
+    if default is ref_default:
+        return True
+    # Comparisons may be element-wise (e.g. for arrays), or may fail outright
+    try:
+        return bool(default == ref_default)
+    except Exception:
+        return False
+
+
+def verify_annotations(
+    name: str,
+    clsname: str,
+    member: object,
+    ref_clsname: str,
+    ref_member: object,
+    raise_on_violation: bool = False,
+    qualname: str | None = None,
+) -> None:
+    """
+    Verify that the type hints of a member are compatible with those of some
+    reference member.
+
+    Parameters are matched by name, and only hints present for both members
+    are compared (see `check_hints_compatible`). Hints that cannot be
+    resolved (e.g. forward references to names not yet defined) are not
+    checked.
+
+    Args:
+        name: The name of the member method being checked.
+        clsname: The name of the class parent of the checked member.
+        member: The class member to check for conformance against ref_member.
+        ref_clsname: The name of the reference class to be treated as an interface.
+        ref_member: The referece member to be treated as an interface definition.
+        raise_on_violation: Whether any non-conformance should cause an
+            exception to be raised. (default: False)
+        qualname: The qualified name (including the module) of the class
+            parent of the checked member, used to deduplicate reported
+            violations. (default: `clsname`)
+    """
+    if _get_member(member) is _get_member(ref_member):
+        return
+
+    ref_hints = get_functional_type_hints(ref_member)
+    if not ref_hints:
+        return
+    hints = get_functional_type_hints(member)
+    if not hints:
+        return
+
+    mismatches = [
+        (key, hints[key], ref_hint)
+        for key, ref_hint in ref_hints.items()
+        if key in hints and not check_hints_compatible(hints[key], ref_hint, covariant=key == "return")
+    ]
+    if mismatches:
+        report_violation(
+            Violation(
+                ANNOTATION_MISMATCH,
+                clsname,
+                name,
+                ref_clsname,
+                (
+                    ", ".join(
+                        f"`{key}` is annotated as `{inspect.formatannotation(hint)}` instead of `{inspect.formatannotation(ref_hint)}`"
+                        for key, hint, ref_hint in mismatches
+                    ),
+                ),
+                qualname=qualname,
+            ),
+            raise_on_violation=raise_on_violation,
+        )
+
+
+def check_hints_compatible(hint: Any, ref_hint: Any, covariant: bool = False) -> bool:
+    """
+    Check whether a type hint is compatible with some reference type hint.
+
+    Hints are compatible if they are equal, if either is `typing.Any`, or if
+    both are classes and the hint is a subclass (if `covariant`, as for
+    return values) or superclass (otherwise, as for parameters) of the
+    reference hint. More sophisticated checks are left to static type checkers.
+
+    Args:
+        hint: The type hint of the member being checked.
+        ref_hint: The type hint of the reference member.
+        covariant: Whether the hint may be narrower than the reference hint
+            (rather than broader).
+    """
+    if hint is Any or ref_hint is Any:
+        return True
+    try:
+        if hint == ref_hint:
+            return True
+    except Exception:  # pragma: no cover
+        return False
+    if isinstance(hint, type) and isinstance(ref_hint, type):
+        return issubclass(hint, ref_hint) if covariant else issubclass(ref_hint, hint)
+    return False
+
+
 def verify_not_overridden(
     name: str,
     clsname: str,
     member: object,
     raise_on_violation: bool = False,
+    qualname: str | None = None,
 ) -> None:
     """
     Verify that a nominated member is *not* an override.
@@ -158,9 +463,86 @@ def verify_not_overridden(
         member: The class member to check for conformance against ref_member.
         raise_on_violation: Whether any non-conformance should cause an
             exception to be raised. (default: False)
+        qualname: The qualified name (including the module) of the class
+            parent of the checked member, used to deduplicate reported
+            violations. (default: `clsname`)
     """
     if has_explicit_override(member):
         report_violation(
-            f"`{clsname}.{name}` claims to override interface method, but no such method exists.",
+            Violation(UNKNOWN_OVERRIDE, clsname, name, qualname=qualname),
             raise_on_violation=raise_on_violation,
         )
+
+
+# Deferred conformance checking
+
+_PENDING_ATTR = "__interface_pending__"
+_PENDING_CHECKS: weakref.WeakSet[type] = weakref.WeakSet()
+# Serialises deferred checks, so that classes instantiated concurrently for the
+# first time are verified exactly once (and before any instance is created).
+_PENDING_LOCK = threading.RLock()
+_MISSING = object()
+
+
+class _PendingChecks:
+    def __init__(self, verify: Callable[[], object], init: object) -> None:
+        self.verify = verify
+        self.init = init
+
+
+def defer_conformance(cls: type, verify: Callable[[], object]) -> None:
+    """
+    Defer conformance checking of `cls` until it is first instantiated.
+
+    This is achieved by temporarily installing an `__init__` method on `cls`
+    that runs all pending checks for the classes in the MRO of the instance,
+    restores the original `__init__` methods, and then initialises the
+    instance as usual. Once verified, instantiation incurs no additional
+    overhead.
+
+    Args:
+        cls: The class for which conformance checking should be deferred.
+        verify: A callback that performs the conformance checks for `cls`.
+    """
+
+    init = inspect.getattr_static(cls, "__init__")
+
+    @functools.wraps(init)
+    def __init__(self: Any, *args: Any, **kwargs: Any) -> None:
+        verify_pending(type(self))
+        init(self, *args, **kwargs)
+
+    with _PENDING_LOCK:
+        setattr(cls, _PENDING_ATTR, _PendingChecks(verify, cls.__dict__.get("__init__", _MISSING)))
+        type.__setattr__(cls, "__init__", __init__)
+        _PENDING_CHECKS.add(cls)
+
+
+def verify_pending(cls: type | None = None) -> None:
+    """
+    Run any conformance checks deferred by `defer_conformance`.
+
+    Args:
+        cls: The class for which pending checks should be run (along with
+            those of all classes in its MRO). If not specified, all pending
+            checks are run.
+    """
+    with _PENDING_LOCK:
+        for klass in list(_PENDING_CHECKS) if cls is None else reversed(cls.__mro__):
+            pending = klass.__dict__.get(_PENDING_ATTR)
+            if not isinstance(pending, _PendingChecks):
+                continue
+            pending.verify()  # If this raises, checks remain pending.
+            _PENDING_CHECKS.discard(klass)
+            delattr(klass, _PENDING_ATTR)
+            if pending.init is _MISSING:
+                type.__delattr__(klass, "__init__")
+            else:
+                type.__setattr__(klass, "__init__", pending.init)
+
+
+def has_pending_conformance(cls: type) -> bool:
+    """
+    Check whether `cls` has conformance checks that have yet to be run.
+    """
+    return isinstance(cls.__dict__.get(_PENDING_ATTR), _PendingChecks)
@@ -0,0 +1,257 @@
+"""
+Precompiled documentation caches.
+
+Rendering documentation for large interface hierarchies at import time can be
+expensive when repeated across many processes. This module allows the
+rendered documentation to be written to a cache file once (typically at
+build or deployment time), and then installed directly by `InterfaceMeta`
+at runtime. Cached entries are keyed by the module and qualified name of each
+class, along with a hash of the source files of all of the modules defining
+the classes in its MRO; if any of these change, the documentation is rendered
+live as usual.
+
+The cache is stored as a SQLite database, which is opened read-only and
+memory-mapped, so that lookups do not require loading the entire cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import os
+import sys
+import threading
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .inspection import functional_hasattr, get_functional_docs, has_updatable_docs
+
+if TYPE_CHECKING:
+    import sqlite3
+
+ENVIRON_VAR = "INTERFACE_META_DOC_CACHE"
+
+_SCHEMA = """
+CREATE TABLE docs (
+    module TEXT NOT NULL,
+    qualname TEXT NOT NULL,
+    source_hash TEXT NOT NULL,
+    class_doc TEXT,
+    member_docs TEXT NOT NULL,
+    PRIMARY KEY (module, qualname)
+) WITHOUT ROWID
+"""
+
+
+class CachedDocs(NamedTuple):
+    class_doc: str | None
+    member_docs: dict[str, str | None]
+
+
+class DocCache:
+    """
+    A read-only view of a documentation cache file.
+
+    Args:
+        path: The path of the cache file (as written by `build_doc_cache`).
+        mmap_size: The maximum number of bytes of the cache file to
+            memory-map.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], mmap_size: int = 256 * 1024 * 1024) -> None:
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+        self._connection = self._connect(mmap_size)
+        self._lock = threading.Lock()
+
+    def _connect(self, mmap_size: int) -> sqlite3.Connection:
+        # `sqlite3` is imported lazily, since it is comparatively expensive to
+        # import (and may not be available at all).
+        import sqlite3
+
+        connection = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False)
+        connection.execute(f"PRAGMA mmap_size = {int(mmap_size)}")
+        return connection
+
+    def lookup(self, module: str, qualname: str, source_hash: str) -> CachedDocs | None:
+        """
+        Look up the cached documentation for a class.
+
+        Args:
+            module: The name of the module in which the class is defined.
+            qualname: The qualified name of the class.
+            source_hash: The source hash of the class (see `get_source_hash`).
+
+        Returns:
+            The cached documentation, or `None` if there is no entry for the
+                class or if its source hash does not match.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT class_doc, member_docs FROM docs WHERE module = ? AND qualname = ? AND source_hash = ?",
+                (module, qualname, source_hash),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return CachedDocs(row[0], json.loads(row[1]))
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+_DOC_CACHE: DocCache | None = None
+_MODULE_HASHES: dict[str, str | None] = {}
+
+
+def load_doc_cache(path: str | os.PathLike[str] | None) -> DocCache | None:
+    """
+    Load a documentation cache for use by `InterfaceMeta` in this process.
+
+    This should be called before importing the classes whose documentation is
+    cached. A cache is also loaded automatically from the path nominated by
+    the `INTERFACE_META_DOC_CACHE` environment variable, if set.
+
+    Args:
+        path: The path of the cache file, or `None` to unload any loaded cache.
+
+    Returns:
+        The loaded cache (if any).
+    """
+    global _DOC_CACHE
+    if _DOC_CACHE is not None:
+        _DOC_CACHE.close()
+    _DOC_CACHE = DocCache(path) if path is not None else None
+    return _DOC_CACHE
+
+
+def get_cached_docs(cls: type) -> CachedDocs | None:
+    """
+    Return the cached documentation for `cls` from the loaded cache, if any.
+    """
+    if _DOC_CACHE is None or "<locals>" in cls.__qualname__:
+        return None
+    source_hash = get_source_hash(cls)
+    if source_hash is None:
+        return None
+    return _DOC_CACHE.lookup(cls.__module__, cls.__qualname__, source_hash)
+
+
+def get_source_hash(cls: type) -> str | None:
+    """
+    Compute a hash of the source files of the modules defining `cls` and the
+    classes in its MRO.
+
+    Returns:
+        The hash, or `None` if the source of any of these modules is not
+            available.
+    """
+    hashes = set()
+    for klass in cls.__mro__:
+        if klass.__module__ == "builtins":
+            continue
+        module_hash = _get_module_hash(klass.__module__)
+        if module_hash is None:
+            return None
+        hashes.add(module_hash)
+    return hashlib.blake2b("".join(sorted(hashes)).encode(), digest_size=16).hexdigest()
+
+
+def _get_module_hash(name: str) -> str | None:
+    if name not in _MODULE_HASHES:
+        module = sys.modules.get(name)
+        origin = getattr(getattr(module, "__spec__", None), "origin", None)
+        try:
+            with open(origin, "rb") as f:  # type: ignore[arg-type]
+                _MODULE_HASHES[name] = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+        except (OSError, TypeError):
+            _MODULE_HASHES[name] = None
+    return _MODULE_HASHES[name]
+
+
+def build_doc_cache(packages: Iterable[str], path: str | os.PathLike[str]) -> int:
+    """
+    Import the nominated packages (and all of their submodules), and write the
+    rendered documentation of all `InterfaceMeta` classes defined within them
+    to a cache file.
+
+    Args:
+        packages: The names of the packages (or modules) to import.
+        path: The path of the cache file to write (any existing file is
+            replaced).
+
+    Returns:
+        The number of classes written to the cache.
+    """
+    import sqlite3
+
+    from ..interface import InterfaceMeta
+
+    if InterfaceMeta.is_production_mode():
+        raise RuntimeError("Documentation caches cannot be built in production mode.")
+
+    packages = list(packages)
+    for module in _walk_modules(packages):
+        importlib.import_module(module)
+    InterfaceMeta.render_docs()
+
+    path = Path(path)
+    if path.exists():
+        path.unlink()
+    connection = sqlite3.connect(path)
+    try:
+        connection.execute(_SCHEMA)
+        rows = [row for row in (_get_cache_row(cls) for cls in _iter_interface_classes(packages)) if row is not None]
+        connection.executemany("INSERT OR REPLACE INTO docs VALUES (?, ?, ?, ?, ?)", rows)
+        connection.commit()
+    finally:
+        connection.close()
+    return len(rows)
+
+
+def _walk_modules(packages: Iterable[str]) -> Iterator[str]:
+    import pkgutil
+
+    for package in packages:
+        yield package
+        module = importlib.import_module(package)
+        if hasattr(module, "__path__"):
+            for info in pkgutil.walk_packages(module.__path__, prefix=f"{package}."):
+                yield info.name
+
+
+def _iter_interface_classes(packages: list[str]) -> Iterator[type]:
+    from ..interface import InterfaceMeta
+
+    seen: set[type] = set()
+    stack: list[type] = [
+        obj for module in list(sys.modules.values()) for obj in list(getattr(module, "__dict__", {}).values()) if isinstance(obj, InterfaceMeta)
+    ]
+    while stack:
+        cls = stack.pop()
+        if cls in seen:
+            continue
+        seen.add(cls)
+        stack.extend(type.__subclasses__(cls))
+        if any(cls.__module__ == package or cls.__module__.startswith(f"{package}.") for package in packages):
+            yield cls
+
+
+def _get_cache_row(cls: type) -> tuple[Any, ...] | None:
+    source_hash = get_source_hash(cls)
+    if source_hash is None or "<locals>" in cls.__qualname__:
+        return None
+    member_docs = {
+        name: get_functional_docs(member, orig=False)
+        for name, member in cls.__dict__.items()
+        if has_updatable_docs(member) and functional_hasattr(member, "__doc_orig__")
+    }
+    return (cls.__module__, cls.__qualname__, source_hash, cls.__doc__, json.dumps(member_docs))
+
+
+if os.environ.get(ENVIRON_VAR):
+    load_doc_cache(os.environ[ENVIRON_VAR])
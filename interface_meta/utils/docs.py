@@ -1,11 +1,22 @@
+import functools
 import inspect
+import os
+import sys
 import textwrap
-from typing import Any
+import threading
+import types
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Mapping
+from typing import TYPE_CHECKING, Any, NamedTuple
 
+from .caching import WeakLRUCache
 from .inspection import (
+    _get_member,
     get_class_attr_docs,
     get_functional_docs,
     get_functional_wrapper,
+    get_metadata,
     get_quirk_docs_method,
     get_quirk_docs_mro,
     has_class_attr_docs,
@@ -13,7 +24,17 @@ from .inspection import (
     has_quirk_docs_mro,
     has_updatable_docs,
     set_functional_docs,
+    set_shared_member,
 )
+from .members import IGNORED_NAMES, MemberOrigin, get_member_index
+
+if TYPE_CHECKING:
+    from .doc_cache import CachedDocs
+
+# Documentation caches are only imported (along with `sqlite3`) if one is
+# nominated via the environment, or loaded using `doc_cache.load_doc_cache`.
+if os.environ.get("INTERFACE_META_DOC_CACHE"):
+    from . import doc_cache  # noqa: F401
 
 
 def update_docs(
@@ -22,7 +43,7 @@ def update_docs(
     bases: tuple[type, ...],
     dct: dict[str, Any],
     skipped_names: set[str] | None = None,
-) -> None:
+) -> int:
     """
     Update the documentation on class members with information from parents.
 
@@ -36,12 +57,21 @@ def update_docs(
         bases: The bases of the class being constructed.
         dct: The class dictionary being used to construct the class.
         skipped_names: Names for which to skip the documentation rewriting.
+
+    Returns:
+        The number of members whose documentation was updated.
     """
 
     mro = inspect.getmro(cls)
     mro = mro[: mro.index(cls.__interface__) + 1]  # type: ignore[attr-defined]
     skipped_names = skipped_names or set()
 
+    # Use precompiled documentation if available (see `utils.doc_cache`)
+    doc_cache = sys.modules.get(f"{__package__}.doc_cache")
+    cached = doc_cache.get_cached_docs(cls) if doc_cache is not None else None
+    if cached is not None:
+        return _apply_cached_docs(cls, mro, cached)
+
     # Handle module-level documentation
     module_docs: list[Any] = [cls.__doc__]
     for klass in mro:
@@ -49,19 +79,26 @@ def update_docs(
             module_docs.append(
                 [
                     "Attributes:" if klass is cls else f"Attributes inherited from {klass.__name__}:",
-                    inspect.cleandoc(get_class_attr_docs(klass) or ""),
+                    cleandoc(get_class_attr_docs(klass) or ""),
                 ]
             )
 
     cls.__doc__ = doc_join(*module_docs)
 
-    # Assemble class attribute names avoiding dunder methods
-    members: dict[str, Any] = {}
-    for klass in reversed(cls.mro()):
-        members.update({name: member for name, member in klass.__dict__.items() if not name.startswith("__") and not name.endswith("__")})
+    # Identify the members which may need their documentation updated
+    index = get_member_index(cls)
+    chains = get_doc_chains(cls)
+    names = _get_candidate_names(cls, index)
 
     # Handle function/method-level documentation
-    for name, member in members.items():
+    count = 0
+    quirked = set()
+    for name in names:
+        origin = index.get(name)
+        if origin is None or origin.annotation_only:
+            continue
+        member = origin.member
+
         # Check if there is anything to do
         if not has_updatable_docs(member):
             continue
@@ -70,6 +107,9 @@ def update_docs(
         quirks_mro = get_quirk_docs_mro(member)
         has_quirks_mro = has_quirk_docs_mro(member)
 
+        if quirks_method is not None:
+            quirked.add(name)
+
         if (
             inspect.isabstract(member)
             or has_forced_override(member)
@@ -78,40 +118,425 @@ def update_docs(
         ):
             continue
 
-        # Extract documentation from this member and the quirks member
+        # Extract documentation from this member and the quirks member. The
+        # first class considered (the interface when `quirks_mro` is True,
+        # otherwise this class) always contributes documentation.
+        chain = chains.get(name, ())
+        if not quirks_mro:
+            chain = chain[-1:] if chain and chain[-1][0] is cls else ()
+        first = mro[-1] if quirks_mro else cls
         method_docs: dict[str, str | None] = {}
         last_docs: str | None = None
-        for i, klass in enumerate(reversed(mro) if quirks_mro else mro[:1]):
-            klass_member = klass.__dict__.get(name, None)
-            if klass_member is not None:
-                member_docs = get_functional_docs(klass_member)
-                if (i == 0 or member_docs) and member_docs != last_docs:
-                    last_docs = method_docs[klass.__name__] = member_docs
-                if not get_quirk_docs_mro(klass_member):
-                    break
-
-        if quirks_method is not None and quirks_method in members:
-            quirk_member = members.get(quirks_method)
-            quirk_member_docs = get_functional_docs(quirk_member)
+        for klass, klass_member in chain:
+            member_docs = get_functional_docs(klass_member)
+            if (klass is first or member_docs) and member_docs != last_docs:
+                last_docs = method_docs[klass.__name__] = member_docs
+            if not get_quirk_docs_mro(klass_member):
+                break
+
+        quirk_origin = (
+            index.get(quirks_method) if quirks_method is not None and not quirks_method.startswith("__") and not quirks_method.endswith("__") else None
+        )
+        if quirk_origin is not None and not quirk_origin.annotation_only:
+            quirk_member_docs = get_functional_docs(quirk_origin.member)
             if quirk_member_docs:
                 if cls.__name__ in method_docs:
-                    method_docs[cls.__name__] = inspect.cleandoc(method_docs[cls.__name__] or "") + "\n\n" + inspect.cleandoc(quirk_member_docs)
+                    method_docs[cls.__name__] = cleandoc(method_docs[cls.__name__] or "") + "\n\n" + cleandoc(quirk_member_docs)
                 else:
                     method_docs[cls.__name__] = quirk_member_docs
 
         if method_docs:
-            if name not in cls.__dict__:
+            docs = intern_docs(doc_join(*[docs if i == 0 else [source + " Quirks:", docs] for i, (source, docs) in enumerate(method_docs.items())]))
+            if name in cls.__dict__:
+                documented = set_functional_docs(member, docs)
+                if documented is not member:  # Shared members are copied rather than mutated
+                    setattr(cls, name, documented)
+            else:
                 # Override method object with new object so we don't modify
                 # underlying method that may be shared by multiple classes.
-                member = get_functional_wrapper(member)
+                setattr(cls, name, get_documented_wrapper(member, docs))
+            count += 1
 
-            set_functional_docs(
-                member,
-                doc_join(*[docs if i == 0 else [source + " Quirks:", docs] for i, (source, docs) in enumerate(method_docs.items())]),
-            )
+    _store_doc_state(cls, mro, quirked)
+    return count
+
+
+def _apply_cached_docs(cls: type, mro: tuple[type, ...], cached: "CachedDocs") -> int:
+    cls.__doc__ = cached.class_doc
+    index = get_member_index(cls)
+    for name, docs in cached.member_docs.items():
+        member = cls.__dict__.get(name)
+        if member is not None:
+            documented = set_functional_docs(member, intern_docs(docs))
+            if documented is not member:
+                setattr(cls, name, documented)
+            continue
+        origin = index.get(name)
+        if origin is None or origin.annotation_only:  # pragma: no cover
+            continue
+        setattr(cls, name, get_documented_wrapper(origin.member, intern_docs(docs)))
+    quirked = set()
+    for name in _get_candidate_names(cls, index):
+        origin = index.get(name)
+        if origin is None or origin.annotation_only or not has_updatable_docs(origin.member):
+            continue
+        if get_quirk_docs_method(origin.member) is not None:
+            quirked.add(name)
+    _store_doc_state(cls, mro, quirked)
+    return len(cached.member_docs)
+
+
+def _get_candidate_names(cls: type, index: Mapping[str, MemberOrigin]) -> list[str]:
+    # The members which may need their documentation updated: those defined on
+    # this class, and those inherited with quirks documentation provided by
+    # another method (avoiding dunder methods).
+    names = [name for name in cls.__dict__ if name not in IGNORED_NAMES and not name.startswith("__") and not name.endswith("__")]
+    names.extend(name for name in _get_inherited_quirked_names(cls, index) if name not in cls.__dict__)
+    return names
+
+
+def _store_doc_state(cls: type, mro: tuple[type, ...], quirked: set[str]) -> None:
+    # Store the documentation chains (including any newly added members) and
+    # the names of members with quirks documentation for reuse by subclasses.
+    setattr(cls, DOC_CHAINS_ATTR, _build_doc_chains(cls, mro))
+    setattr(cls, QUIRKED_NAMES_ATTR, frozenset(quirked))
+
+
+DOC_CHAINS_ATTR = "__interface_doc_chains__"
+QUIRKED_NAMES_ATTR = "__interface_quirked_names__"
+
+DocChain = tuple[tuple[type, object], ...]
+
+
+def get_doc_chains(cls: type) -> Mapping[str, DocChain]:
+    """
+    Return the documentation chains of the members of `cls`.
+
+    For each member name, the documentation chain is the sequence of
+    `(klass, member)` pairs for every class in the MRO of `cls` (from its
+    interface down to `cls` itself) that defines that name. Chains computed
+    when rendering the documentation of a class are stored on it, so that
+    its subclasses need only extend them with their own members.
+
+    Args:
+        cls: The `InterfaceMeta` class for which chains should be returned.
+
+    Returns:
+        A mapping from member names to documentation chains. This mapping
+            may be shared with other classes, and so must not be mutated.
+    """
+    chains = cls.__dict__.get(DOC_CHAINS_ATTR)
+    if chains is not None:
+        return chains  # type: ignore[no-any-return]
+    mro = inspect.getmro(cls)
+    return _build_doc_chains(cls, mro[: mro.index(cls.__interface__) + 1])  # type: ignore[attr-defined]
+
+
+def invalidate_doc_state(cls: type) -> None:
+    """
+    Invalidate the documentation chains and quirked member names stored on
+    `cls` and its subclasses, after a member has been added to, replaced on,
+    or removed from `cls`.
+
+    Invalidated state is recomputed when the documentation of a subclass is
+    next rendered.
+
+    Args:
+        cls: The class whose members have changed.
+    """
+    queue = [cls]
+    seen = set()
+    while queue:
+        klass = queue.pop()
+        if klass in seen:
+            continue
+        seen.add(klass)
+        for attr in (DOC_CHAINS_ATTR, QUIRKED_NAMES_ATTR):
+            if klass.__dict__.get(attr) is not None:
+                type.__setattr__(klass, attr, None)
+        queue.extend(type.__subclasses__(klass))
+
+
+def _get_inherited_quirked_names(cls: type, index: Mapping[str, MemberOrigin]) -> Collection[str]:
+    # The names of inherited members that nominate another method from
+    # which to extract quirks documentation.
+    bases = cls.__bases__
+    if len(bases) == 1 and bases[0].__dict__.get(QUIRKED_NAMES_ATTR) is not None:
+        return bases[0].__dict__[QUIRKED_NAMES_ATTR]  # type: ignore[no-any-return]
+    return [
+        name
+        for name, origin in index.items()
+        if origin.owner is not cls and not origin.annotation_only and has_updatable_docs(origin.member) and get_quirk_docs_method(origin.member) is not None
+    ]
+
+
+def _build_doc_chains(cls: type, mro: tuple[type, ...]) -> Mapping[str, DocChain]:
+    bases = cls.__bases__
+    inherited: Mapping[str, DocChain]
+    if len(mro) == 1:
+        inherited = {}
+    elif len(bases) == 1 and bases[0] is mro[1]:
+        inherited = get_doc_chains(bases[0])
+    else:
+        inherited = {}
+        for klass in reversed(mro[1:]):
+            inherited = _extend_doc_chains(inherited, klass)
+    return _extend_doc_chains(inherited, cls)
+
+
+def _extend_doc_chains(chains: Mapping[str, DocChain], cls: type) -> Mapping[str, DocChain]:
+    own = {
+        name: (*chains.get(name, ()), (cls, member))
+        for name, member in cls.__dict__.items()
+        if member is not None and name not in IGNORED_NAMES and not name.startswith("__") and not name.endswith("__")
+    }
+    return {**chains, **own} if own else chains
+
+
+class LazyDocs:
+    """
+    A stand-in for the `__doc__` attribute of a class whose documentation has
+    not yet been rendered.
+
+    The first time `__doc__` is read on the class (or one of its instances),
+    the documentation of the class and its members (along with that of any
+    bases whose rendering is also pending) is rendered using the nominated
+    callbacks, and the rendered class docstring is returned.
+
+    Args:
+        cls: The class whose documentation rendering has been deferred.
+        render: A callback that renders the documentation of `cls`.
+    """
+
+    def __init__(self, cls: type, render: Callable[[], None]) -> None:
+        self.cls = weakref.ref(cls)
+        self.doc = cls.__dict__.get("__doc__")
+        self.render = render
+
+    def __get__(self, instance: object, owner: type | None = None) -> str | None:
+        cls = self.cls()
+        if cls is None:  # pragma: no cover
+            return self.doc
+        # Render bases first, so that inherited members are documented too
+        for klass in reversed(inspect.getmro(cls)):
+            if isinstance(klass.__dict__.get("__doc__"), LazyDocs):
+                render_docs(klass)
+        return cls.__doc__
+
+
+class ClassDocs:
+    """
+    A data descriptor for the `__doc__` attribute of metaclasses (such as
+    `InterfaceMeta`) that resolves `LazyDocs` instances.
+
+    Since it is a data descriptor on the metaclass, it takes precedence over
+    the `__doc__` entry in the class dictionary even for lookups which would
+    otherwise bypass the descriptor protocol (such as `pydoc`'s use of
+    `object.__getattribute__`). It is installed on the metaclass of a class
+    by `defer_docs`, and so costs nothing unless documentation is deferred.
+
+    Args:
+        doc: The docstring of the metaclass itself.
+    """
+
+    def __init__(self, doc: str | None) -> None:
+        self.doc = doc
+
+    def __get__(self, cls: type | None, mcls: type | None = None) -> str | None:
+        if cls is None:
+            return self.doc
+        return _TYPE_DOC.__get__(cls, type(cls))  # type: ignore[no-any-return]
+
+    def __set__(self, cls: type, value: str | None) -> None:
+        _TYPE_DOC.__set__(cls, value)
 
-            if name not in cls.__dict__:
-                setattr(cls, name, member)
+
+_TYPE_DOC: Any = type.__dict__["__doc__"]
+_PENDING_DOCS: weakref.WeakSet[type] = weakref.WeakSet()
+# Serialises rendering of deferred documentation, so that concurrent readers
+# of `__doc__` never observe partially rendered documentation.
+_PENDING_DOCS_LOCK = threading.RLock()
+
+
+def defer_docs(cls: type, render: Callable[[], None]) -> None:
+    """
+    Defer rendering of the documentation of `cls` until it is first needed.
+
+    Documentation is rendered the first time that `__doc__` is read on the
+    class or one of its subclasses (as by `help()` and documentation
+    generators), or when `render_docs` is called. Looking up members (e.g.
+    `cls.method.__doc__`) does not trigger rendering, so that attribute
+    lookups on classes incur no overhead.
+
+    Args:
+        cls: The class for which to defer documentation rendering.
+        render: A callback that renders the documentation of `cls` (typically
+            by calling `update_docs`).
+    """
+    with _PENDING_DOCS_LOCK:
+        type.__setattr__(cls, "__doc__", LazyDocs(cls, render))
+        _PENDING_DOCS.add(cls)
+        mcls = type(cls)
+        if not isinstance(mcls.__dict__.get("__doc__"), ClassDocs):
+            type.__setattr__(mcls, "__doc__", ClassDocs(mcls.__dict__.get("__doc__")))
+
+
+def render_docs(cls: type | None = None) -> None:
+    """
+    Render any deferred documentation.
+
+    Args:
+        cls: The class for which documentation should be rendered. If not
+            specified, the documentation of all classes with deferred
+            documentation is rendered.
+    """
+    with _PENDING_DOCS_LOCK:
+        if cls is None:
+            for klass in list(_PENDING_DOCS):
+                render_docs(klass)
+            return
+        _PENDING_DOCS.discard(cls)
+        lazy = cls.__dict__.get("__doc__")
+        if isinstance(lazy, LazyDocs):
+            type.__setattr__(cls, "__doc__", lazy.doc)
+            lazy.render()
+
+
+# Deduplication of rendered documentation
+#
+# Sibling implementations that inherit a quirks-documented method typically
+# render byte-identical documentation for it. Rendered docstrings are therefore
+# interned in a shared (bounded) table, and the wrappers carrying them are
+# reused across classes when both their documentation and metadata match.
+
+
+class DedupInfo(NamedTuple):
+    """
+    Statistics about the deduplication of rendered documentation.
+
+    Attributes:
+        docs_interned: The number of distinct docstrings in the intern table.
+        docs_reused: The number of rendered docstrings replaced by an
+            identical docstring from the intern table.
+        wrappers_created: The number of documented wrappers created.
+        wrappers_reused: The number of documented wrappers reused by another
+            class.
+        bytes_saved: The (approximate) number of bytes of memory saved by not
+            retaining duplicate docstrings and wrappers.
+    """
+
+    docs_interned: int
+    docs_reused: int
+    wrappers_created: int
+    wrappers_reused: int
+    bytes_saved: int
+
+
+_INTERNED_DOCS: OrderedDict[str, str] = OrderedDict()
+_INTERNED_DOCS_MAXSIZE = 4096
+_DEDUP_LOCK = threading.Lock()
+# Statistics are updated without locking, and so are approximate under
+# concurrent use.
+_DEDUP_COUNTS = {"docs_reused": 0, "wrappers_created": 0, "wrappers_reused": 0, "bytes_saved": 0}
+
+# Documented wrappers, keyed by the function they wrap, and then by their type,
+# documentation and interface metadata.
+WRAPPER_CACHE: WeakLRUCache[dict[tuple[Any, ...], object]] = WeakLRUCache(maxsize=4096)
+
+# The types of members whose wrappers are determined entirely by the function
+# they wrap (and so can be shared by classes).
+_SHAREABLE_WRAPPER_TYPES = frozenset({types.FunctionType, classmethod, staticmethod})
+
+
+def intern_docs(docs: str | None) -> str | None:
+    """
+    Return the interned copy of a rendered docstring.
+
+    Args:
+        docs: The rendered docstring.
+
+    Returns:
+        An identical docstring from the intern table (if present), or else
+            `docs` (which is added to the table).
+    """
+    if docs is None:
+        return None
+    # Lookups are lock-free; only insertions (and evictions) are serialised.
+    interned = _INTERNED_DOCS.get(docs)
+    if interned is None:
+        with _DEDUP_LOCK:
+            interned = _INTERNED_DOCS.setdefault(docs, docs)
+            if len(_INTERNED_DOCS) > _INTERNED_DOCS_MAXSIZE:
+                _INTERNED_DOCS.popitem(last=False)
+        if interned is docs:
+            return docs
+    try:
+        _INTERNED_DOCS.move_to_end(docs)
+    except KeyError:  # pragma: no cover; evicted concurrently
+        pass
+    if interned is not docs:
+        _DEDUP_COUNTS["docs_reused"] += 1
+        _DEDUP_COUNTS["bytes_saved"] += sys.getsizeof(docs)
+    return interned
+
+
+def get_documented_wrapper(member: object, docs: str | None) -> object:
+    """
+    Return a wrapper around `member` (see `get_functional_wrapper`) that
+    carries the nominated documentation.
+
+    Wrappers of functions, class methods and static methods are reused for
+    identical (ideally interned) documentation and metadata, and so may be
+    shared by multiple classes. Such wrappers are marked as shared (see
+    `is_shared_member`), so that `update_metadata` and `set_functional_docs`
+    copy rather than mutate them. Other direct mutations (e.g. assigning
+    `Sibling.method.__doc__`) affect all classes sharing the wrapper; assign a
+    new member to the class instead.
+
+    Args:
+        member: The member to wrap.
+        docs: The documentation of the wrapper.
+    """
+    function = _get_member(member)
+    key = (type(member), docs, get_metadata(function)) if type(member) in _SHAREABLE_WRAPPER_TYPES else None
+
+    if key is not None:
+        wrappers = WRAPPER_CACHE.get(function)
+        wrapper = wrappers.get(key) if wrappers is not None else None
+        if wrapper is not None:
+            _DEDUP_COUNTS["wrappers_reused"] += 1
+            _DEDUP_COUNTS["bytes_saved"] += _get_wrapper_size(wrapper)
+            return wrapper
+
+    wrapper = get_functional_wrapper(member)
+    set_functional_docs(wrapper, docs)
+    if key is not None:
+        set_shared_member(wrapper)
+    _DEDUP_COUNTS["wrappers_created"] += 1
+
+    if key is not None:
+        wrappers = WRAPPER_CACHE.get(function)
+        if wrappers is None:
+            wrappers = {}
+            WRAPPER_CACHE.set(function, wrappers)
+        wrapper = wrappers.setdefault(key, wrapper)
+    return wrapper
+
+
+def _get_wrapper_size(wrapper: object) -> int:
+    function = _get_member(wrapper)
+    size = sys.getsizeof(function) + sys.getsizeof(getattr(function, "__dict__", None))
+    if function is not wrapper:
+        size += sys.getsizeof(wrapper)
+    return size
+
+
+def dedup_info() -> DedupInfo:
+    """
+    Return statistics about the deduplication of rendered documentation.
+    """
+    with _DEDUP_LOCK:
+        return DedupInfo(docs_interned=len(_INTERNED_DOCS), **_DEDUP_COUNTS)
 
 
 def doc_join(*docs: Any) -> str | None:
@@ -132,7 +557,7 @@ def doc_join(*docs: Any) -> str | None:
         if doc in (None, ""):
             continue
         elif isinstance(doc, str):
-            out.append(textwrap.dedent(doc).strip("\n"))
+            out.append(_dedent(doc))
         elif isinstance(doc, (list, tuple)):
             if len(doc) < 2:
                 continue
@@ -140,12 +565,51 @@ def doc_join(*docs: Any) -> str | None:
             if d:
                 if not out:
                     out.append("\n")
-                out.append(
-                    "{header}\n{body}".format(
-                        header=doc[0].strip(),
-                        body="    " + d.replace("\n", "\n    "),
-                    )
-                )
+                out.append(_render_section(doc[0], d))
         else:
             raise ValueError(f"Unrecognised doc format: {type(doc)}")
     return "\n\n".join(out) or None
+
+
+# Docstrings are typically shared by many classes (e.g. the documentation of
+# interface methods is included in that of every implementation), and so the
+# results of cleaning and indenting them are cached. Since these caches are
+# keyed by the docstrings themselves, changes to documentation are never
+# served stale results.
+
+
+@functools.lru_cache(maxsize=4096)
+def cleandoc(doc: str) -> str:
+    """
+    A cached version of `inspect.cleandoc`.
+    """
+    return inspect.cleandoc(doc)
+
+
+@functools.lru_cache(maxsize=4096)
+def _dedent(doc: str) -> str:
+    return textwrap.dedent(doc).strip("\n")
+
+
+@functools.lru_cache(maxsize=4096)
+def _render_section(header: str, body: str) -> str:
+    return "{header}\n{body}".format(
+        header=header.strip(),
+        body="    " + body.replace("\n", "\n    "),
+    )
+
+
+def clear_docs_cache() -> None:
+    """
+    Clear the caches of cleaned docstrings and rendered documentation
+    sections, along with the tables (and statistics) used to deduplicate
+    rendered documentation.
+    """
+    cleandoc.cache_clear()
+    _dedent.cache_clear()
+    _render_section.cache_clear()
+    WRAPPER_CACHE.clear()
+    with _DEDUP_LOCK:
+        _INTERNED_DOCS.clear()
+        for key in _DEDUP_COUNTS:
+            _DEDUP_COUNTS[key] = 0
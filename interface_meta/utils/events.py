@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+# Event names
+CLASS_CREATED = "class_created"
+MEMBER_VERIFIED = "member_verified"
+VIOLATION = "violation"
+DOCS_RENDERED = "docs_rendered"
+REGISTERED = "registered"
+
+EVENTS = frozenset({CLASS_CREATED, MEMBER_VERIFIED, VIOLATION, DOCS_RENDERED, REGISTERED})
+
+
+@dataclass(frozen=True)
+class InterfaceEvent:
+    """
+    An event emitted by `InterfaceMeta` during class creation.
+
+    Attributes:
+        event: The name of the event (one of `EVENTS`).
+        cls: The class being created (if known).
+        duration: The time spent in the phase being reported (in seconds).
+        count: The number of items processed in the phase (e.g. the number of
+            members verified, or the number of docstrings rendered).
+        details: Additional event-specific details (e.g. per-phase timings
+            for `CLASS_CREATED` events, or the member name for
+            `MEMBER_VERIFIED` events).
+    """
+
+    event: str
+    cls: type | None = None
+    duration: float = 0.0
+    count: int = 0
+    details: Mapping[str, Any] = field(default_factory=dict)
+
+
+EventCallback = Callable[[InterfaceEvent], None]
+
+# Subscribers are stored in immutable tuples that are replaced (rather than
+# mutated) on (un)subscription, so that emitting events never needs a lock.
+_SUBSCRIBERS: dict[str, tuple[EventCallback, ...]] = {}
+_SUBSCRIBERS_LOCK = threading.Lock()
+
+
+def subscribe(event: str, callback: EventCallback) -> None:
+    """
+    Subscribe to events emitted by `InterfaceMeta`.
+
+    Args:
+        event: The name of the event to subscribe to (one of `EVENTS`).
+        callback: A callable that will be passed an `InterfaceEvent` instance
+            each time the event is emitted.
+    """
+    if event not in EVENTS:
+        raise ValueError(f"Unknown event `{event}`. Valid events are: {sorted(EVENTS)}.")
+    with _SUBSCRIBERS_LOCK:
+        _SUBSCRIBERS[event] = (*_SUBSCRIBERS.get(event, ()), callback)
+
+
+def unsubscribe(event: str, callback: EventCallback) -> None:
+    """
+    Unsubscribe a callback previously passed to `subscribe`.
+
+    Args:
+        event: The name of the event to unsubscribe from.
+        callback: The callback to remove.
+    """
+    with _SUBSCRIBERS_LOCK:
+        callbacks = tuple(c for c in _SUBSCRIBERS.get(event, ()) if c != callback)
+        if callbacks:
+            _SUBSCRIBERS[event] = callbacks
+        else:
+            _SUBSCRIBERS.pop(event, None)
+
+
+def has_subscribers(event: str | None = None) -> bool:
+    """
+    Check whether there are any subscribers for `event` (or for any event if
+    `event` is not specified).
+    """
+    if event is None:
+        return bool(_SUBSCRIBERS)
+    return event in _SUBSCRIBERS
+
+
+def emit(
+    event: str,
+    cls: type | None = None,
+    duration: float = 0.0,
+    count: int = 0,
+    **details: Any,
+) -> None:
+    """
+    Emit an event to all of its subscribers (if any).
+
+    See `InterfaceEvent` for details about the arguments.
+    """
+    callbacks = _SUBSCRIBERS.get(event)
+    if not callbacks:
+        return
+    payload = InterfaceEvent(event, cls, duration, count, details)
+    for callback in callbacks:
+        callback(payload)
@@ -1,26 +1,165 @@
 from __future__ import annotations
 
+import copy
+import dataclasses
 import functools
 import inspect
+import threading
+import types
+import typing
+import weakref
+from collections.abc import Callable
 from inspect import signature
 from typing import Any, TypeVar, overload
 
+from .caching import _MISSING, WeakLRUCache
+
 _FuncT = TypeVar("_FuncT")
 
 # Abstract away differences between functions, methods and descriptors
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class MemberAdapter:
+    """
+    Describes how `InterfaceMeta` should interact with a type of class member.
+
+    Adapters are registered against member types (see
+    `register_member_adapter`), and are looked up using the type of each
+    member, so that functions, methods and descriptors can be handled
+    uniformly without repeatedly introspecting them.
+
+    Attributes:
+        unwrap: A callable that returns the function underlying a member
+            (on which documentation and interface metadata are stored).
+        rewrap: A callable that, given a member and a wrapper of its
+            underlying function, returns an equivalent member that uses the
+            wrapper instead.
+        signature: A callable that returns the signature of a member (if it
+            differs from that of its underlying function).
+        functional: Whether members act like methods (and so should have
+            their signatures checked for conformance).
+        documented: Whether the documentation of members can be updated.
+    """
+
+    unwrap: Callable[[Any], object]
+    rewrap: Callable[[Any, Any], object]
+    signature: Callable[[Any], inspect.Signature] | None = None
+    functional: bool = True
+    documented: bool = True
+
+
 def _get_member(member: object) -> object:
-    if inspect.ismethod(member):
-        return member.__func__
-    if inspect.isdatadescriptor(member) and isinstance(member, property):
-        return member.fget
-    if inspect.ismethoddescriptor(member):
-        if isinstance(member, classmethod):
-            return member.__get__(object, object).__func__
-        if isinstance(member, staticmethod):
-            return member.__get__(object, object)
-    return member
+    return get_member_adapter(member).unwrap(member)
+
+
+def _rewrap(member: object, wrapper: object) -> object:
+    return get_member_adapter(member).rewrap(member, wrapper)
+
+
+def _copy_cached_property(member: functools.cached_property[Any], wrapper: Any) -> functools.cached_property[Any]:
+    rewrapped = functools.cached_property(wrapper)
+    rewrapped.attrname = member.attrname
+    return rewrapped
+
+
+def _copy_singledispatchmethod(member: functools.singledispatchmethod[Any], wrapper: Any) -> functools.singledispatchmethod[Any]:
+    # The dispatcher (and hence all registered implementations) is shared
+    rewrapped = copy.copy(member)
+    func: Any = _rewrap(member.func, wrapper)
+    rewrapped.func = func
+    return rewrapped
+
+
+_DEFAULT_ADAPTER = MemberAdapter(
+    unwrap=lambda member: member,
+    rewrap=lambda member, wrapper: wrapper,
+    functional=False,
+    documented=False,
+)
+
+_MEMBER_ADAPTERS_LOCK = threading.Lock()
+# Adapters registered for member types (and the types that inherit them).
+_REGISTERED_ADAPTERS: dict[type, MemberAdapter] = {
+    types.FunctionType: MemberAdapter(
+        unwrap=lambda member: member,
+        rewrap=lambda member, wrapper: wrapper,
+    ),
+    types.MethodType: MemberAdapter(
+        unwrap=lambda member: member.__func__,
+        rewrap=lambda member, wrapper: types.MethodType(wrapper, member.__self__),
+        functional=False,
+        documented=False,
+    ),
+    classmethod: MemberAdapter(
+        unwrap=lambda member: member.__func__,
+        rewrap=lambda member, wrapper: classmethod(wrapper),
+    ),
+    staticmethod: MemberAdapter(
+        unwrap=lambda member: member.__func__,
+        rewrap=lambda member, wrapper: staticmethod(wrapper),
+    ),
+    property: MemberAdapter(
+        unwrap=lambda member: member.fget,
+        rewrap=lambda member, wrapper: property(fget=wrapper, fset=member.fset, fdel=member.fdel),
+        functional=False,
+    ),
+    functools.cached_property: MemberAdapter(
+        unwrap=lambda member: member.func,
+        rewrap=_copy_cached_property,
+        functional=False,
+    ),
+    functools.partialmethod: MemberAdapter(
+        unwrap=lambda member: _get_member(member.func),
+        rewrap=lambda member, wrapper: functools.partialmethod(_rewrap(member.func, wrapper), *member.args, **member.keywords),
+        signature=lambda member: signature(member.__get__(None, object)),
+        # The underlying function is typically also a member of the class
+        documented=False,
+    ),
+    functools.singledispatchmethod: MemberAdapter(
+        unwrap=lambda member: _get_member(member.func),
+        rewrap=_copy_singledispatchmethod,
+    ),
+}
+# The adapters resolved (via their MRO) for other types, held weakly so that
+# dynamically created types are not kept alive.
+_RESOLVED_ADAPTERS: weakref.WeakKeyDictionary[type, MemberAdapter] = weakref.WeakKeyDictionary()
+
+
+def get_member_adapter(member: object) -> MemberAdapter:
+    """
+    Return the adapter for `member`, as registered for its type (or the
+    nearest of its base classes).
+    """
+    member_type = type(member)
+    adapter = _REGISTERED_ADAPTERS.get(member_type) or _RESOLVED_ADAPTERS.get(member_type)
+    if adapter is None:
+        adapter = _resolve_member_adapter(member_type)
+    return adapter
+
+
+def _resolve_member_adapter(member_type: type) -> MemberAdapter:
+    adapters, resolved = _REGISTERED_ADAPTERS, _RESOLVED_ADAPTERS
+    adapter = next((adapters[base] for base in member_type.__mro__[1:] if base in adapters), _DEFAULT_ADAPTER)
+    resolved[member_type] = adapter
+    return adapter
+
+
+def register_member_adapter(member_type: type, adapter: MemberAdapter) -> None:
+    """
+    Register the adapter to use for members of type `member_type` (and its
+    subclasses), replacing any existing adapter for that type.
+
+    Args:
+        member_type: The type of class member (typically a descriptor type).
+        adapter: The adapter to use for members of that type.
+    """
+    global _REGISTERED_ADAPTERS, _RESOLVED_ADAPTERS
+    with _MEMBER_ADAPTERS_LOCK:
+        # The tables are replaced rather than mutated, so that lookups need
+        # not acquire the lock.
+        _REGISTERED_ADAPTERS = {**_REGISTERED_ADAPTERS, member_type: adapter}
+        _RESOLVED_ADAPTERS = weakref.WeakKeyDictionary()
 
 
 def is_method(member: object) -> bool:
@@ -33,7 +172,8 @@ def is_functional_member(member: object) -> bool:
 
     This can be true in two ways:
         - It is literally a Python function
-        - It is a method descriptor (wrapping a function)
+        - It is a method descriptor (wrapping a function), such as a
+          `classmethod`, `staticmethod` or `partialmethod`
 
     Args:
         member: An object in the class __dict__.
@@ -41,11 +181,193 @@ def is_functional_member(member: object) -> bool:
     Returns:
         `True` if the member is a function (or acts like one).
     """
-    return inspect.isfunction(member) or (inspect.ismethoddescriptor(member) and isinstance(member, (classmethod, staticmethod)))
+    return get_member_adapter(member).functional
+
+
+# Signatures of interface methods are compared against every implementation,
+# so they are computed once per underlying function and reused.
+SIGNATURE_CACHE: WeakLRUCache[inspect.Signature] = WeakLRUCache(maxsize=4096)
 
 
 def get_functional_signature(member: object) -> inspect.Signature:
-    return signature(_get_member(member))  # type: ignore[arg-type]
+    adapter = get_member_adapter(member)
+    if adapter.signature is not None:
+        sig = SIGNATURE_CACHE.get(member)
+        if sig is None:
+            sig = adapter.signature(member)
+            SIGNATURE_CACHE.set(member, sig)
+        return sig
+    function = adapter.unwrap(member)
+    sig = SIGNATURE_CACHE.get(function)
+    if sig is None:
+        sig = signature(function)  # type: ignore[arg-type]
+        SIGNATURE_CACHE.set(function, sig)
+    return sig
+
+
+# Signature fingerprints
+
+# The types of parameter defaults that are compared by value in fingerprints.
+# All other defaults are compared by identity (see `_DefaultRef`).
+_VALUE_DEFAULT_TYPES = frozenset({type(None), bool, int, float, complex, str, bytes})
+
+SignatureFingerprint = tuple[tuple[str, Any, Any], ...]
+
+
+class _DefaultRef:
+    """
+    A hashable reference to a parameter default, which is compared by identity.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: object) -> None:
+        self.value = value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _DefaultRef) and other.value is self.value
+
+    def __hash__(self) -> int:
+        return id(self.value)
+
+    def __repr__(self) -> str:
+        return f"_DefaultRef({self.value!r})"
+
+
+def get_signature_fingerprint(sig: inspect.Signature) -> SignatureFingerprint:
+    """
+    Compile a signature into a hashable fingerprint.
+
+    The fingerprint is a tuple of `(name, kind, default)` tuples, one for
+    each parameter, where defaults that are not simple values are wrapped in
+    a reference that is hashed and compared by identity. Annotations are not
+    included.
+
+    Args:
+        sig: The signature to compile.
+    """
+    return tuple((param.name, param.kind, _get_default_key(param.default)) for param in sig.parameters.values())
+
+
+def _get_default_key(default: object) -> object:
+    if default is _EMPTY or type(default) in _VALUE_DEFAULT_TYPES:
+        return default
+    return _DefaultRef(default)
+
+
+_EMPTY = inspect.Parameter.empty
+_POSITIONAL_ONLY = inspect.Parameter.POSITIONAL_ONLY
+_POSITIONAL_OR_KEYWORD = inspect.Parameter.POSITIONAL_OR_KEYWORD
+_VAR_POSITIONAL = inspect.Parameter.VAR_POSITIONAL
+_KEYWORD_ONLY = inspect.Parameter.KEYWORD_ONLY
+_VAR_KEYWORD = inspect.Parameter.VAR_KEYWORD
+
+
+def _get_code_fingerprint(function: types.FunctionType) -> SignatureFingerprint:
+    # Equivalent to `get_signature_fingerprint(signature(function))` for plain
+    # Python functions, but without the overhead of constructing a signature.
+    code = function.__code__
+    names = code.co_varnames
+    defaults = function.__defaults__ or ()
+    kwdefaults = function.__kwdefaults__ or {}
+    n_positional = code.co_argcount
+    n_keyword_only = code.co_kwonlyargcount
+    first_default = n_positional - len(defaults)
+
+    fingerprint: list[tuple[str, Any, Any]] = [
+        (
+            names[i],
+            _POSITIONAL_ONLY if i < code.co_posonlyargcount else _POSITIONAL_OR_KEYWORD,
+            _get_default_key(defaults[i - first_default]) if i >= first_default else _EMPTY,
+        )
+        for i in range(n_positional)
+    ]
+    index = n_positional + n_keyword_only
+    if code.co_flags & inspect.CO_VARARGS:
+        fingerprint.append((names[index], _VAR_POSITIONAL, _EMPTY))
+        index += 1
+    for name in names[n_positional : n_positional + n_keyword_only]:
+        fingerprint.append((name, _KEYWORD_ONLY, _get_default_key(kwdefaults.get(name, _EMPTY))))
+    if code.co_flags & inspect.CO_VARKEYWORDS:
+        fingerprint.append((names[index], _VAR_KEYWORD, _EMPTY))
+    return tuple(fingerprint)
+
+
+# Fingerprints are compiled once per underlying function (see `SIGNATURE_CACHE`).
+FINGERPRINT_CACHE: WeakLRUCache[SignatureFingerprint] = WeakLRUCache(maxsize=4096)
+
+
+def get_functional_fingerprint(member: object) -> SignatureFingerprint:
+    """
+    Return the fingerprint (see `get_signature_fingerprint`) of the signature
+    of `member`.
+    """
+    adapter = get_member_adapter(member)
+    key = member if adapter.signature is not None else adapter.unwrap(member)
+    fingerprint = FINGERPRINT_CACHE.get(key)
+    if fingerprint is None:
+        if adapter.signature is not None or type(key) is not types.FunctionType or not _SIGNATURE_ATTRS.isdisjoint(key.__dict__):
+            fingerprint = get_signature_fingerprint(get_functional_signature(member))
+        else:
+            fingerprint = _get_code_fingerprint(key)
+        FINGERPRINT_CACHE.set(key, fingerprint)
+    return fingerprint
+
+
+def has_same_signature(member: object, ref_member: object) -> bool:
+    """
+    Check (cheaply) whether two members are known to have identical
+    signatures, by virtue of sharing the same code and defaults.
+
+    A return value of `False` does not imply that the signatures differ.
+    """
+    adapter, ref_adapter = get_member_adapter(member), get_member_adapter(ref_member)
+    if adapter.signature is not None or ref_adapter.signature is not None:
+        return False
+    function, ref_function = adapter.unwrap(member), ref_adapter.unwrap(ref_member)
+    if function is ref_function:
+        return True
+    return (
+        type(function) is types.FunctionType
+        and type(ref_function) is types.FunctionType
+        and function.__code__ is ref_function.__code__
+        and function.__defaults__ is ref_function.__defaults__
+        and function.__kwdefaults__ is ref_function.__kwdefaults__
+        and _SIGNATURE_ATTRS.isdisjoint(function.__dict__)
+        and _SIGNATURE_ATTRS.isdisjoint(ref_function.__dict__)
+    )
+
+
+# Attributes by which the signatures of functions can be overridden (e.g. by
+# `functools.wraps` or `functools.partialmethod`).
+_SIGNATURE_ATTRS = frozenset({"__wrapped__", "__signature__", "_partialmethod"})
+
+
+# Type hints are only resolved when annotation checks are enabled (see
+# `INTERFACE_CHECK_ANNOTATIONS`), and are then resolved once per underlying
+# function, so that string annotations are evaluated at most once.
+TYPE_HINTS_CACHE: WeakLRUCache[dict[str, Any] | None] = WeakLRUCache(maxsize=4096)
+
+
+def get_functional_type_hints(member: object) -> dict[str, Any] | None:
+    """
+    Return the resolved type hints of (the function underlying) `member`.
+
+    Returns:
+        A mapping from parameter names (and "return") to resolved type hints,
+            or `None` if the hints could not be resolved (e.g. because they
+            refer to names that are not yet defined). Failures are also
+            cached, so that hints are evaluated at most once per function.
+    """
+    function = _get_member(member)
+    hints = TYPE_HINTS_CACHE.get(function, _MISSING)
+    if hints is _MISSING:
+        try:
+            hints = typing.get_type_hints(function, include_extras=True)
+        except Exception:
+            hints = None
+        TYPE_HINTS_CACHE.set(function, hints)
+    return hints
 
 
 def functional_hasattr(member: object, attr: str) -> bool:
@@ -65,14 +387,14 @@ def functional_delattr(member: object, attr: str) -> None:
 
 
 @overload
-def get_functional_wrapper(member: classmethod[Any, Any, Any]) -> classmethod[Any, Any, Any]: ...
+def get_functional_wrapper(member: classmethod[Any, Any, Any], copy_function: bool = ...) -> classmethod[Any, Any, Any]: ...
 @overload
-def get_functional_wrapper(member: property) -> property: ...
+def get_functional_wrapper(member: property, copy_function: bool = ...) -> property: ...
 @overload
-def get_functional_wrapper(member: staticmethod[Any, Any]) -> staticmethod[Any, Any]: ...
+def get_functional_wrapper(member: staticmethod[Any, Any], copy_function: bool = ...) -> staticmethod[Any, Any]: ...
 @overload
-def get_functional_wrapper(member: _FuncT) -> _FuncT: ...
-def get_functional_wrapper(member: object) -> object:
+def get_functional_wrapper(member: _FuncT, copy_function: bool = ...) -> _FuncT: ...
+def get_functional_wrapper(member: object, copy_function: bool = True) -> object:
     """
     Return a new functional wrapper around the provided member.
 
@@ -83,70 +405,185 @@ def get_functional_wrapper(member: object) -> object:
 
     Args:
         member: The functional object to be wrapped.
+        copy_function: Whether Python functions should be copied (sharing
+            the same code, globals, defaults and closure) rather than wrapped
+            in a forwarding function. Copies are called with no additional
+            overhead. Other callables are always wrapped.
 
     Returns:
         An object that is functionally equivalent to `member`,
             but which can have its own attributes.
     """
-    class_method = isinstance(member, classmethod)
-    property_method = isinstance(member, property)
-    static_method = isinstance(member, staticmethod)
+    adapter = get_member_adapter(member)
+    function = adapter.unwrap(member)
+
+    wrapper: Any
+    if copy_function and isinstance(function, types.FunctionType):
+        wrapper = _copy_function(function)
+    else:
+
+        @functools.wraps(function)  # type: ignore[arg-type]
+        def wrapper(*args: Any, **kwargs: Any) -> Any:  # pragma: no cover
+            return function(*args, **kwargs)  # type: ignore[operator]
+
+    # Interface metadata is immutable, and so is shared with the wrapper
+    metadata = get_metadata(function)
+    if metadata is not _EMPTY_METADATA:
+        setattr(wrapper, METADATA_ATTR, metadata)
+
+    return adapter.rewrap(member, wrapper)
+
+
+def _copy_function(function: types.FunctionType) -> types.FunctionType:
+    clone = types.FunctionType(
+        function.__code__,
+        function.__globals__,
+        function.__name__,
+        function.__defaults__,
+        function.__closure__,
+    )
+    clone.__kwdefaults__ = function.__kwdefaults__
+    for attr in functools.WRAPPER_ASSIGNMENTS:
+        if hasattr(function, attr):
+            setattr(clone, attr, getattr(function, attr))
+    clone.__dict__.update(function.__dict__)
+    return clone
 
-    function = _get_member(member)
 
-    @functools.wraps(function)  # type: ignore[arg-type]
-    def wrapper(*args: Any, **kwargs: Any) -> Any:  # pragma: no cover
-        return function(*args, **kwargs)  # type: ignore[operator]
+# Functions underlying wrappers that may be shared by multiple classes (see
+# `interface_meta.utils.docs.get_documented_wrapper`). These are copied (see
+# `get_functional_wrapper`) rather than mutated by `update_metadata` and
+# `set_functional_docs`, so that changes do not leak between classes.
+_SHARED_FUNCTIONS: weakref.WeakSet[Any] = weakref.WeakSet()
+
+
+def is_shared_member(member: object) -> bool:
+    return _get_member(member) in _SHARED_FUNCTIONS
+
+
+def set_shared_member(member: object) -> None:
+    _SHARED_FUNCTIONS.add(_get_member(member))
+
+
+# Interface metadata
+
+# The attribute used to store `InterfaceMetadata` on functions.
+METADATA_ATTR = "__interface_meta__"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class InterfaceMetadata:
+    """
+    The metadata attached to a function by the `InterfaceMeta` decorators.
+
+    All metadata is held in a single immutable record (stored on the function
+    as `__interface_meta__`), so that it can be read with a single lookup and
+    shared by any wrappers of the function.
+
+    Attributes:
+        override: Whether the function explicitly overrides an interface
+            method (see `@override`).
+        force: Whether the override should be forced (see `@override(force=True)`).
+        skip: Whether the function should be skipped by conformance checks
+            (see `@skip`).
+        quirks_method: The method from which quirks documentation should be
+            extracted (see `@inherit_docs`).
+        quirks_mro: Whether documentation should be inherited from all levels
+            of the MRO (or `None` if not specified; see `@inherit_docs`).
+        has_quirks_method: Whether `quirks_method` has been specified.
+    """
+
+    override: bool = False
+    force: bool = False
+    skip: bool = False
+    quirks_method: str | None = None
+    quirks_mro: bool | None = None
+    has_quirks_method: bool = False
+
+
+_EMPTY_METADATA = InterfaceMetadata()
+# `typing.override` (PEP 698) marks overrides by setting `__override__`
+_TYPING_OVERRIDE_METADATA = InterfaceMetadata(override=True)
 
-    for attr in ["_quirks_method", "_quirks_mro", "__override__", "__override_force__"]:
-        if hasattr(function, attr):
-            setattr(wrapper, attr, getattr(function, attr))
 
-    if class_method:
-        return classmethod(wrapper)
-    elif property_method:
-        assert isinstance(member, property)
-        return property(fget=wrapper, fset=member.fset, fdel=member.fdel)
-    elif static_method:
-        return staticmethod(wrapper)
-    return wrapper
+def get_metadata(member: object) -> InterfaceMetadata:
+    """
+    Return the interface metadata attached to (the function underlying) `member`.
+    """
+    attrs = getattr(_get_member(member), "__dict__", None)
+    if not attrs or not isinstance(attrs, dict):
+        return _EMPTY_METADATA
+    metadata = attrs.get(METADATA_ATTR)
+    if metadata is None:
+        return _TYPING_OVERRIDE_METADATA if attrs.get("__override__") is True else _EMPTY_METADATA
+    return metadata
+
+
+def update_metadata(member: _FuncT, **changes: Any) -> _FuncT:
+    """
+    Update the interface metadata attached to (the function underlying) `member`.
+
+    Explicit overrides are also marked as per `typing.override` (PEP 698), by
+    setting `__override__` on the function (where possible), so that they are
+    recognised by static type checkers and other runtime introspection.
+
+    Members that may be shared by multiple classes (see `is_shared_member`) are
+    copied, and the copy updated instead.
+
+    Args:
+        member: The member to update.
+        **changes: The fields of `InterfaceMetadata` to update.
+
+    Returns:
+        The updated member (`member`, or a copy of it if it is shared).
+    """
+    if is_shared_member(member):
+        member = get_functional_wrapper(member)
+    function = _get_member(member)
+    setattr(function, METADATA_ATTR, dataclasses.replace(get_metadata(function), **changes))
+    if changes.get("override"):
+        try:
+            function.__override__ = True  # type: ignore[attr-defined]
+        except (AttributeError, TypeError):  # pragma: no cover; as per `typing.override`
+            pass
+    return member
 
 
 # Override checking
 
 
 def has_explicit_override(member: object) -> bool:
-    return bool(functional_getattr(member, "__override__", False))
+    return get_metadata(member).override
 
 
-def set_explicit_override(member: object, override: bool = True) -> None:
-    functional_setattr(member, "__override__", override)
+def set_explicit_override(member: _FuncT, override: bool = True) -> _FuncT:
+    return update_metadata(member, override=override)
 
 
 def has_forced_override(member: object) -> bool:
-    return bool(functional_getattr(member, "__override_force__", False))
+    return get_metadata(member).force
 
 
-def set_forced_override(member: object, force: bool = True) -> None:
-    functional_setattr(member, "__override_force__", force)
+def set_forced_override(member: _FuncT, force: bool = True) -> _FuncT:
+    return update_metadata(member, force=force)
 
 
 # Skip interface conformance checks
 
 
 def should_skip(member: object) -> bool:
-    return bool(functional_getattr(member, "__interface_meta_skip__", False))
+    return get_metadata(member).skip
 
 
-def set_skip(member: object, skip: bool = True) -> None:
-    functional_setattr(member, "__interface_meta_skip__", skip)
+def set_skip(member: _FuncT, skip: bool = True) -> _FuncT:
+    return update_metadata(member, skip=skip)
 
 
 # Documentation helpers
 
 
 def has_updatable_docs(member: object) -> bool:
-    return is_functional_member(member) or (inspect.isdatadescriptor(member) and isinstance(member, property))
+    return get_member_adapter(member).documented
 
 
 def get_functional_docs(member: object, orig: bool = True) -> str | None:
@@ -155,10 +592,34 @@ def get_functional_docs(member: object, orig: bool = True) -> str | None:
     return functional_getattr(member, "__doc__")
 
 
-def set_functional_docs(member: object, docs: str | None) -> None:
-    if not functional_hasattr(member, "__doc_orig__"):
-        functional_setattr(member, "__doc_orig__", functional_getattr(member, "__doc__"))
-    functional_setattr(member, "__doc__", docs)
+def set_functional_docs(member: _FuncT, docs: str | None) -> _FuncT:
+    """
+    Set the documentation of (the function underlying) `member`, recording
+    its original documentation as `__doc_orig__`.
+
+    As for `update_metadata`, members that may be shared by multiple classes
+    are copied, and the copy updated instead.
+
+    Args:
+        member: The member to document.
+        docs: The documentation to set.
+
+    Returns:
+        The documented member (`member`, or a copy of it if it is shared).
+    """
+    if is_shared_member(member):
+        member = get_functional_wrapper(member)
+    function: Any = _get_member(member)
+    attrs = getattr(function, "__dict__", None)
+    if isinstance(attrs, dict):
+        # `setdefault` is atomic, and the original docs are always recorded
+        # before they are replaced, so concurrent renders of a shared function
+        # agree on its original docs without locking.
+        attrs.setdefault("__doc_orig__", function.__doc__)
+    elif not hasattr(function, "__doc_orig__"):
+        function.__doc_orig__ = function.__doc__
+    function.__doc__ = docs
+    return member
 
 
 def has_class_attr_docs(cls: type) -> bool:
@@ -173,24 +634,24 @@ def get_class_attr_docs(cls: type) -> str | None:
 
 
 def has_quirk_docs_method(member: object) -> bool:
-    return functional_hasattr(member, "_quirks_method")
+    return get_metadata(member).has_quirks_method
 
 
 def get_quirk_docs_method(member: object) -> str | None:
-    return functional_getattr(member, "_quirks_method", None)
+    return get_metadata(member).quirks_method
 
 
-def set_quirk_docs_method(member: object, method: str | None) -> None:
-    functional_setattr(member, "_quirks_method", method)
+def set_quirk_docs_method(member: _FuncT, method: str | None) -> _FuncT:
+    return update_metadata(member, quirks_method=method, has_quirks_method=True)
 
 
 def has_quirk_docs_mro(member: object) -> bool:
-    return functional_hasattr(member, "_quirks_mro")
+    return get_metadata(member).quirks_mro is not None
 
 
 def get_quirk_docs_mro(member: object) -> bool:
-    return bool(functional_getattr(member, "_quirks_mro", True))
+    return get_metadata(member).quirks_mro is not False
 
 
-def set_quirk_docs_mro(member: object, mro: bool) -> None:
-    functional_setattr(member, "_quirks_mro", mro)
+def set_quirk_docs_mro(member: _FuncT, mro: bool) -> _FuncT:
+    return update_metadata(member, quirks_mro=mro)
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import threading
+import typing
+from collections.abc import Iterable, Mapping
+from typing import Any, NamedTuple
+
+# The attribute on `InterfaceMeta` classes used to store their member index.
+INDEX_ATTR = "__interface_index__"
+
+# Names populated on every class by `ABCMeta`, which are never interface members.
+IGNORED_NAMES = frozenset({"_abc_impl"})
+
+# The attribute on `InterfaceMeta` classes used to store the names of the slots
+# generated for them by `INTERFACE_SLOTS`.
+SLOTS_ATTR = "__interface_slots__"
+
+
+class MemberOrigin(NamedTuple):
+    """
+    The class in which a member visible on some class was (most recently) defined.
+
+    Attributes:
+        owner: The class in the MRO that defines (or declares) the member.
+        member: The member as found in `owner.__dict__` (or `None` if the
+            member is only declared via an annotation).
+        annotation_only: Whether the member is only declared via an
+            annotation, and not yet assigned a value.
+    """
+
+    owner: type
+    member: object
+    annotation_only: bool
+
+
+_EMPTY_INDEX: Mapping[str, MemberOrigin] = {}
+
+
+class _StaleIndex:
+    """
+    A marker stored in place of an invalidated member index.
+
+    A new marker is stored by each invalidation, so that an index recomputed
+    from a stale marker is only stored if no other invalidation has happened
+    in the meantime.
+    """
+
+    __slots__ = ()
+
+
+# Serialises storing recomputed indices with their invalidation.
+_INDEX_LOCK = threading.Lock()
+
+
+def get_member_index(cls: type) -> Mapping[str, MemberOrigin]:
+    """
+    Return an index of all non-dunder names visible on `cls`.
+
+    The index maps each name to the `MemberOrigin` that would first be found
+    when walking the MRO of `cls` (including `cls` itself). Indices stored on
+    `InterfaceMeta` classes via `update_member_index` are reused (and
+    recomputed when invalidated); for all other classes the index is computed
+    on demand.
+
+    Args:
+        cls: The class for which an index should be returned.
+
+    Returns:
+        A mapping from member names to their origins. This mapping may be
+            shared with other classes, and so must not be mutated.
+    """
+    stored = cls.__dict__.get(INDEX_ATTR)
+    if stored is not None and type(stored) is not _StaleIndex:
+        return stored  # type: ignore[no-any-return]
+    if cls is object:
+        return _EMPTY_INDEX
+    own = _get_own_members(cls)
+    inherited = get_inherited_member_index(cls)
+    index = {**inherited, **own} if own else inherited
+    # Indices invalidated by `invalidate_member_index` are stored again, unless
+    # they were invalidated again while being recomputed
+    if stored is not None:
+        with _INDEX_LOCK:
+            if cls.__dict__.get(INDEX_ATTR) is stored:
+                type.__setattr__(cls, INDEX_ATTR, index)
+    return index
+
+
+def get_inherited_member_index(cls: type) -> Mapping[str, MemberOrigin]:
+    """
+    Return an index of all non-dunder names visible on the bases of `cls`.
+
+    This is equivalent to walking `cls.__mro__[1:]` for each name, but for
+    single inheritance the index of the parent class is reused as-is.
+
+    Args:
+        cls: The class for which the inherited index should be returned.
+
+    Returns:
+        A mapping from member names to their origins. This mapping may be
+            shared with other classes, and so must not be mutated.
+    """
+    bases = cls.__bases__
+    if len(bases) == 1:
+        return get_member_index(bases[0])
+    index: dict[str, MemberOrigin] = {}
+    for klass in reversed(cls.__mro__[1:]):
+        if klass is not object:
+            index.update(_get_own_members(klass))
+    return index
+
+
+def update_member_index(cls: type, inherited: Mapping[str, MemberOrigin] | None = None) -> None:
+    """
+    Compute and store the member index of `cls` for use by its subclasses.
+
+    Args:
+        cls: The class whose index should be stored.
+        inherited: The inherited index of `cls`, if already computed.
+    """
+    if inherited is None:
+        inherited = get_inherited_member_index(cls)
+    own = _get_own_members(cls)
+    setattr(cls, INDEX_ATTR, {**inherited, **own} if own else inherited)
+
+
+def invalidate_member_index(cls: type) -> None:
+    """
+    Invalidate the stored member indices of `cls` and its subclasses, after a
+    member has been added to, replaced on, or removed from `cls`.
+
+    Invalidated indices are recomputed (and stored again) by
+    `get_member_index` when next needed.
+
+    Args:
+        cls: The class whose members have changed.
+    """
+    queue = [cls]
+    seen = set()
+    with _INDEX_LOCK:
+        while queue:
+            klass = queue.pop()
+            if klass in seen:
+                continue
+            seen.add(klass)
+            if INDEX_ATTR in klass.__dict__:
+                type.__setattr__(klass, INDEX_ATTR, _StaleIndex())
+            queue.extend(type.__subclasses__(klass))
+
+
+def get_declared_slots(bases: tuple[type, ...], dct: Mapping[str, Any]) -> tuple[str, ...]:
+    """
+    Return the names of the slots to generate for a class from the attributes
+    declared (via annotations) by it and its bases.
+
+    Slots are generated for annotated names that are not assigned a value
+    (in the class or any of its bases), that are not already slots of any of
+    the bases, and that are not annotated as `ClassVar`.
+
+    Args:
+        bases: The bases of the class being constructed.
+        dct: The class dictionary being used to construct the class.
+
+    Returns:
+        The names of the slots, in order of declaration (from the most
+            primitive base).
+    """
+    mro = list(dict.fromkeys(klass for base in bases for klass in base.__mro__))
+    annotations: dict[str, Any] = {}
+    for klass in reversed(mro):
+        annotations.update(klass.__dict__.get("__annotations__", {}))
+    annotations.update(dct.get("__annotations__", {}))
+
+    def is_assigned(name: str) -> bool:
+        return name in dct or any(name in klass.__dict__ for klass in mro)
+
+    return tuple(name for name, annotation in annotations.items() if not _is_ignored(name) and not is_assigned(name) and not _is_classvar(annotation))
+
+
+def _is_classvar(annotation: Any) -> bool:
+    if isinstance(annotation, str):
+        return annotation.partition("[")[0].rpartition(".")[-1] == "ClassVar"
+    return annotation is typing.ClassVar or typing.get_origin(annotation) is typing.ClassVar
+
+
+def _get_own_members(cls: type) -> dict[str, MemberOrigin]:
+    members: dict[str, MemberOrigin] = {}
+    for key in getattr(cls, "__annotations__", None) or ():
+        if not _is_ignored(key):
+            members[key] = MemberOrigin(cls, None, True)
+    # Generated slots are attributes declared (but not assigned) by an interface
+    slots: Iterable[str] = cls.__dict__.get(SLOTS_ATTR, ())
+    for key, value in cls.__dict__.items():
+        if not _is_ignored(key):
+            members[key] = MemberOrigin(cls, value, key in slots)
+    return members
+
+
+def _is_ignored(key: Any) -> bool:
+    return key in IGNORED_NAMES or (isinstance(key, str) and key.startswith("__") and key.endswith("__"))
@@ -0,0 +1,338 @@
+"""
+Low-overhead profiling of calls to the methods of interface implementations.
+
+Rather than wrapping methods (which would add a Python frame to every call),
+`MethodProfiler` uses `sys.monitoring` (PEP 669, Python 3.12+) to observe
+calls to the code objects of implementation methods. Monitoring is only
+enabled for those code objects, and only while the profiler is running, so
+that other code (and all code when the profiler is stopped) runs at full
+speed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+import types
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from .events import REGISTERED, InterfaceEvent, subscribe, unsubscribe
+from .inspection import _get_member, has_updatable_docs, is_functional_member
+from .members import get_member_index
+
+_MONITORING: Any = getattr(sys, "monitoring", None)
+
+# The number of power-of-two latency buckets (in nanoseconds) in histograms.
+_BUCKETS = 48
+
+
+def is_profiling_supported() -> bool:
+    """Check whether `MethodProfiler` is supported (i.e. Python 3.12+)."""
+    return _MONITORING is not None
+
+
+@dataclass(frozen=True)
+class MethodProfile:
+    """
+    The calls observed to a method of an implementation of an interface.
+
+    Attributes:
+        interface: The qualified name of the interface.
+        implementation: The qualified name of the class defining the method.
+        method: The name of the method.
+        calls: The number of calls to the method (including those that
+            raised exceptions).
+        timed_calls: The number of calls whose latency was measured. Calls
+            that raise exceptions (or that are still running) are not timed.
+        total_time: The total latency of timed calls (in seconds).
+        histogram: The latency distribution of timed calls, as a tuple of
+            `(upper_bound, count)` pairs (with upper bounds in seconds) for
+            each non-empty power-of-two bucket.
+    """
+
+    interface: str
+    implementation: str
+    method: str
+    calls: int
+    timed_calls: int
+    total_time: float
+    histogram: tuple[tuple[float, int], ...]
+
+    @property
+    def mean_time(self) -> float | None:
+        """The mean latency of timed calls (in seconds)."""
+        return self.total_time / self.timed_calls if self.timed_calls else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable representation of this profile."""
+        return {
+            "interface": self.interface,
+            "implementation": self.implementation,
+            "method": self.method,
+            "calls": self.calls,
+            "timed_calls": self.timed_calls,
+            "total_time": self.total_time,
+            "histogram": [list(bucket) for bucket in self.histogram],
+        }
+
+
+class _MethodStats:
+    __slots__ = ("calls", "histogram", "implementation", "interface", "method", "timed_calls", "total_time")
+
+    def __init__(self, interface: str, implementation: str, method: str) -> None:
+        self.interface = interface
+        self.implementation = implementation
+        self.method = method
+        self.calls = 0
+        self.timed_calls = 0
+        self.total_time = 0
+        self.histogram = [0] * _BUCKETS
+
+    def empty(self) -> _MethodStats:
+        return _MethodStats(self.interface, self.implementation, self.method)
+
+    def merge(self, other: _MethodStats) -> None:
+        self.calls += other.calls
+        self.timed_calls += other.timed_calls
+        self.total_time += other.total_time
+        for i, count in enumerate(other.histogram):
+            self.histogram[i] += count
+
+    def snapshot(self) -> MethodProfile:
+        return MethodProfile(
+            interface=self.interface,
+            implementation=self.implementation,
+            method=self.method,
+            calls=self.calls,
+            timed_calls=self.timed_calls,
+            total_time=self.total_time / 1e9,
+            histogram=tuple((2**i / 1e9, count) for i, count in enumerate(self.histogram) if count),
+        )
+
+
+class MethodProfiler:
+    """
+    Collects call counts and latency histograms for the methods of the
+    implementations of one or more interfaces.
+
+    Statistics are collected per `(interface, implementation, method)`, for
+    each method of the interface defined by the interface or any of its
+    subclasses (including subclasses created while the profiler is running).
+    Since implementations are identified by the code objects of their
+    methods, methods inherited (or copied, e.g. to carry documentation) by
+    subclasses are attributed to the class that originally defined them.
+    Likewise, methods sharing a code object (e.g. created by the same function
+    factory for several classes) are all attributed to the first such class
+    found in the hierarchy.
+
+    Statistics are accumulated separately by each thread (without locking),
+    and merged when snapshots are taken or profiling is stopped.
+
+    Profilers can be started and stopped at runtime (or used as context
+    managers). When stopped, profiled methods incur no overhead. Only one
+    profiler can run at a time, since it claims the `sys.monitoring` tool
+    identifier reserved for profilers.
+
+    Args:
+        interfaces: The interfaces whose implementations should be profiled.
+    """
+
+    def __init__(self, *interfaces: type) -> None:
+        if not interfaces:
+            raise ValueError("At least one interface must be nominated for profiling.")
+        self.interfaces = tuple(getattr(interface, "__interface__", interface) for interface in interfaces)
+        # The statistics of instrumented methods (as merged from threads)
+        self._stats: dict[types.CodeType, _MethodStats] = {}
+        # The statistics accumulated by each thread, not yet merged
+        self._thread_stats: list[dict[types.CodeType, _MethodStats]] = []
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._counters = threading.local()
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        """
+        Start profiling.
+
+        Raises:
+            RuntimeError: If `sys.monitoring` is not available, or if another
+                profiler is already running.
+        """
+        if _MONITORING is None:
+            raise RuntimeError("Method profiling requires `sys.monitoring` (Python 3.12+).")
+        with self._lock:
+            if self._running:
+                return
+            tool = _MONITORING.PROFILER_ID
+            try:
+                _MONITORING.use_tool_id(tool, "interface_meta")
+            except ValueError as e:
+                raise RuntimeError(f"The profiler tool identifier is already in use by `{_MONITORING.get_tool(tool)}`.") from e
+            _MONITORING.register_callback(tool, _MONITORING.events.PY_START, self._on_start)
+            _MONITORING.register_callback(tool, _MONITORING.events.PY_RETURN, self._on_return)
+            self._running = True
+            # Resume monitoring of methods instrumented by previous runs
+            for code in self._stats:
+                _MONITORING.set_local_events(tool, code, _MONITORING.events.PY_START | _MONITORING.events.PY_RETURN)
+            for interface, cls in self._iter_hierarchy():
+                self._instrument(interface, cls)
+            subscribe(REGISTERED, self._on_registered)
+
+    def stop(self) -> None:
+        """Stop profiling (retaining the statistics collected so far)."""
+        with self._lock:
+            if not self._running:
+                return
+            unsubscribe(REGISTERED, self._on_registered)
+            tool = _MONITORING.PROFILER_ID
+            for code in self._stats:
+                _MONITORING.set_local_events(tool, code, 0)
+            _MONITORING.register_callback(tool, _MONITORING.events.PY_START, None)
+            _MONITORING.register_callback(tool, _MONITORING.events.PY_RETURN, None)
+            _MONITORING.free_tool_id(tool)
+            self._running = False
+            self._merge()
+
+    def reset(self) -> None:
+        """Discard the statistics collected so far."""
+        with self._lock:
+            for code, stats in self._stats.items():
+                self._stats[code] = stats.empty()
+            self._thread_stats = []
+            self._counters = threading.local()
+
+    def snapshot(self) -> list[MethodProfile]:
+        """
+        Return the statistics collected so far for all methods that have been
+        called, ordered by descending number of calls.
+        """
+        with self._lock:
+            merged = {code: stats.empty() for code, stats in self._stats.items()}
+            for code, stats in self._stats.items():
+                merged[code].merge(stats)
+            for thread_stats in self._thread_stats:
+                # `dict.copy` is atomic, so is safe while threads add methods
+                for code, stats in thread_stats.copy().items():
+                    merged[code].merge(stats)
+            profiles = [stats.snapshot() for stats in merged.values() if stats.calls]
+        return sorted(profiles, key=lambda profile: (-profile.calls, profile.interface, profile.implementation, profile.method))
+
+    def dump(self, path: str | os.PathLike[str]) -> None:
+        """
+        Write a snapshot of the statistics collected so far to a JSON file.
+
+        Args:
+            path: The path of the file to write.
+        """
+        with open(path, "w") as f:
+            json.dump([profile.as_dict() for profile in self.snapshot()], f, indent=2)
+
+    def __enter__(self) -> MethodProfiler:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    # Instrumentation
+
+    def _iter_hierarchy(self) -> Iterator[tuple[type, type]]:
+        # Breadth-first, so that methods are attributed to the first class in
+        # the hierarchy that defines them.
+        seen: set[type] = set()
+        queue = [(interface, interface) for interface in self.interfaces]
+        while queue:
+            interface, cls = queue.pop(0)
+            if cls in seen:
+                continue
+            seen.add(cls)
+            yield interface, cls
+            queue.extend((interface, subclass) for subclass in type.__subclasses__(cls))
+
+    def _instrument(self, interface: type, cls: type) -> None:
+        events = _MONITORING.events.PY_START | _MONITORING.events.PY_RETURN
+        interface_name = _qualname(interface)
+        for name in get_member_index(interface):
+            member = cls.__dict__.get(name)
+            if member is None or not (is_functional_member(member) or has_updatable_docs(member)):
+                continue
+            code = getattr(_get_member(member), "__code__", None)
+            if not isinstance(code, types.CodeType) or code in self._stats:
+                continue
+            self._stats[code] = _MethodStats(interface_name, _qualname(cls), name)
+            _MONITORING.set_local_events(_MONITORING.PROFILER_ID, code, events)
+
+    def _on_registered(self, event: InterfaceEvent) -> None:
+        cls = event.cls
+        if cls is None:
+            return
+        with self._lock:
+            if not self._running:
+                return
+            for interface in self.interfaces:
+                if issubclass(cls, interface):
+                    self._instrument(interface, cls)
+                    return
+
+    def _merge(self) -> None:
+        # Fold the statistics accumulated by threads into `_stats` (with the
+        # lock held, and while no callbacks are registered).
+        for thread_stats in self._thread_stats:
+            for code, stats in thread_stats.items():
+                self._stats[code].merge(stats)
+        self._thread_stats = []
+        self._counters = threading.local()
+
+    def _get_thread_stats(self, code: types.CodeType) -> _MethodStats | None:
+        counters = self._counters.__dict__
+        thread_stats = counters.get("stats")
+        if thread_stats is None:
+            thread_stats = counters["stats"] = {}
+            with self._lock:
+                self._thread_stats.append(thread_stats)
+        stats = thread_stats.get(code)
+        if stats is None:
+            instrumented = self._stats.get(code)
+            if instrumented is None:
+                return None
+            stats = thread_stats[code] = instrumented.empty()
+        return stats
+
+    # Monitoring callbacks
+
+    def _on_start(self, code: types.CodeType, offset: int) -> None:
+        stats = self._get_thread_stats(code)
+        if stats is not None:
+            stats.calls += 1
+        self._local.__dict__.setdefault("stack", []).append((code, time.perf_counter_ns()))
+
+    def _on_return(self, code: types.CodeType, offset: int, retval: object) -> None:
+        end = time.perf_counter_ns()
+        stack = self._local.__dict__.get("stack")
+        # Frames exited by exceptions are not reported, and are discarded here
+        while stack:
+            started, start = stack.pop()
+            if started is code:
+                break
+        else:
+            return
+        stats = self._get_thread_stats(code)
+        if stats is None:  # pragma: no cover
+            return
+        duration = end - start
+        stats.timed_calls += 1
+        stats.total_time += duration
+        stats.histogram[min(duration.bit_length(), _BUCKETS - 1)] += 1
+
+
+def _qualname(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import functools
+import importlib
+import inspect
+import threading
+import weakref
+from collections.abc import Hashable, Iterable, Iterator, Mapping
+from typing import Any
+
+# The attribute on interface classes used to store their registry.
+REGISTRY_ATTR = "__interface_registry__"
+
+_REGISTRY_LOCK = threading.Lock()
+
+
+class ImplementationRegistry:
+    """
+    A registry of the implementations of an interface.
+
+    Implementations are held by weak reference (and so are dropped from the
+    registry once garbage collected), and can be looked up in constant time
+    by name or by any of the keys they declare via `INTERFACE_REGISTRY_KEYS`.
+    Registration is serialised by a lock, but lookups never acquire it: the
+    lookup tables are only ever updated atomically (single key assignments),
+    and the sequences of (concrete) implementations are immutable tuples that
+    are replaced rather than mutated.
+
+    Implementations can also be discovered without being imported, via the
+    entry-point group and/or module manifest declared by the interface (see
+    `INTERFACE_ENTRY_POINT_GROUP` and `INTERFACE_PLUGIN_MANIFEST`). The
+    module providing such a plugin is only imported when it is first looked
+    up by key.
+
+    Args:
+        interface: The interface class whose implementations are registered.
+    """
+
+    def __init__(self, interface: type) -> None:
+        self._interface = weakref.ref(interface)
+        self._lock = threading.RLock()
+        self._by_name: dict[str, weakref.ref[type]] = {}
+        self._by_key: dict[Hashable, weakref.ref[type]] = {}
+        self._implementations: tuple[weakref.ref[type], ...] = ()
+        self._concrete: tuple[weakref.ref[type], ...] = ()
+        self._plugins: dict[Hashable, str] | None = None
+
+    @property
+    def interface(self) -> type | None:
+        return self._interface()
+
+    def register(self, cls: type, keys: Iterable[Hashable] = ()) -> None:
+        """
+        Register an implementation.
+
+        If another implementation has already been registered with the same
+        name (or key), it is replaced for the purposes of lookups.
+
+        Args:
+            cls: The implementation to register.
+            keys: Additional keys by which the implementation can be looked up.
+        """
+        ref = weakref.ref(cls, self._remove)
+        with self._lock:
+            self._by_name[cls.__name__] = ref
+            for key in keys:
+                self._by_key[key] = ref
+            self._implementations = (*self._implementations, ref)
+            if not inspect.isabstract(cls):
+                self._concrete = (*self._concrete, ref)
+
+    def _remove(self, ref: weakref.ref[type]) -> None:
+        with self._lock:
+            for name in [name for name, value in self._by_name.items() if value is ref]:
+                del self._by_name[name]
+            for key in [key for key, value in self._by_key.items() if value is ref]:
+                del self._by_key[key]
+            self._implementations = tuple(r for r in self._implementations if r is not ref)
+            self._concrete = tuple(r for r in self._concrete if r is not ref)
+
+    def get(self, key: Hashable, default: Any = None) -> type | Any:
+        """
+        Look up an implementation by key or name (with declared keys taking
+        precedence over names).
+
+        Args:
+            key: The key or name of the implementation.
+            default: The value to return if there is no such implementation.
+        """
+        ref = self._by_key.get(key) or (self._by_name.get(key) if isinstance(key, str) else None)
+        if ref is None:
+            plugin = self.plugins.get(key)
+            if plugin is not None:
+                ref = self._load_plugin(key, plugin)
+        cls = ref() if ref is not None else None
+        return default if cls is None else cls
+
+    def __getitem__(self, key: Hashable) -> type:
+        cls = self.get(key)
+        if cls is None:
+            raise KeyError(key)
+        return cls
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key) is not None
+
+    @property
+    def plugins(self) -> Mapping[Hashable, str]:
+        """
+        The plugins declared for the interface, as a mapping from keys to the
+        (`module` or `module:attribute`) references of their implementations.
+        """
+        if self._plugins is None:
+            with self._lock:
+                if self._plugins is None:
+                    self._plugins = _discover_plugins(self.interface)
+        return self._plugins
+
+    def available(self) -> tuple[Hashable, ...]:
+        """
+        The names and keys of all registered implementations, along with the
+        keys of all declared plugins (whether or not they have been imported).
+        """
+        return tuple(dict.fromkeys([*self._by_key, *self._by_name, *self.plugins]))
+
+    def _load_plugin(self, key: Hashable, plugin: str) -> weakref.ref[type] | None:
+        module_name, _, attr = plugin.partition(":")
+        module = importlib.import_module(module_name)
+        ref = self._by_key.get(key) or (self._by_name.get(key) if isinstance(key, str) else None)
+        if ref is None and attr:
+            # Entry points may reference classes that do not declare the key
+            cls = functools.reduce(getattr, attr.split("."), module)
+            interface = self.interface
+            if isinstance(cls, type) and interface is not None and issubclass(cls, interface):
+                with self._lock:
+                    ref = self._by_name.get(cls.__name__)
+                    if ref is None or ref() is not cls:
+                        ref = weakref.ref(cls, self._remove)
+                    self._by_key[key] = ref
+        return ref
+
+    @property
+    def implementations(self) -> tuple[type, ...]:
+        """All registered implementations, in order of registration."""
+        return _resolve(self._implementations)
+
+    @property
+    def concrete(self) -> tuple[type, ...]:
+        """All registered non-abstract implementations, in order of registration."""
+        return _resolve(self._concrete)
+
+    def __iter__(self) -> Iterator[type]:
+        return iter(self.implementations)
+
+    def __len__(self) -> int:
+        return len(self.implementations)
+
+    def __repr__(self) -> str:
+        interface = self.interface
+        return f"<ImplementationRegistry for {interface.__name__ if interface else None}: {len(self)} implementations>"
+
+
+def _resolve(refs: tuple[weakref.ref[type], ...]) -> tuple[type, ...]:
+    return tuple(cls for cls in (ref() for ref in refs) if cls is not None)
+
+
+def _discover_plugins(interface: type | None) -> dict[Hashable, str]:
+    plugins: dict[Hashable, str] = {}
+    group = getattr(interface, "INTERFACE_ENTRY_POINT_GROUP", None)
+    if group:
+        # Imported lazily, since `importlib.metadata` is expensive to import.
+        import importlib.metadata
+
+        for entry_point in importlib.metadata.entry_points(group=group):
+            plugins.setdefault(entry_point.name, entry_point.value)
+    for module, keys in (getattr(interface, "INTERFACE_PLUGIN_MANIFEST", None) or {}).items():
+        for key in (keys,) if isinstance(keys, str) or not isinstance(keys, Iterable) else keys:
+            plugins.setdefault(key, module)
+    return plugins
+
+
+def get_registry(cls: type) -> ImplementationRegistry | None:
+    """
+    Return the registry of the interface of `cls` (if any).
+    """
+    interface = getattr(cls, "__interface__", cls)
+    return interface.__dict__.get(REGISTRY_ATTR)
+
+
+def register_implementation(cls: type, keys: Iterable[Hashable] | Hashable | None = None) -> ImplementationRegistry:
+    """
+    Register `cls` with the registry of its interface (creating the registry
+    if necessary). Interfaces are not registered with their own registries.
+
+    Args:
+        cls: The class to register.
+        keys: The keys by which `cls` can be looked up, in addition to its
+            name. A single string is treated as a single key.
+
+    Returns:
+        The registry of the interface of `cls`.
+    """
+    interface: type = getattr(cls, "__interface__", cls)
+    registry = interface.__dict__.get(REGISTRY_ATTR)
+    if registry is None:
+        with _REGISTRY_LOCK:
+            registry = interface.__dict__.get(REGISTRY_ATTR)
+            if registry is None:
+                registry = ImplementationRegistry(interface)
+                setattr(interface, REGISTRY_ATTR, registry)
+    if cls is not interface:
+        if keys is None:
+            keys = ()
+        elif isinstance(keys, str) or not isinstance(keys, Iterable):
+            keys = (keys,)
+        registry.register(cls, keys)
+    return registry
@@ -1,18 +1,163 @@
+from __future__ import annotations
+
 import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
 
 from .errors import InterfaceConformanceError
+from .events import VIOLATION, emit
+
+logger = logging.getLogger("interface_meta")
+
+# Violation kinds
+TYPE_CHANGE = "type_change"
+MISSING_OVERRIDE = "missing_override"
+SIGNATURE_MISMATCH = "signature_mismatch"
+ANNOTATION_MISMATCH = "annotation_mismatch"
+UNKNOWN_OVERRIDE = "unknown_override"
+GENERIC = "generic"
+
+_TEMPLATES = {
+    TYPE_CHANGE: "`{clsname}.{name}` changes the type of `{ref_clsname}.{name}` (`{details[0]}` instead of `{details[1]}`) without using `@override(force=True)` decorator.",
+    MISSING_OVERRIDE: "`{clsname}.{name}` overrides interface `{ref_clsname}.{name}` without using the `@override` decorator.",
+    SIGNATURE_MISMATCH: "Signature `{clsname}.{name}{details[0]}` does not conform to interface `{ref_clsname}.{name}{details[1]}`.",
+    ANNOTATION_MISMATCH: "Annotations of `{clsname}.{name}` do not conform to interface `{ref_clsname}.{name}`: {details[0]}.",
+    UNKNOWN_OVERRIDE: "`{clsname}.{name}` claims to override interface method, but no such method exists.",
+    GENERIC: "{details[0]}",
+}
 
 
-def report_violation(message: str, raise_on_violation: bool) -> None:
+@dataclass(frozen=True)
+class Violation:
+    """
+    A structured record of a violation in conformance to an interface.
+
+    The human-readable message is only formatted when it is needed (e.g. when
+    it is actually logged).
+
+    Attributes:
+        kind: The kind of violation (e.g. `SIGNATURE_MISMATCH`).
+        clsname: The name of the class with the non-conforming member.
+        name: The name of the non-conforming member.
+        ref_clsname: The name of the class defining the reference member.
+        details: Additional kind-specific details (e.g. the signatures of the
+            member and reference member for `SIGNATURE_MISMATCH`).
+        qualname: The qualified name (including the module) of the class with
+            the non-conforming member, used to distinguish classes sharing the
+            same name when deduplicating reports.
+    """
+
+    kind: str
+    clsname: str | None = None
+    name: str | None = None
+    ref_clsname: str | None = None
+    details: tuple[Any, ...] = ()
+    qualname: str | None = None
+
+    @property
+    def message(self) -> str:
+        return _TEMPLATES[self.kind].format(
+            clsname=self.clsname,
+            name=self.name,
+            ref_clsname=self.ref_clsname,
+            details=self.details,
+        )
+
+    @property
+    def key(self) -> tuple[str | None, str | None, str]:
+        """The key used to deduplicate repeated reports of this violation."""
+        if self.kind == GENERIC:
+            return (None, None, self.message)
+        return (self.qualname or self.clsname, self.name, self.kind)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable representation of this violation."""
+        return {
+            "kind": self.kind,
+            "class": self.clsname,
+            "qualname": self.qualname,
+            "member": self.name,
+            "interface": self.ref_clsname,
+            "message": self.message,
+        }
+
+    def __str__(self) -> str:
+        return self.message
+
+
+# The active collectors are tracked per thread (and per asynchronous task), so
+# that violations reported concurrently elsewhere are not collected.
+_COLLECTORS: ContextVar[tuple[list[Violation], ...]] = ContextVar("interface_meta_collectors", default=())
+
+# The number of times each (deduplicated) violation has been reported.
+_REPORTED: OrderedDict[tuple[str | None, str | None, str], int] = OrderedDict()
+_REPORTED_MAXSIZE = 10000
+_REPORTED_LOCK = threading.Lock()
+
+
+def report_violation(violation: Violation | str, raise_on_violation: bool) -> None:
     """
     Report a violation in conformance to the user.
 
+    Violations are passed to any active collectors (see `collect_violations`),
+    and are then either raised or logged as warnings to the `interface_meta`
+    logger. Repeated violations of the same kind for the same member of a
+    class (by name) are only logged once.
+
     Args:
-        message (str): The message to pass on to the user.
+        violation (Violation | str): The violation (or message) to pass on to
+            the user.
         raise_on_violation (bool): Whether any non-conformance should cause an
             exception to be raised. (default: False)
     """
+    if isinstance(violation, str):
+        violation = Violation(GENERIC, details=(violation,))
+    for collector in _COLLECTORS.get():
+        collector.append(violation)
+    emit(VIOLATION, violation=violation, raised=raise_on_violation)
     if raise_on_violation:
-        raise InterfaceConformanceError(message)
-    else:
-        logging.warning(message)
+        raise InterfaceConformanceError(violation.message)
+    if not logger.isEnabledFor(logging.WARNING):
+        return
+    key = violation.key
+    with _REPORTED_LOCK:
+        count = _REPORTED.get(key, 0)
+        _REPORTED[key] = count + 1
+        if len(_REPORTED) > _REPORTED_MAXSIZE:
+            _REPORTED.popitem(last=False)
+    if not count:
+        logger.warning("%s", violation)
+
+
+@contextmanager
+def collect_violations() -> Iterator[list[Violation]]:
+    """
+    Collect all violations reported within this context.
+
+    Violations are collected whether or not they are raised, and before
+    deduplication, and are still logged as usual. Only violations reported
+    by the current thread (or asynchronous task) are collected.
+
+    Yields:
+        A list that is populated with the `Violation` instances reported.
+    """
+    violations: list[Violation] = []
+    token = _COLLECTORS.set((*_COLLECTORS.get(), violations))
+    try:
+        yield violations
+    finally:
+        _COLLECTORS.reset(token)
+
+
+def reset_reported_violations() -> None:
+    """
+    Forget which violations have already been logged, so that subsequent
+    reports of them are logged again.
+    """
+    with _REPORTED_LOCK:
+        _REPORTED.clear()
@@ -0,0 +1,668 @@
+"""
+Static (import-free) conformance checking.
+
+This module applies the same rules as `InterfaceMeta` (see
+`verify_conformance`, `check_signatures_compatible` and
+`verify_not_overridden`) to classes parsed from source files, without
+importing or executing any of them. `InterfaceMeta` hierarchies are resolved
+across all of the parsed modules by following (relative and absolute)
+imports.
+
+Since nothing is executed, some members cannot be fully understood
+statically. Methods wrapped by unrecognised decorators are only checked for
+the presence of the `@override` decorator, and attributes assigned from
+arbitrary expressions are assumed to conform.
+Likewise, classes inheriting from bases that could not be resolved are not
+checked for unknown overrides, and default values in signatures are compared
+by value when they are literals and by source otherwise.
+"""
+
+from __future__ import annotations
+
+import ast
+import dataclasses
+import os
+import types
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from inspect import Parameter, Signature
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from .conformance import check_signatures_compatible
+from .reporting import GENERIC, MISSING_OVERRIDE, SIGNATURE_MISMATCH, TYPE_CHANGE, UNKNOWN_OVERRIDE, Violation
+
+_METACLASSES = frozenset({"interface_meta.InterfaceMeta", "interface_meta.interface.InterfaceMeta"})
+_OVERRIDE_DECORATORS = frozenset(
+    {
+        "interface_meta.override",
+        "interface_meta.decorators.override",
+        "interface_meta.InterfaceMeta.override",
+        "interface_meta.interface.InterfaceMeta.override",
+        "typing.override",
+        "typing_extensions.override",
+    }
+)
+_SKIP_DECORATORS = frozenset({"interface_meta.skip", "interface_meta.decorators.skip"})
+_TRANSPARENT_DECORATORS = frozenset(
+    {
+        "abc.abstractmethod",
+        "interface_meta.inherit_docs",
+        "interface_meta.decorators.inherit_docs",
+        "interface_meta.InterfaceMeta.inherit_docs",
+        "interface_meta.interface.InterfaceMeta.inherit_docs",
+        "typing.final",
+        "typing.overload",
+        "typing_extensions.final",
+        "typing_extensions.overload",
+    }
+)
+_EMPTY_BASES = frozenset({"builtins.object", "abc.ABC", "typing.Generic", "typing.Protocol", "typing_extensions.Protocol"})
+
+# Member kinds
+FUNCTION = "function"
+CLASSMETHOD = "classmethod"
+STATICMETHOD = "staticmethod"
+PROPERTY = "property"
+ATTRIBUTE = "attribute"
+UNKNOWN = "unknown"
+
+_FUNCTIONAL_KINDS = frozenset({FUNCTION, CLASSMETHOD, STATICMETHOD})
+_KIND_TYPES: dict[str, type] = {
+    FUNCTION: types.FunctionType,
+    CLASSMETHOD: classmethod,
+    STATICMETHOD: staticmethod,
+    PROPERTY: property,
+}
+_KIND_DECORATORS = {
+    "builtins.classmethod": CLASSMETHOD,
+    "builtins.staticmethod": STATICMETHOD,
+    "builtins.property": PROPERTY,
+}
+
+
+class StaticViolation(NamedTuple):
+    """
+    A violation found by static conformance checking.
+
+    Attributes:
+        path: The path of the source file containing the non-conforming member.
+        lineno: The line number of the non-conforming member.
+        violation: The `Violation` record (as would be reported at runtime).
+    """
+
+    path: str
+    lineno: int
+    violation: Violation
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable representation of this violation."""
+        return {**self.violation.as_dict(), "path": self.path, "line": self.lineno}
+
+    def __str__(self) -> str:
+        return f"{self.path}:{self.lineno}: {self.violation}"
+
+
+class _Expression:
+    """
+    A default value or annotation that is only known by its source.
+    """
+
+    __slots__ = ("source",)
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Expression) and other.source == self.source
+
+    def __hash__(self) -> int:
+        return hash(self.source)
+
+    def __repr__(self) -> str:
+        return self.source
+
+
+_ANNOTATION_ONLY = object()
+
+
+@dataclass
+class _Member:
+    name: str
+    kind: str
+    lineno: int
+    type: Any = None
+    signature: Signature | None = None
+    override: bool = False
+    force: bool = False
+    skip: bool = False
+    # Whether the member is defined by a function (possibly wrapped by
+    # unrecognised decorators), rather than assigned from an expression.
+    defined: bool = False
+
+
+@dataclass
+class _Class:
+    module: _Module
+    name: str
+    qualname: str
+    node: ast.ClassDef
+    members: dict[str, _Member] | None = None
+    annotations: set[str] = field(default_factory=set)
+    config: dict[str, Any] = field(default_factory=dict)
+    mro: tuple[list[_Class], bool] | None = None
+
+
+@dataclass
+class _Module:
+    name: str
+    path: str
+    is_package: bool
+    report: bool
+    names: dict[str, str] = field(default_factory=dict)
+    classes: dict[str, _Class] = field(default_factory=dict)
+
+
+class StaticChecker:
+    """
+    Check the conformance of `InterfaceMeta` classes parsed from source.
+
+    Sources are added using `add_path` or `add_source`, and then checked all at
+    once using `check`, so that hierarchies spanning modules can be resolved.
+    """
+
+    def __init__(self) -> None:
+        self.modules: dict[str, _Module] = {}
+        self.errors: list[StaticViolation] = []
+
+    def add_path(self, path: str | os.PathLike[str], report: bool = True) -> None:
+        """
+        Parse a source file, or all source files in a directory.
+
+        Module names are inferred from the enclosing packages (i.e. the
+        parent directories with an `__init__.py` file).
+
+        Args:
+            path: The file or directory to parse.
+            report: Whether violations in these sources should be reported.
+                If `False`, they are only used to resolve class hierarchies.
+        """
+        path = Path(path)
+        for filename in sorted(path.rglob("*.py")) if path.is_dir() else [path]:
+            module, is_package = _get_module_name(filename)
+            try:
+                source = filename.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError) as e:
+                self._add_error(str(filename), 0, f"Unable to read `{filename}`: {e}")
+                continue
+            self.add_source(source, module, path=str(filename), is_package=is_package, report=report)
+
+    def add_source(self, source: str, module: str, path: str = "<string>", is_package: bool = False, report: bool = True) -> None:
+        """
+        Parse the source of a module.
+
+        Args:
+            source: The source code of the module.
+            module: The fully qualified name of the module.
+            path: The path of the module (used when reporting violations).
+            is_package: Whether the module is a package (`__init__.py`), which
+                affects the resolution of relative imports.
+            report: Whether violations in this source should be reported.
+        """
+        try:
+            tree = ast.parse(source, filename=path)
+        except SyntaxError as e:
+            self._add_error(path, e.lineno or 0, f"Unable to parse `{path}`: {e.msg}")
+            return
+        mod = _Module(module, path, is_package, report)
+        self.modules[module] = mod
+        for stmt in _iter_statements(tree.body):
+            if isinstance(stmt, ast.Import):
+                for alias in stmt.names:
+                    if alias.asname:
+                        mod.names[alias.asname] = alias.name
+                    else:
+                        head = alias.name.partition(".")[0]
+                        mod.names[head] = head
+            elif isinstance(stmt, ast.ImportFrom):
+                origin = _resolve_import(mod, stmt)
+                for alias in stmt.names:
+                    if alias.name != "*":
+                        mod.names[alias.asname or alias.name] = f"{origin}.{alias.name}"
+            elif isinstance(stmt, ast.ClassDef):
+                mod.names.pop(stmt.name, None)
+                self._add_class(mod, stmt, prefix="")
+            else:
+                for name in _get_bound_names(stmt):
+                    mod.names[name] = f"{module}.{name}"
+
+    def check(self) -> list[StaticViolation]:
+        """
+        Check all `InterfaceMeta` classes in the reported sources.
+
+        Returns:
+            The violations found (including any sources that could not be
+            parsed), ordered by path and line number.
+        """
+        violations = list(self.errors)
+        for module in self.modules.values():
+            if not module.report:
+                continue
+            for cls in module.classes.values():
+                if self._is_interface(cls):
+                    violations.extend(self._check_class(cls))
+        return sorted(violations, key=lambda v: (v.path, v.lineno))
+
+    # Parsing
+
+    def _add_error(self, path: str, lineno: int, message: str) -> None:
+        self.errors.append(StaticViolation(path, lineno, Violation(GENERIC, details=(message,))))
+
+    def _add_class(self, module: _Module, node: ast.ClassDef, prefix: str) -> None:
+        qualname = f"{prefix}{node.name}"
+        cls = _Class(module, node.name, qualname, node)
+        module.classes[qualname] = cls
+        for stmt in _iter_statements(node.body):
+            if isinstance(stmt, ast.ClassDef):
+                self._add_class(module, stmt, prefix=f"{qualname}.")
+            elif isinstance(stmt, ast.Assign):
+                for target in stmt.targets:
+                    if isinstance(target, ast.Name):
+                        _update_config(cls, target.id, stmt.value)
+            elif isinstance(stmt, ast.AnnAssign) and isinstance(stmt.target, ast.Name):
+                cls.annotations.add(stmt.target.id)
+                if stmt.value is not None:
+                    _update_config(cls, stmt.target.id, stmt.value)
+
+    def _get_members(self, cls: _Class) -> dict[str, _Member]:
+        # Members are only extracted once all sources have been added, since
+        # decorators may need to be resolved against other modules.
+        if cls.members is None:
+            members: dict[str, _Member] = {}
+            for stmt in _iter_statements(cls.node.body):
+                if isinstance(stmt, ast.FunctionDef | ast.AsyncFunctionDef):
+                    members[stmt.name] = self._get_function_member(cls.module, stmt, members.get(stmt.name))
+                elif isinstance(stmt, ast.ClassDef):
+                    members[stmt.name] = _Member(stmt.name, ATTRIBUTE, stmt.lineno)
+                elif isinstance(stmt, ast.Assign):
+                    for target in stmt.targets:
+                        if isinstance(target, ast.Name):
+                            members[target.id] = _get_value_member(target.id, stmt.value, stmt.lineno)
+                elif isinstance(stmt, ast.AnnAssign) and isinstance(stmt.target, ast.Name) and stmt.value is not None:
+                    members[stmt.target.id] = _get_value_member(stmt.target.id, stmt.value, stmt.lineno)
+            cls.members = members
+        return cls.members
+
+    def _get_function_member(self, module: _Module, node: ast.FunctionDef | ast.AsyncFunctionDef, previous: _Member | None) -> _Member:
+        member = _Member(node.name, FUNCTION, node.lineno, signature=_get_signature(node), defined=True)
+        for decorator in reversed(node.decorator_list):
+            target = decorator.func if isinstance(decorator, ast.Call) else decorator
+            dotted = _get_dotted_name(target)
+            if previous is not None and previous.kind == PROPERTY and dotted in (f"{node.name}.setter", f"{node.name}.deleter"):
+                # Property setters and deleters share the getter (and its attributes)
+                member = dataclasses.replace(previous, lineno=node.lineno)
+                continue
+            name = self._get_decorator_name(module, target)
+            if name in _KIND_DECORATORS and member.kind == FUNCTION:
+                member.kind = _KIND_DECORATORS[name]
+            elif name in _OVERRIDE_DECORATORS:
+                member.override = True
+                if isinstance(decorator, ast.Call):
+                    member.force = any(kw.arg == "force" and _literal(kw.value) is True for kw in decorator.keywords)
+            elif name in _SKIP_DECORATORS:
+                member.skip = True
+            elif name not in _TRANSPARENT_DECORATORS:
+                member.kind = UNKNOWN
+        member.type = _KIND_TYPES.get(member.kind)
+        if member.kind not in _FUNCTIONAL_KINDS:
+            member.signature = None
+        return member
+
+    # Name resolution
+
+    def _resolve(self, module: _Module, node: ast.expr) -> str | None:
+        dotted = _get_dotted_name(node)
+        if dotted is None:
+            return None
+        head, _, rest = dotted.partition(".")
+        if head in module.classes:
+            return f"{module.name}.{dotted}"
+        if head in module.names:
+            return f"{module.names[head]}.{rest}" if rest else module.names[head]
+        return f"builtins.{dotted}"
+
+    def _canonicalize(self, name: str | None, depth: int = 0) -> str | None:
+        # Follow re-exports of names through the parsed modules
+        if name is None or depth > 20:
+            return name
+        parts = name.split(".")
+        for i in range(len(parts) - 1, 0, -1):
+            module = self.modules.get(".".join(parts[:i]))
+            if module is None:
+                continue
+            if parts[i] in module.names and ".".join(parts[i:]) not in module.classes:
+                return self._canonicalize(".".join([module.names[parts[i]], *parts[i + 1 :]]), depth + 1)
+            return name
+        return name
+
+    def _lookup(self, name: str | None) -> _Class | None:
+        name = self._canonicalize(name)
+        if name is None:
+            return None
+        parts = name.split(".")
+        for i in range(len(parts) - 1, 0, -1):
+            module = self.modules.get(".".join(parts[:i]))
+            if module is not None:
+                return module.classes.get(".".join(parts[i:]))
+        return None
+
+    def _get_decorator_name(self, module: _Module, node: ast.expr) -> str | None:
+        name = self._canonicalize(self._resolve(module, node))
+        if name is None or name in _KIND_DECORATORS or name in _OVERRIDE_DECORATORS or name in _SKIP_DECORATORS or name in _TRANSPARENT_DECORATORS:
+            return name
+        # Decorators accessed via `InterfaceMeta` classes (e.g. `@Base.override`)
+        owner, _, attr = name.rpartition(".")
+        cls = self._lookup(owner)
+        if attr in ("override", "inherit_docs") and (self._is_interface_metaclass(owner) or (cls is not None and self._is_interface(cls))):
+            return f"interface_meta.InterfaceMeta.{attr}"
+        return name
+
+    def _get_bases(self, cls: _Class) -> list[_Class | str | None]:
+        return [self._lookup(name) or name for name in (self._canonicalize(self._resolve(cls.module, base)) for base in cls.node.bases)]
+
+    def _get_metaclass(self, cls: _Class) -> str | None:
+        for keyword in cls.node.keywords:
+            if keyword.arg == "metaclass":
+                return self._canonicalize(self._resolve(cls.module, keyword.value))
+        return None
+
+    def _is_interface_metaclass(self, name: str | None, depth: int = 0) -> bool:
+        if name in _METACLASSES:
+            return True
+        metaclass = self._lookup(name)
+        if metaclass is None or depth > 20:
+            return False
+        return any(
+            self._is_interface_metaclass(base if isinstance(base, str) else f"{base.module.name}.{base.qualname}", depth + 1)
+            for base in self._get_bases(metaclass)
+            if base is not None
+        )
+
+    def _is_interface(self, cls: _Class) -> bool:
+        mro, _ = self._get_mro(cls)
+        return any(self._is_interface_metaclass(self._get_metaclass(klass)) for klass in mro)
+
+    def _get_mro(self, cls: _Class) -> tuple[list[_Class], bool]:
+        if cls.mro is None:
+            cls.mro = ([cls], False)  # Guard against cyclic hierarchies
+            complete = True
+            sequences = []
+            bases = []
+            for base in self._get_bases(cls):
+                if isinstance(base, _Class):
+                    base_mro, base_complete = self._get_mro(base)
+                    complete = complete and base_complete
+                    sequences.append(list(base_mro))
+                    bases.append(base)
+                elif base not in _EMPTY_BASES:
+                    complete = False
+            cls.mro = ([cls, *_merge_mros([*sequences, bases])], complete)
+        return cls.mro
+
+    # Checking
+
+    def _get_config(self, cls: _Class, key: str, default: Any) -> Any:
+        # Mirrors `InterfaceMeta.__get_config`: the class body, then the first
+        # base (and its MRO), then the metaclass.
+        if key in cls.config:
+            return cls.config[key]
+        mro, _ = self._get_mro(cls)
+        bases = self._get_bases(cls)
+        if bases and isinstance(bases[0], _Class):
+            for klass in self._get_mro(bases[0])[0]:
+                if key in klass.config:
+                    return klass.config[key]
+        for klass in mro:
+            metaclass = self._lookup(self._get_metaclass(klass))
+            if metaclass is not None:
+                for meta in self._get_mro(metaclass)[0]:
+                    if key in meta.config:
+                        return meta.config[key]
+                break
+        return default
+
+    def _check_class(self, cls: _Class) -> Iterator[StaticViolation]:
+        if self._get_config(cls, "INTERFACE_CHECK_MODE", "eager") == "off":
+            return
+        explicit_overrides = self._get_config(cls, "INTERFACE_EXPLICIT_OVERRIDES", True)
+        skipped_names = self._get_config(cls, "INTERFACE_SKIPPED_NAMES", set())
+        if not isinstance(skipped_names, set | frozenset | list | tuple):
+            skipped_names = set()
+        mro, complete = self._get_mro(cls)
+        qualname = f"{cls.module.name}.{cls.qualname}"
+
+        for name, member in self._get_members(cls).items():
+            if name.startswith("__") and name.endswith("__"):
+                continue
+            if name in skipped_names or member.skip:
+                continue
+            owner, ref = self._find_member(mro[1:], name)
+            if owner is None:
+                if complete and member.kind != UNKNOWN and member.override:
+                    yield self._violation(cls, member, Violation(UNKNOWN_OVERRIDE, cls.name, name, qualname=qualname))
+                continue
+            if ref is _ANNOTATION_ONLY:
+                continue
+            for violation in _verify_conformance(name, cls.name, member, owner.name, ref, explicit_overrides, qualname):
+                yield self._violation(cls, member, violation)
+
+    def _find_member(self, mro: list[_Class], name: str) -> tuple[_Class | None, Any]:
+        for klass in mro:
+            members = self._get_members(klass)
+            if name in members:
+                return klass, members[name]
+            if name in klass.annotations:
+                return klass, _ANNOTATION_ONLY
+        return None, None
+
+    def _violation(self, cls: _Class, member: _Member, violation: Violation) -> StaticViolation:
+        return StaticViolation(cls.module.path, member.lineno, violation)
+
+
+def check_paths(paths: Iterable[str | os.PathLike[str]], search_paths: Iterable[str | os.PathLike[str]] = ()) -> list[StaticViolation]:
+    """
+    Statically check the conformance of all `InterfaceMeta` classes in the
+    nominated source files (or directories), without importing them.
+
+    Args:
+        paths: The source files or directories to check.
+        search_paths: Additional source files or directories used only to
+            resolve class hierarchies (e.g. the sources of dependencies).
+
+    Returns:
+        The violations found, ordered by path and line number.
+    """
+    checker = StaticChecker()
+    for path in search_paths:
+        checker.add_path(path, report=False)
+    for path in paths:
+        checker.add_path(path)
+    return checker.check()
+
+
+def _verify_conformance(
+    name: str,
+    clsname: str,
+    member: _Member,
+    ref_clsname: str,
+    ref: _Member,
+    explicit_overrides: bool,
+    qualname: str | None = None,
+) -> Iterator[Violation]:
+    # Mirrors `verify_conformance` for statically parsed members
+    if member.force or ref.skip:
+        return
+
+    if member.kind == UNKNOWN:
+        # Functions wrapped by unrecognised decorators (which at runtime are
+        # typically functions or descriptors) are only checked for `@override`
+        if member.defined and explicit_overrides and not member.override:
+            yield Violation(MISSING_OVERRIDE, clsname, name, ref_clsname, qualname=qualname)
+        return
+
+    if member.type is not None and ref.type is not None and member.type is not ref.type:
+        if member.kind == PROPERTY and ref.kind != FUNCTION:
+            pass
+        elif member.kind in _FUNCTIONAL_KINDS:
+            yield Violation(TYPE_CHANGE, clsname, name, ref_clsname, (member.type, ref.type), qualname=qualname)
+
+    if (member.kind in _FUNCTIONAL_KINDS or member.kind == PROPERTY) and explicit_overrides and not member.override:
+        yield Violation(MISSING_OVERRIDE, clsname, name, ref_clsname, qualname=qualname)
+
+    if member.signature is not None and ref.signature is not None:
+        if not check_signatures_compatible(member.signature, ref.signature):
+            yield Violation(SIGNATURE_MISMATCH, clsname, name, ref_clsname, (member.signature, ref.signature), qualname=qualname)
+
+
+def _merge_mros(sequences: list[list[_Class]]) -> list[_Class]:
+    # C3 linearization (falling back to depth-first order for inconsistent hierarchies)
+    sequences = [list(seq) for seq in sequences if seq]
+    merged: list[_Class] = []
+    while sequences:
+        for seq in sequences:
+            head = seq[0]
+            if not any(head in other[1:] for other in sequences):
+                break
+        else:
+            for seq in sequences:
+                merged.extend(klass for klass in seq if klass not in merged)
+            return merged
+        merged.append(head)
+        sequences = [[klass for klass in seq if klass is not head] for seq in sequences]
+        sequences = [seq for seq in sequences if seq]
+    return merged
+
+
+def _get_module_name(path: Path) -> tuple[str, bool]:
+    path = path.resolve()
+    is_package = path.name == "__init__.py"
+    parts = [] if is_package else [path.stem]
+    parent = path.parent
+    while (parent / "__init__.py").exists():
+        parts.insert(0, parent.name)
+        parent = parent.parent
+    return ".".join(parts), is_package
+
+
+def _resolve_import(module: _Module, node: ast.ImportFrom) -> str:
+    if not node.level:
+        return node.module or ""
+    package = module.name if module.is_package else module.name.rpartition(".")[0]
+    for _ in range(node.level - 1):
+        package = package.rpartition(".")[0]
+    return f"{package}.{node.module}" if node.module else package
+
+
+def _iter_statements(body: list[ast.stmt]) -> Iterator[ast.stmt]:
+    # Include statements nested in (e.g.) `if TYPE_CHECKING:` and `try:` blocks
+    for stmt in body:
+        if isinstance(stmt, ast.If):
+            yield from _iter_statements(stmt.body)
+            yield from _iter_statements(stmt.orelse)
+        elif isinstance(stmt, ast.Try):
+            yield from _iter_statements(stmt.body)
+            for handler in stmt.handlers:
+                yield from _iter_statements(handler.body)
+            yield from _iter_statements(stmt.orelse)
+            yield from _iter_statements(stmt.finalbody)
+        elif isinstance(stmt, ast.With):
+            yield from _iter_statements(stmt.body)
+        else:
+            yield stmt
+
+
+def _get_bound_names(stmt: ast.stmt) -> Iterator[str]:
+    if isinstance(stmt, ast.FunctionDef | ast.AsyncFunctionDef):
+        yield stmt.name
+    elif isinstance(stmt, ast.Assign | ast.AnnAssign | ast.AugAssign):
+        for target in stmt.targets if isinstance(stmt, ast.Assign) else [stmt.target]:
+            for node in ast.walk(target):
+                if isinstance(node, ast.Name):
+                    yield node.id
+
+
+def _get_dotted_name(node: ast.expr) -> str | None:
+    if isinstance(node, ast.Subscript):  # e.g. `Generic[T]`
+        node = node.value
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        value = _get_dotted_name(node.value)
+        return f"{value}.{node.attr}" if value is not None else None
+    return None
+
+
+_NOT_LITERAL = object()
+
+
+def _literal(node: ast.expr) -> Any:
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in ("set", "frozenset") and not node.args:
+        return set()
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return _NOT_LITERAL
+
+
+def _get_value_member(name: str, value: ast.expr, lineno: int) -> _Member:
+    if isinstance(value, ast.Lambda):
+        return _Member(name, FUNCTION, lineno, type=types.FunctionType, signature=_get_arguments_signature(value.args))
+    literal = _literal(value)
+    if literal is _NOT_LITERAL:
+        return _Member(name, UNKNOWN, lineno)
+    return _Member(name, ATTRIBUTE, lineno, type=type(literal))
+
+
+def _update_config(cls: _Class, name: str, value: ast.expr) -> None:
+    if name.startswith("INTERFACE_"):
+        literal = _literal(value)
+        if literal is not _NOT_LITERAL:
+            cls.config[name] = literal
+
+
+def _get_signature(node: ast.FunctionDef | ast.AsyncFunctionDef) -> Signature:
+    return _get_arguments_signature(node.args, node.returns)
+
+
+def _get_arguments_signature(args: ast.arguments, returns: ast.expr | None = None) -> Signature:
+    parameters = []
+    positional = [*args.posonlyargs, *args.args]
+    defaults: list[ast.expr | None] = [None] * (len(positional) - len(args.defaults))
+    defaults.extend(args.defaults)
+    for i, (arg, default) in enumerate(zip(positional, defaults, strict=True)):
+        kind = Parameter.POSITIONAL_ONLY if i < len(args.posonlyargs) else Parameter.POSITIONAL_OR_KEYWORD
+        parameters.append(_get_parameter(arg, kind, default))
+    if args.vararg:
+        parameters.append(_get_parameter(args.vararg, Parameter.VAR_POSITIONAL))
+    for arg, kw_default in zip(args.kwonlyargs, args.kw_defaults, strict=True):
+        parameters.append(_get_parameter(arg, Parameter.KEYWORD_ONLY, kw_default))
+    if args.kwarg:
+        parameters.append(_get_parameter(args.kwarg, Parameter.VAR_KEYWORD))
+    return Signature(
+        parameters,
+        return_annotation=_Expression(ast.unparse(returns)) if returns is not None else Signature.empty,
+    )
+
+
+def _get_parameter(arg: ast.arg, kind: Any, default: ast.expr | None = None) -> Parameter:
+    value: Any = Parameter.empty
+    if default is not None:
+        value = _literal(default)
+        if value is _NOT_LITERAL:
+            value = _Expression(ast.unparse(default))
+    return Parameter(
+        arg.arg,
+        kind,
+        default=value,
+        annotation=_Expression(ast.unparse(arg.annotation)) if arg.annotation is not None else Parameter.empty,
+    )
@@ -0,0 +1,128 @@
+"""
+Bulk verification of the interfaces defined in packages.
+
+All submodules of the nominated packages are imported (in parallel, across a
+pool of worker processes), and every violation reported by `InterfaceMeta`
+while doing so is collected as a structured record. Since workers may import
+common modules, results are deduplicated across workers.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import json
+import logging
+import os
+import pkgutil
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from .reporting import collect_violations, logger
+
+
+def iter_submodules(package: str) -> Iterator[str]:
+    """
+    Iterate over the names of a package and all of its submodules, without
+    importing any of them.
+
+    Args:
+        package: The name of the package (or module).
+    """
+    spec = importlib.util.find_spec(package)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named `{package}`.", name=package)
+    yield package
+    if spec.submodule_search_locations:
+        yield from _iter_submodules(list(spec.submodule_search_locations), package)
+
+
+def _iter_submodules(paths: list[str], prefix: str) -> Iterator[str]:
+    for info in pkgutil.iter_modules(paths):
+        name = f"{prefix}.{info.name}"
+        yield name
+        if info.ispkg:
+            yield from _iter_submodules([os.path.join(info.module_finder.path, info.name)], name)  # type: ignore[union-attr]
+
+
+def verify_modules(modules: Iterable[str]) -> dict[str, list[dict[str, Any]]]:
+    """
+    Import the nominated modules, and collect all violations reported.
+
+    Production mode is disabled, and any deferred conformance checks are
+    run once all modules have been imported. Note that modules that have
+    already been imported are not re-imported, and so are not verified.
+
+    Args:
+        modules: The names of the modules to import.
+
+    Returns:
+        A dictionary with keys "violations" (the violations reported, as
+            returned by `Violation.as_dict`) and "errors" (the modules that
+            could not be imported, and why).
+    """
+    from ..interface import InterfaceMeta
+
+    production_mode = InterfaceMeta.is_production_mode()
+    InterfaceMeta.set_production_mode(False)
+    level = logger.level
+    logger.setLevel(logging.CRITICAL)  # Violations are collected rather than logged
+    errors: list[dict[str, str | None]] = []
+    try:
+        with collect_violations() as violations:
+            for module in modules:
+                try:
+                    importlib.import_module(module)
+                except (Exception, SystemExit) as e:
+                    errors.append({"module": module, "error": f"{type(e).__name__}: {e}"})
+            try:
+                InterfaceMeta.verify_pending()
+            except Exception as e:
+                errors.append({"module": None, "error": f"{type(e).__name__}: {e}"})
+    finally:
+        InterfaceMeta.set_production_mode(production_mode)
+        logger.setLevel(level)
+    return {
+        "violations": [violation.as_dict() for violation in violations],
+        "errors": errors,
+    }
+
+
+def verify_packages(packages: Iterable[str], jobs: int | None = None) -> dict[str, Any]:
+    """
+    Verify the conformance of all interfaces in the nominated packages.
+
+    Args:
+        packages: The names of the packages (or modules) to verify.
+        jobs: The number of worker processes to use (defaults to the number
+            of CPUs). If `1`, modules are imported in this process.
+
+    Returns:
+        A JSON-serialisable dictionary with keys "modules" (the number of
+            modules imported), "violations" and "errors" (see
+            `verify_modules`), with violations deduplicated across workers
+            (classes are distinguished by their module-qualified names).
+    """
+    modules = list(dict.fromkeys(module for package in packages for module in iter_submodules(package)))
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(modules)))
+
+    if jobs == 1:
+        results = [verify_modules(modules)]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(verify_modules, [modules[i::jobs] for i in range(jobs)]))
+
+    violations: dict[str, dict[str, Any]] = {}
+    errors: dict[str, dict[str, Any]] = {}
+    for result in results:
+        for violation in result["violations"]:
+            violations.setdefault(json.dumps(violation, sort_keys=True), violation)
+        for error in result["errors"]:
+            errors.setdefault(json.dumps(error, sort_keys=True), error)
+
+    return {
+        "modules": len(modules),
+        "violations": sorted(violations.values(), key=lambda v: (str(v["class"]), str(v["qualname"]), str(v["member"]), v["kind"], v["message"])),
+        "errors": sorted(errors.values(), key=lambda e: (str(e["module"]), e["error"])),
+    }
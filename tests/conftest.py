@@ -0,0 +1,9 @@
+import pytest
+
+from interface_meta.utils.reporting import reset_reported_violations
+
+
+@pytest.fixture(autouse=True)
+def _reset_reported_violations():
+    # Violations are only logged once per process; make tests independent.
+    reset_reported_violations()
@@ -1,4 +1,5 @@
-from interface_meta import InterfaceMeta, inherit_docs, skip
+from interface_meta import InterfaceMeta, inherit_docs, override, skip
+from interface_meta.utils.inspection import METADATA_ATTR, InterfaceMetadata, get_metadata
 
 
 def test_inherit_docs_wraps_method():
@@ -6,8 +7,7 @@ def test_inherit_docs_wraps_method():
     def my_method(self):
         pass
 
-    assert my_method._quirks_method == "_impl"
-    assert my_method._quirks_mro is False
+    assert get_metadata(my_method) == InterfaceMetadata(quirks_method="_impl", quirks_mro=False, has_quirks_method=True)
 
 
 def test_skip_marks_and_returns_function():
@@ -16,7 +16,20 @@ def test_skip_marks_and_returns_function():
 
     result = skip(my_method)
     assert result is my_method
-    assert result.__interface_meta_skip__ is True
+    assert get_metadata(result).skip is True
+
+
+def test_decorators_share_single_metadata_record():
+    @override(force=True)
+    @inherit_docs("_impl")
+    def my_method(self):
+        pass
+
+    metadata = my_method.__dict__[METADATA_ATTR]
+    # `__override__` is also set, as per `typing.override` (PEP 698)
+    assert list(my_method.__dict__) == [METADATA_ATTR, "__override__"]
+    assert my_method.__override__ is True
+    assert metadata == InterfaceMetadata(override=True, force=True, quirks_method="_impl", quirks_mro=True, has_quirks_method=True)
 
 
 def test_skip_is_honoured_by_interface_meta():
@@ -1,6 +1,15 @@
+import functools
+import gc
+import inspect
+import pydoc
+import threading
+from abc import abstractmethod
+from typing import ClassVar
+
 import pytest
 
 from interface_meta import InterfaceMeta
+from interface_meta.utils.conformance import has_pending_conformance
 
 
 class Base(metaclass=InterfaceMeta):
@@ -112,6 +121,30 @@ def test_raise_on_violation():
                 pass
 
 
+def test_partialmethod_conformance(caplog):
+    # `functools.partialmethod` members are checked using the signature of the
+    # partially applied method
+    class Base(metaclass=InterfaceMeta):
+        INTERFACE_EXPLICIT_OVERRIDES = False
+
+        def method(self, b):
+            pass
+
+    def _method(self, a, b):
+        return (a, b)
+
+    class Conforming(Base):
+        method = functools.partialmethod(_method, 1)
+
+    assert Conforming().method(2) == (1, 2)
+    assert "does not conform" not in caplog.text
+
+    class NonConforming(Base):
+        method = functools.partialmethod(_method, b=1)
+
+    assert "`NonConforming.method(self, a, *, b=1)` does not conform to interface `Base.method(self, b)`" in caplog.text
+
+
 def test_docstrings():
     assert SubBase.__doc__ == "SubBase class\n\nAttributes inherited from Base:\n    ATTRIBUTE (str): An attribute."
     assert SubBase.__init__.__doc__ == "Subclass Constructor"
@@ -121,3 +154,330 @@ def test_docstrings():
     assert SubBase.class_method.__doc__ == "Subclass Class Method"
     assert SubBase.split_method.__doc__ == "Split Method\n\nSubBase Quirks:\n    Subclass split_method quirks"
     assert SubBase.mro_documented.__doc__ == "Documentation in SubBase"
+
+
+def test_lazy_docstrings():
+    class LazyBase(Base):
+        """Base class"""
+
+        INTERFACE_LAZY_DOCS = True
+
+    class LazySubBase(LazyBase):
+        """SubBase class"""
+
+        @Base.override
+        def regular_method(self, a, b, c):
+            """Subclass Regular Method"""
+            return "regular_method"
+
+    assert "__doc__" in LazySubBase.__dict__
+    # Configuration lookups do not trigger rendering
+    assert LazySubBase.INTERFACE_LAZY_DOCS
+    assert type(LazySubBase.__dict__["__doc__"]).__name__ == "LazyDocs"
+    # Member lookups do not render documentation, nor hook attribute lookups
+    assert LazySubBase.regular_method.__doc__ == "Subclass Regular Method"
+    assert "__getattribute__" not in InterfaceMeta.__dict__
+
+    # `pydoc` bypasses the descriptor protocol on the class dictionary, and
+    # pending bases are rendered along with the class
+    assert object.__getattribute__(LazySubBase, "__doc__") == "SubBase class\n\nAttributes inherited from Base:\n    ATTRIBUTE (str): An attribute."
+    assert LazyBase.__dict__["__doc__"] == "Base class\n\nAttributes inherited from Base:\n    ATTRIBUTE (str): An attribute."
+    assert LazySubBase.regular_method.__doc__ == "Regular Method\n\nLazySubBase Quirks:\n    Subclass Regular Method"
+    assert inspect.getdoc(LazySubBase.regular_method) == "Regular Method\n\nLazySubBase Quirks:\n    Subclass Regular Method"
+    assert LazySubBase.__doc__ == "SubBase class\n\nAttributes inherited from Base:\n    ATTRIBUTE (str): An attribute."
+
+    class LazyHelp(LazyBase):
+        @Base.override
+        def regular_method(self, a, b, c):
+            """Help Regular Method"""
+
+    # `help()` reads the class docstring before documenting members
+    assert "LazyHelp Quirks:" in pydoc.render_doc(LazyHelp)
+
+    InterfaceMeta.render_docs()
+    assert "__getattribute__" not in InterfaceMeta.__dict__
+
+
+def test_deferred_conformance_checks(caplog):
+
+    class Base(metaclass=InterfaceMeta):
+        INTERFACE_CHECK_MODE = "deferred"
+
+        def __init__(self, a):
+            self.a = a
+
+        def method(self, a):
+            pass
+
+    class Child(Base):
+        def method(self, a, b):  # signature mismatch
+            pass
+
+    class Other(Base):
+        def __init__(self, a):
+            super().__init__(a * 2)
+
+        def method(self, a, b):  # signature mismatch
+            pass
+
+    assert "does not conform" not in caplog.text
+    assert has_pending_conformance(Base) and has_pending_conformance(Child)
+
+    # Instantiation runs pending checks, and restores `__init__`
+    assert Child(1).a == 1
+    assert "`Child.method(self, a, b)` does not conform" in caplog.text
+    assert not has_pending_conformance(Base) and not has_pending_conformance(Child)
+    assert "__init__" not in Child.__dict__
+    assert Child(2).a == 2
+
+    # Explicitly defined `__init__` methods are restored
+    caplog.clear()
+    InterfaceMeta.verify_pending()
+    assert "`Other.method(self, a, b)` does not conform" in caplog.text
+    assert not has_pending_conformance(Other)
+    assert Other.__dict__["__init__"].__qualname__.endswith("Other.__init__")
+    assert Other(3).a == 6
+
+
+def test_disabled_conformance_checks(caplog):
+    class Base(metaclass=InterfaceMeta):
+        INTERFACE_CHECK_MODE = "off"
+
+        def method(self, a):
+            pass
+
+    class Child(Base):
+        def method(self, a, b):
+            pass
+
+    Child()
+    assert caplog.text == ""
+
+
+def test_invalid_check_mode():
+    with pytest.raises(ValueError, match="Invalid `INTERFACE_CHECK_MODE`"):
+
+        class Base(metaclass=InterfaceMeta):
+            INTERFACE_CHECK_MODE = "sometimes"
+
+
+def test_production_mode(caplog):
+    assert InterfaceMeta.is_production_mode() is False
+
+    InterfaceMeta.set_production_mode()
+    try:
+
+        class Base(metaclass=InterfaceMeta):
+            def method(self, a):
+                """Base docs"""
+
+            @classmethod
+            def __register_implementation__(cls):
+                cls.registered = True
+
+        class Child(Base):
+            def method(self, a, b):
+                """Child docs"""
+
+    finally:
+        InterfaceMeta.set_production_mode(False)
+
+    assert Child.__interface__ is Base
+    assert Child.registered is True
+    assert Child.method.__doc__ == "Child docs"
+    assert caplog.text == ""
+
+
+def test_registry():
+    class Base(metaclass=InterfaceMeta):
+        INTERFACE_REGISTRY = True
+
+        @abstractmethod
+        def method(self):
+            pass
+
+        @classmethod
+        def __register_implementation__(cls):
+            # Implementations are registered before the hook is called
+            cls.registered = InterfaceMeta.get_registry(cls).get(cls.__name__) is cls
+
+    class Abstract(Base):
+        pass
+
+    class Concrete(Abstract):
+        INTERFACE_REGISTRY_KEYS = ("concrete", 1)
+
+        @Base.override
+        def method(self):
+            pass
+
+    registry = InterfaceMeta.get_registry(Concrete)
+    assert registry is InterfaceMeta.get_registry(Base)
+    assert registry.interface is Base
+    assert registry.implementations == (Abstract, Concrete)
+    assert registry.concrete == (Concrete,)
+    assert registry["Concrete"] is registry["concrete"] is registry[1] is Concrete
+    assert "Base" not in registry
+    assert Concrete.registered is True
+
+    del Concrete
+    gc.collect()
+    assert registry.concrete == ()
+    assert registry.get("concrete") is None
+
+    class Unregistered(metaclass=InterfaceMeta):
+        pass
+
+    assert InterfaceMeta.get_registry(Unregistered) is None
+
+
+def test_concurrent_class_creation(caplog):
+    class Base(metaclass=InterfaceMeta):
+        INTERFACE_CHECK_MODE = "deferred"
+
+        def method(self, a):
+            """Base docs."""
+
+        def shared(self):
+            """Shared docs."""
+
+    def shared(self):
+        """Shared quirks."""
+
+    barrier = threading.Barrier(8)
+    created: dict[int, list[type]] = {}
+
+    def create(thread):
+        barrier.wait()
+        created[thread] = [
+            type(
+                f"Impl_{thread}_{i}",
+                (Base,),
+                {"method": InterfaceMeta.override(lambda self, a: None), "shared": shared},
+            )
+            for i in range(25)
+        ]
+        barrier.wait()
+        for cls in created[thread]:
+            cls()
+
+    threads = [threading.Thread(target=create, args=(thread,)) for thread in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    classes = [cls for thread in sorted(created) for cls in created[thread]]
+    assert len(classes) == 200
+    assert all(not has_pending_conformance(cls) for cls in classes)
+    # The original docs of the shared function are never lost to a concurrent render
+    assert shared.__doc_orig__ == "Shared quirks."
+    assert shared.__doc__.startswith("Shared docs.\n\nImpl_")
+    assert shared.__doc__.count("Shared") == 2
+    assert caplog.text.count("without using the `@override` decorator") == 200
+
+
+def test_slots(caplog):
+    class Base(metaclass=InterfaceMeta):
+        INTERFACE_SLOTS = True
+
+        name: str
+        value: int = 0
+        counter: ClassVar[int]
+        registry: "ClassVar[dict]"
+
+        def method(self):
+            pass
+
+    class Mixin:
+        __slots__ = ()
+
+    class Impl(Base, Mixin):
+        extra: float
+
+        @Base.override
+        def method(self):
+            pass
+
+    class Child(Impl):
+        name = "child"
+
+    assert Base.__slots__ == ("name",)
+    assert Impl.__slots__ == ("extra",)
+    assert Child.__slots__ == ()
+
+    impl = Impl()
+    assert not hasattr(impl, "__dict__")
+    impl.name, impl.extra = "impl", 1.0
+    assert (impl.name, impl.extra, impl.value) == ("impl", 1.0, 0)
+    with pytest.raises(AttributeError):
+        impl.undeclared = True
+
+    # Generated slots are treated as declared (but not assigned) attributes
+    class Other(Impl):
+        @Base.override
+        def extra(self):
+            pass
+
+    assert caplog.text == ""
+
+    class Unslotted(metaclass=InterfaceMeta):
+        name: str
+
+    assert "__slots__" not in Unslotted.__dict__
+
+
+def test_check_annotations(caplog):
+    from interface_meta.utils.inspection import TYPE_HINTS_CACHE, get_functional_type_hints
+    from interface_meta.utils.reporting import collect_violations
+
+    class Base(metaclass=InterfaceMeta):
+        def method(self, a: int, b: "float", c: list[int] | None = None) -> object:
+            pass
+
+        def unresolvable(self, a: "Undefined") -> None:  # noqa: F821
+            pass
+
+    # Classes that do not opt in do not resolve type hints
+    TYPE_HINTS_CACHE.clear()
+
+    class Unchecked(Base):
+        @Base.override
+        def method(self, a: str, b: float, c: list[int] | None = None) -> int:
+            pass
+
+    assert TYPE_HINTS_CACHE.info().currsize == 0
+    assert caplog.text == ""
+
+    class Checked(Base):
+        INTERFACE_CHECK_ANNOTATIONS = True
+
+        @Base.override
+        def method(self, a: object, b: float, c: "list[int] | None" = None) -> int:
+            pass
+
+        @Base.override
+        def unresolvable(self, a: int) -> None:
+            pass
+
+    # Unresolvable hints are skipped (and the failure cached, so that hints
+    # are evaluated at most once)
+    assert caplog.text == ""
+    assert TYPE_HINTS_CACHE.info().currsize == 3
+    hits = TYPE_HINTS_CACHE.info().hits
+    assert get_functional_type_hints(Base.unresolvable) is None
+    assert TYPE_HINTS_CACHE.info().hits == hits + 1
+
+    with collect_violations() as violations:
+
+        class Mismatched(Checked):
+            @Base.override
+            def method(self, a: int, b: str, c=None) -> str:
+                pass
+
+    (violation,) = violations
+    assert violation.kind == "annotation_mismatch"
+    assert violation.message == (
+        "Annotations of `Mismatched.method` do not conform to interface `Checked.method`: "
+        "`a` is annotated as `int` instead of `object`, `b` is annotated as `str` instead of `float`, `return` is annotated as `str` instead of `int`."
+    )
@@ -0,0 +1,58 @@
+import gc
+
+from interface_meta.utils.caching import WeakLRUCache
+
+
+class Key:
+    pass
+
+
+def test_weak_lru_cache_get_set():
+    cache = WeakLRUCache(maxsize=2)
+    key = Key()
+
+    assert cache.get(key) is None
+    cache.set(key, "value")
+    assert cache.get(key) == "value"
+    assert cache.info() == (1, 1, 2, 1)
+
+
+def test_weak_lru_cache_evicts_least_recently_used():
+    cache = WeakLRUCache(maxsize=2)
+    a, b, c = Key(), Key(), Key()
+
+    cache.set(a, "a")
+    cache.set(b, "b")
+    cache.get(a)
+    cache.set(c, "c")
+
+    assert cache.get(a) == "a"
+    assert cache.get(b) is None
+    assert cache.get(c) == "c"
+
+
+def test_weak_lru_cache_evicts_collected_keys():
+    cache = WeakLRUCache()
+    key = Key()
+    cache.set(key, "value")
+    assert len(cache) == 1
+
+    del key
+    gc.collect()
+    assert len(cache) == 0
+
+
+def test_weak_lru_cache_ignores_unreferenceable_keys():
+    cache = WeakLRUCache()
+    cache.set(1, "value")
+    assert cache.get(1) is None
+    assert len(cache) == 0
+
+
+def test_weak_lru_cache_clear():
+    cache = WeakLRUCache()
+    key = Key()
+    cache.set(key, "value")
+    cache.get(key)
+    cache.clear()
+    assert cache.info() == (0, 0, 4096, 0)
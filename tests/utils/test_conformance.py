@@ -3,12 +3,23 @@ import logging
 import pytest
 
 from interface_meta.utils.conformance import (
+    _COMPATIBILITY_MEMO,
+    check_fingerprints_compatible,
+    check_hints_compatible,
     check_signatures_compatible,
     verify_conformance,
     verify_not_overridden,
     verify_signature,
 )
-from interface_meta.utils.inspection import set_explicit_override, signature
+from interface_meta.utils.inspection import (
+    FINGERPRINT_CACHE,
+    get_functional_fingerprint,
+    get_functional_wrapper,
+    get_signature_fingerprint,
+    has_same_signature,
+    set_explicit_override,
+    signature,
+)
 
 
 def a(a):
@@ -87,6 +98,94 @@ def test_signature_checking():
         assert check_signatures_compatible(signature(impl), signature(ref)) is solution
 
 
+class ElementWise:
+    # Mimics array-like objects, whose comparisons are element-wise
+    def __eq__(self, other):
+        return self
+
+    def __bool__(self):
+        raise ValueError("The truth value of an array is ambiguous.")
+
+    __hash__ = None
+
+
+def test_signature_checking_defaults():
+    shared, distinct = ElementWise(), ElementWise()
+
+    def impl(self, a=shared, b=(1, 2), c=1.0):
+        pass
+
+    def ref(self, a=shared, b=(1, 2), c=1):
+        pass
+
+    def other(self, a=distinct, b=(1, 2), c=1):
+        pass
+
+    assert get_signature_fingerprint(signature(impl)) == get_signature_fingerprint(signature(impl))
+    assert check_signatures_compatible(signature(impl), signature(ref)) is True
+    assert check_signatures_compatible(signature(other), signature(ref)) is False
+    assert check_signatures_compatible(signature(other), signature(other)) is True
+
+
+def test_signature_checking_memoized():
+    def make_method():
+        def method(self, a, b=None, c=1):
+            pass
+
+        return method
+
+    def ref(self, a, b=None):
+        pass
+
+    _COMPATIBILITY_MEMO.clear()
+    for _ in range(10):
+        verify_signature("method", "Impl", make_method(), "Ref", ref, raise_on_violation=True)
+    assert len(_COMPATIBILITY_MEMO) == 1
+
+    # Fingerprints referencing arbitrary default values are not memoized (so
+    # that the memo does not keep those values alive)
+    sentinel = object()
+
+    def with_object_default(self, a, b=sentinel):
+        pass
+
+    assert check_fingerprints_compatible(get_signature_fingerprint(signature(with_object_default)), get_signature_fingerprint(signature(ref))) is False
+    assert len(_COMPATIBILITY_MEMO) == 1
+
+
+def test_same_signature_fast_path():
+    def method(self, a, b=1):
+        pass
+
+    def other(self, a, b=1):
+        pass
+
+    copy = get_functional_wrapper(method)
+    assert has_same_signature(method, method)
+    assert has_same_signature(copy, classmethod(method))
+    assert not has_same_signature(method, other)
+    assert not has_same_signature(get_functional_wrapper(method, copy_function=False), get_functional_wrapper(other, copy_function=False))
+
+    FINGERPRINT_CACHE.clear()
+    verify_signature("method", "Impl", copy, "Ref", method, raise_on_violation=True)
+    assert FINGERPRINT_CACHE.info().currsize == 0
+    assert get_functional_fingerprint(copy) == get_functional_fingerprint(other)
+
+
+def test_check_hints_compatible():
+    from collections.abc import Sequence
+    from typing import Any
+
+    assert check_hints_compatible(int, int)
+    assert check_hints_compatible(int | None, None | int)
+    assert check_hints_compatible(Any, int) and check_hints_compatible(int, Any)
+    assert check_hints_compatible(object, int)
+    assert not check_hints_compatible(int, object)
+    assert check_hints_compatible(bool, int, covariant=True)
+    assert not check_hints_compatible(int, bool, covariant=True)
+    assert not check_hints_compatible(list[int], Sequence[int])
+
+
 # --- verify_conformance type-mismatch branches ---
 
 
@@ -148,3 +247,67 @@ def test_verify_not_overridden_warns_when_override_set(caplog):
     with caplog.at_level(logging.WARNING):
         verify_not_overridden("my_method", "MyClass", my_method)
     assert "claims to override interface method" in caplog.text
+
+
+# --- conformance cache ---
+
+
+def test_verify_conformance_cached(caplog):
+    from interface_meta import InterfaceMeta, override
+    from interface_meta.utils.conformance import CONFORMANCE_CACHE
+
+    class Base(metaclass=InterfaceMeta):
+        def method(self, a):
+            pass
+
+    @override
+    def method(self, a):
+        pass
+
+    def bad_method(self, a, b):
+        pass
+
+    CONFORMANCE_CACHE.clear()
+    for i in range(3):
+        InterfaceMeta(f"Child{i}", (Base,), {"method": method})
+    assert CONFORMANCE_CACHE.info().hits == 2
+    assert CONFORMANCE_CACHE.info().currsize == 1
+
+    # Non-conforming members are always checked (and reported)
+    with caplog.at_level(logging.WARNING):
+        for i in range(2):
+            InterfaceMeta(f"Bad{i}", (Base,), {"method": bad_method})
+    assert CONFORMANCE_CACHE.info().currsize == 1
+    assert caplog.text.count("does not conform") == 2
+
+
+def test_verify_conformance_attributes():
+    from dataclasses import dataclass
+
+    from interface_meta import InterfaceMeta
+
+    @dataclass
+    class Unhashable:
+        x: int = 1
+
+    class NoWeakref:
+        __slots__ = ()
+
+    class AlwaysEqual:
+        def __eq__(self, other):
+            return True
+
+        __hash__ = object.__hash__
+
+    class Base(metaclass=InterfaceMeta):
+        cfg = Unhashable()
+        slotted = NoWeakref()
+        equal = AlwaysEqual()
+
+    class Impl(Base):
+        cfg = Unhashable(2)
+        slotted = NoWeakref()
+        equal = AlwaysEqual()
+
+    assert Impl.cfg == Unhashable(2)
+    assert isinstance(Impl.slotted, NoWeakref)
@@ -0,0 +1,97 @@
+import importlib
+import sys
+import textwrap
+
+import pytest
+
+from interface_meta.__main__ import main
+from interface_meta.utils import doc_cache
+from interface_meta.utils.doc_cache import build_doc_cache, load_doc_cache
+
+SOURCE = textwrap.dedent(
+    '''
+    from interface_meta import InterfaceMeta, override
+
+
+    class Base(metaclass=InterfaceMeta):
+        """
+        The base interface.
+        """
+
+        def method(self, a):
+            """
+            Do something.
+            """
+
+        def other(self):
+            """
+            Do something else.
+            """
+
+
+    class Impl(Base):
+        """
+        An implementation.
+        """
+
+        @override
+        def method(self, a):
+            """
+            With quirks.
+            """
+    '''
+)
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    (tmp_path / "doccache_pkg").mkdir()
+    (tmp_path / "doccache_pkg" / "__init__.py").write_text("")
+    (tmp_path / "doccache_pkg" / "interfaces.py").write_text(SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield tmp_path
+    load_doc_cache(None)
+    doc_cache._MODULE_HASHES.clear()
+    for name in list(sys.modules):
+        if name.startswith("doccache_pkg"):
+            del sys.modules[name]
+
+
+def _reimport():
+    del sys.modules["doccache_pkg.interfaces"]
+    doc_cache._MODULE_HASHES.clear()
+    return importlib.import_module("doccache_pkg.interfaces")
+
+
+def test_doc_cache(package):
+    path = package / "docs.cache"
+    assert build_doc_cache(["doccache_pkg"], path) == 2
+    live = importlib.import_module("doccache_pkg.interfaces")
+    expected = (live.Impl.__doc__, live.Impl.method.__doc__, live.Impl.other.__doc__)
+
+    cache = load_doc_cache(path)
+    cached = _reimport()
+    assert cache.hits == 2
+    assert cache.misses == 0
+    assert (cached.Impl.__doc__, cached.Impl.method.__doc__, cached.Impl.other.__doc__) == expected
+    assert "With quirks." in cached.Impl.method.__doc__
+    assert cached.Impl.method.__doc_orig__.strip() == "With quirks."
+
+
+def test_doc_cache_stale(package):
+    path = package / "docs.cache"
+    build_doc_cache(["doccache_pkg"], path)
+    (package / "doccache_pkg" / "interfaces.py").write_text(SOURCE.replace("With quirks.", "With new quirks."))
+
+    cache = load_doc_cache(path)
+    updated = _reimport()
+    assert cache.hits == 0
+    assert cache.misses == 2
+    assert "With new quirks." in updated.Impl.method.__doc__
+
+
+def test_build_doc_cache_cli(package, capsys):
+    path = package / "docs.cache"
+    assert main(["build-doc-cache", "doccache_pkg", "-o", str(path)]) == 0
+    assert "Wrote documentation for 2 classes" in capsys.readouterr().out
+    assert path.exists()
@@ -55,3 +55,161 @@ def test_update_docs_quirks_method_appended_to_existing_class_docs():
     # Child's public_method docs should combine its own + _impl quirks
     assert Child.public_method.__doc__ is not None
     assert "Child impl docs" in Child.public_method.__doc__
+
+
+# --- documentation chains ---
+
+
+def test_doc_chains_reused_by_subclasses():
+    from interface_meta.utils.docs import get_doc_chains
+
+    class Base(metaclass=InterfaceMeta):
+        def method(self):
+            """Base docs"""
+
+    class Child(Base):
+        @Base.override
+        def method(self):
+            """Child docs"""
+
+    class GrandChild(Child):
+        pass
+
+    chains = get_doc_chains(Child)
+    assert chains["method"] == ((Base, Base.__dict__["method"]), (Child, Child.__dict__["method"]))
+    assert get_doc_chains(GrandChild) is chains
+    assert GrandChild.method.__doc__ == "Base docs\n\nChild Quirks:\n    Child docs"
+
+
+def test_doc_chains_invalidated_on_assignment():
+    from interface_meta.utils.docs import get_doc_chains
+
+    class Base(metaclass=InterfaceMeta):
+        def run(self):
+            """Old run docs."""
+
+    class Mid(Base):
+        @Base.override
+        @Base.inherit_docs("_quirks")
+        def run(self):
+            pass
+
+        def _quirks(self):
+            """Mid quirks."""
+
+    def run(self):
+        """New run docs."""
+
+    Base.run = run
+    assert get_doc_chains(Mid)["run"][0] == (Base, run)
+
+    class Sub(Mid):
+        @Base.override
+        def run(self):
+            """Sub docs."""
+
+    assert Sub.run.__doc__ == "New run docs.\n\nSub Quirks:\n    Sub docs."
+
+    del Mid._quirks
+    assert Mid.__dict__["__interface_quirked_names__"] is None
+
+
+def test_doc_join_caches_cleaned_fragments():
+    from interface_meta.utils.docs import _dedent, _render_section, clear_docs_cache
+
+    clear_docs_cache()
+    for _ in range(3):
+        assert doc_join("    Docs.\n", ["Section:", "Body"]) == "Docs.\n\nSection:\n    Body"
+    assert _dedent.cache_info().hits == 4
+    assert _render_section.cache_info().hits == 2
+
+    # Changed documentation is never served from the cache
+    assert doc_join("    Other docs.\n") == "Other docs."
+
+
+def test_rendered_docs_deduplicated():
+    from interface_meta.utils.docs import clear_docs_cache, dedup_info
+
+    class Base(metaclass=InterfaceMeta):
+        @InterfaceMeta.inherit_docs("_quirks", mro=True)
+        def method(self):
+            """Base docs"""
+
+        def _quirks(self):
+            pass
+
+    class Impl(Base):
+        @Base.override
+        @Base.inherit_docs("_quirks", mro=True)
+        def method(self):
+            """Impl docs"""
+
+    clear_docs_cache()
+    siblings = [InterfaceMeta(f"Sibling{i}", (Impl,), {}) for i in range(3)]
+
+    # Identical documentation is rendered once, and carried by a shared wrapper
+    wrapper = siblings[0].__dict__["method"]
+    assert wrapper is not Impl.__dict__["method"]
+    assert all(sibling.__dict__["method"] is wrapper for sibling in siblings)
+    assert wrapper.__doc__ == "Base docs\n\nImpl Quirks:\n    Impl docs"
+    assert Impl.method.__doc__ == "Base docs\n\nImpl Quirks:\n    Impl docs"
+
+    info = dedup_info()
+    assert (info.wrappers_created, info.wrappers_reused) == (1, 2)
+    assert info.docs_reused == 2
+    assert info.bytes_saved > 0
+
+    # Differing documentation results in a distinct wrapper
+    class Other(Impl):
+        @Base.override
+        def _quirks(self):
+            """Other quirks"""
+
+    assert Other.__dict__["method"] is not wrapper
+    assert Other.method.__doc__.endswith("Other Quirks:\n    Other quirks")
+    assert wrapper.__doc__ == "Base docs\n\nImpl Quirks:\n    Impl docs"
+
+    clear_docs_cache()
+    assert dedup_info() == (0, 0, 0, 0, 0)
+
+
+def test_shared_wrappers_copied_on_write():
+    from interface_meta.utils.docs import update_docs
+    from interface_meta.utils.inspection import has_forced_override, is_shared_member, set_functional_docs, set_skip, should_skip
+
+    class Base(metaclass=InterfaceMeta):
+        @InterfaceMeta.inherit_docs("_quirks", mro=True)
+        def method(self):
+            """Base docs"""
+
+        def _quirks(self):
+            pass
+
+    class Impl(Base):
+        @Base.override
+        @Base.inherit_docs("_quirks", mro=True)
+        def method(self):
+            """Impl docs"""
+
+    siblings = [InterfaceMeta(f"Sibling{i}", (Impl,), {}) for i in range(2)]
+    wrapper = siblings[0].__dict__["method"]
+    assert siblings[1].__dict__["method"] is wrapper
+    assert is_shared_member(wrapper) and not is_shared_member(Impl.__dict__["method"])
+
+    # Shared wrappers are copied rather than mutated
+    skipped = set_skip(wrapper)
+    assert skipped is not wrapper and not is_shared_member(skipped)
+    assert should_skip(skipped) and not should_skip(wrapper)
+    documented = set_functional_docs(wrapper, "Other docs")
+    assert documented is not wrapper and documented.__doc__ == "Other docs"
+    assert wrapper.__doc__ == "Base docs\n\nImpl Quirks:\n    Impl docs"
+
+    assert Base.override(wrapper, force=True) is not wrapper
+    assert not has_forced_override(wrapper)
+
+    # Re-rendering the documentation of one sibling does not mutate the wrapper
+    # it shares with the others
+    sibling = siblings[0]
+    update_docs(sibling, sibling.__name__, sibling.__bases__, dict(sibling.__dict__))
+    assert sibling.__dict__["method"] is not wrapper
+    assert siblings[1].__dict__["method"] is wrapper
@@ -0,0 +1,57 @@
+import pytest
+
+from interface_meta import InterfaceMeta
+from interface_meta.utils import events
+
+
+@pytest.fixture
+def received():
+    received = []
+    for event in events.EVENTS:
+        events.subscribe(event, received.append)
+    yield received
+    for event in events.EVENTS:
+        events.unsubscribe(event, received.append)
+
+
+def test_events_emitted_during_class_creation(received):
+    class Base(metaclass=InterfaceMeta):
+        def method(self, a):
+            """Docs"""
+
+    class Child(Base):
+        def method(self, a):  # missing @override
+            pass
+
+    child_events = [event for event in received if event.cls is Child]
+    assert [event.event for event in child_events] == [
+        events.MEMBER_VERIFIED,
+        events.DOCS_RENDERED,
+        events.REGISTERED,
+        events.CLASS_CREATED,
+    ]
+
+    member_verified, docs_rendered, _, class_created = child_events
+    assert member_verified.details["name"] == "method"
+    assert docs_rendered.count == 1
+    assert class_created.count == 1
+    assert set(class_created.details["timings"]) == {"conformance", "docs", "registration"}
+    assert class_created.duration >= 0
+
+    (violation,) = [event for event in received if event.event == events.VIOLATION]
+    assert "without using the `@override` decorator" in violation.details["violation"].message
+
+
+def test_events_subscription():
+    def callback(event):
+        pass
+
+    assert not events.has_subscribers(events.CLASS_CREATED)
+    events.subscribe(events.CLASS_CREATED, callback)
+    assert events.has_subscribers(events.CLASS_CREATED)
+    assert events.has_subscribers()
+    events.unsubscribe(events.CLASS_CREATED, callback)
+    assert not events.has_subscribers()
+
+    with pytest.raises(ValueError, match="Unknown event"):
+        events.subscribe("unknown", callback)
@@ -1,5 +1,10 @@
+import functools
+
 from interface_meta import override
 from interface_meta.utils.inspection import (
+    SIGNATURE_CACHE,
+    MemberAdapter,
+    _get_code_fingerprint,
     _get_member,
     functional_delattr,
     functional_getattr,
@@ -7,10 +12,14 @@ from interface_meta.utils.inspection import (
     functional_setattr,
     get_class_attr_docs,
     get_functional_docs,
+    get_functional_fingerprint,
     get_functional_signature,
     get_functional_wrapper,
+    get_member_adapter,
+    get_metadata,
     get_quirk_docs_method,
     get_quirk_docs_mro,
+    get_signature_fingerprint,
     has_class_attr_docs,
     has_explicit_override,
     has_forced_override,
@@ -19,6 +28,7 @@ from interface_meta.utils.inspection import (
     has_updatable_docs,
     is_functional_member,
     is_method,
+    register_member_adapter,
     set_functional_docs,
     set_quirk_docs_method,
     set_quirk_docs_mro,
@@ -101,27 +111,80 @@ def test_get_functional_wrapper():
 
     for functional in [PROPERTY, METHOD, CLASS_METHOD, STATIC_METHOD]:
         wrapped = get_functional_wrapper(functional)
-        for attr in [
-            "__doc__",
-            "_quirks_method",
-            "_quirks_mro",
-            "__override__",
-            "__override_force__",
-        ]:
-            if functional_hasattr(functional, attr):
-                assert functional_getattr(wrapped, attr) == functional_getattr(functional, attr)
+        assert functional_getattr(wrapped, "__doc__") == functional_getattr(functional, "__doc__")
+        assert get_metadata(wrapped) is get_metadata(functional)
 
         if functional is PROPERTY:
             assert wrapped.fset is PROPERTY.fset
             assert wrapped.fdel is PROPERTY.fdel
 
 
+def test_get_functional_wrapper_copies_functions():
+    def method(self, a, b=1, *, c=2):
+        """Docs"""
+        return (a, b, c)
+
+    wrapped = get_functional_wrapper(method)
+    assert wrapped is not method
+    assert wrapped.__code__ is method.__code__
+    assert wrapped.__defaults__ is method.__defaults__
+    assert wrapped.__kwdefaults__ is method.__kwdefaults__
+    assert wrapped.__doc__ == "Docs"
+    assert wrapped.__qualname__ == method.__qualname__
+    assert wrapped(None, 0) == (0, 1, 2)
+
+    wrapped = get_functional_wrapper(method, copy_function=False)
+    assert wrapped.__code__ is not method.__code__
+    assert wrapped.__wrapped__ is method
+
+    for functional in [CLASS_METHOD, STATIC_METHOD]:
+        assert _get_member(get_functional_wrapper(functional)).__code__ is _get_member(functional).__code__
+    assert get_functional_wrapper(PROPERTY).fget.__code__ is PROPERTY.fget.__code__
+
+
 def test_get_functional_signature():
     assert get_functional_signature(METHOD) == signature(METHOD)
     assert get_functional_signature(CLASS_METHOD) == signature(CLASS_METHOD.__get__(object, object).__func__)
     assert get_functional_signature(STATIC_METHOD) == signature(STATIC_METHOD.__get__(object, object))
 
 
+def test_get_functional_signature_cached():
+    def method(self, a, b=1):
+        pass
+
+    SIGNATURE_CACHE.clear()
+    sig = get_functional_signature(method)
+    assert get_functional_signature(method) is sig
+    assert get_functional_signature(classmethod(method)) is sig
+    assert SIGNATURE_CACHE.info().hits == 2
+    assert SIGNATURE_CACHE.info().misses == 1
+
+
+def test_get_functional_fingerprint():
+    default = []
+
+    def method(a, b=default, /, c=1, *args, d, e=None, **kwargs):
+        pass
+
+    def simple(self):
+        pass
+
+    for function in (method, simple, lambda *, a: None, lambda a=1.5, *args: None):
+        assert _get_code_fingerprint(function) == get_signature_fingerprint(signature(function))
+
+    fingerprint = get_functional_fingerprint(classmethod(method))
+    assert fingerprint == get_signature_fingerprint(signature(method))
+    assert hash(fingerprint) == hash(get_functional_fingerprint(method))
+    assert [param[0] for param in fingerprint] == ["a", "b", "c", "args", "d", "e", "kwargs"]
+    assert fingerprint[1][2].value is default
+    assert fingerprint[2][2] == 1
+
+    # Fingerprints honour signatures overridden by wrappers
+    wrapper = get_functional_wrapper(method, copy_function=False)
+    assert get_functional_fingerprint(wrapper) == fingerprint
+    assert _get_code_fingerprint(wrapper) != fingerprint
+
+
 def test_functional_attrs():
     assert functional_getattr(PROPERTY, "__doc__") == "Property Docs"
     assert functional_getattr(METHOD, "__doc__") == "Method Docs"
@@ -150,6 +213,16 @@ def test_overrides():
     assert has_forced_override(STATIC_METHOD) is True
 
 
+def test_typing_override_compatibility():
+    # `typing.override` (PEP 698) sets `__override__` on the function
+    def method(self):
+        pass
+
+    method.__override__ = True
+    assert has_explicit_override(method) is True
+    assert has_forced_override(method) is False
+
+
 def test_has_updatable_docs():
     assert not has_updatable_docs(ATTRIBUTE)
     assert has_updatable_docs(PROPERTY)
@@ -209,3 +282,85 @@ def test_skip():
     assert should_skip(my_method)
     set_skip(my_method, False)
     assert not should_skip(my_method)
+
+
+def test_functools_members():
+    class Members:
+        def method(self, a, b):
+            """Method Docs"""
+            return (a, b)
+
+        partial_method = functools.partialmethod(method, 1)
+
+        @functools.cached_property
+        def cached(self):
+            """Cached Docs"""
+            return 1
+
+        @functools.singledispatchmethod
+        def dispatch(self, value):
+            """Dispatch Docs"""
+            return "default"
+
+        @dispatch.register
+        def _(self, value: int):
+            return "int"
+
+    partial_method = Members.__dict__["partial_method"]
+    assert is_functional_member(partial_method)
+    assert not has_updatable_docs(partial_method)
+    assert _get_member(partial_method) is Members.method
+    assert str(get_functional_signature(partial_method)) == "(self, b)"
+    wrapped = get_functional_wrapper(partial_method)
+    assert isinstance(wrapped, functools.partialmethod) and wrapped.args == (1,)
+    assert wrapped.__get__(Members())(2) == (1, 2)
+
+    cached = Members.__dict__["cached"]
+    assert not is_functional_member(cached)
+    assert has_updatable_docs(cached)
+    assert get_functional_docs(cached) == "Cached Docs"
+    wrapped = get_functional_wrapper(cached)
+    assert isinstance(wrapped, functools.cached_property)
+    assert wrapped.func is not cached.func and wrapped.attrname == "cached"
+
+    dispatch = Members.__dict__["dispatch"]
+    assert is_functional_member(dispatch)
+    assert has_updatable_docs(dispatch)
+    assert get_functional_docs(dispatch) == "Dispatch Docs"
+    assert str(get_functional_signature(dispatch)) == "(self, value)"
+    wrapped = get_functional_wrapper(dispatch)
+    set_functional_docs(wrapped, "New Docs")
+    Members.dispatch = wrapped
+    assert Members.dispatch.__doc__ == "New Docs"
+    assert Members().dispatch(1) == "int"
+    assert Members().dispatch("1") == "default"
+    assert get_functional_docs(dispatch, orig=False) == "Dispatch Docs"
+
+
+def test_register_member_adapter():
+    class Descriptor:
+        def __init__(self, func):
+            self.func = func
+
+        def __get__(self, instance, owner=None):
+            return self.func.__get__(instance, owner)
+
+    class SubDescriptor(Descriptor):
+        pass
+
+    def method(self, a):
+        """Docs"""
+
+    # Resolutions for unregistered types are memoized until an adapter is registered
+    assert get_member_adapter(Descriptor(method)) is get_member_adapter(1)
+    assert get_member_adapter(SubDescriptor(method)) is get_member_adapter(1)
+    assert not is_functional_member(Descriptor(method))
+
+    adapter = MemberAdapter(unwrap=lambda member: member.func, rewrap=lambda member, wrapper: type(member)(wrapper))
+    register_member_adapter(Descriptor, adapter)
+    for member in (Descriptor(method), SubDescriptor(method)):
+        assert get_member_adapter(member) is adapter
+        assert is_functional_member(member)
+        assert get_functional_signature(member) == signature(method)
+        wrapped = get_functional_wrapper(member)
+        assert type(wrapped) is type(member) and wrapped.func.__doc__ == "Docs"
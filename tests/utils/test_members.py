@@ -0,0 +1,117 @@
+from interface_meta import InterfaceMeta
+from interface_meta.utils import members
+from interface_meta.utils.members import (
+    INDEX_ATTR,
+    MemberOrigin,
+    get_inherited_member_index,
+    get_member_index,
+)
+
+
+class Base(metaclass=InterfaceMeta):
+    declared: int
+
+    def method(self):
+        pass
+
+    def other(self):
+        pass
+
+
+class Child(Base):
+    @Base.override
+    def method(self):
+        pass
+
+
+class Empty(Child):
+    pass
+
+
+class Mixin:
+    def other(self):
+        pass
+
+
+class Multiple(Mixin, Child):
+    pass
+
+
+def test_member_index():
+    index = get_member_index(Child)
+    assert index["method"] == MemberOrigin(Child, Child.__dict__["method"], False)
+    assert index["other"] == MemberOrigin(Base, Base.__dict__["other"], False)
+    assert index["declared"] == MemberOrigin(Base, None, True)
+    assert not any(key.startswith("__") and key.endswith("__") for key in index)
+
+
+def test_member_index_shared_when_no_new_members():
+    assert get_member_index(Empty) is get_member_index(Child)
+    assert get_inherited_member_index(Empty) is get_member_index(Child)
+
+
+def test_member_index_multiple_inheritance():
+    index = get_member_index(Multiple)
+    assert index["other"].owner is Mixin
+    assert index["method"].owner is Child
+
+
+def test_member_index_value_overrides_annotation():
+    class Annotated:
+        declared: int = 1
+
+    assert get_member_index(Annotated)["declared"] == MemberOrigin(Annotated, 1, False)
+
+
+def test_member_index_invalidated_on_assignment(caplog):
+    class Interface(metaclass=InterfaceMeta):
+        def method(self):
+            pass
+
+    class Impl(Interface):
+        pass
+
+    # Members added (or replaced) after class creation are visible to the
+    # indices of subclasses
+    def added(self):
+        pass
+
+    Interface.added = added
+    assert get_member_index(Impl)["added"] == MemberOrigin(Interface, added, False)
+
+    class Later(Impl):
+        @Interface.override
+        def added(self):
+            pass
+
+    assert "no such method exists" not in caplog.text
+
+    del Interface.added
+    assert "added" not in get_member_index(Impl)
+    assert get_member_index(Impl) is get_member_index(Impl)
+
+
+def test_member_index_not_stored_if_invalidated_while_computed(monkeypatch):
+    class Interface(metaclass=InterfaceMeta):
+        def method(self):
+            pass
+
+    class Impl(Interface):
+        pass
+
+    Interface.added = lambda self: None
+
+    # Simulate a concurrent assignment while the index of `Impl` is recomputed
+    get_own_members = members._get_own_members
+
+    def _get_own_members(cls):
+        if cls is Impl:
+            monkeypatch.setattr(members, "_get_own_members", get_own_members)
+            Interface.other = lambda self: None
+        return get_own_members(cls)
+
+    monkeypatch.setattr(members, "_get_own_members", _get_own_members)
+    get_member_index(Impl)
+    assert type(Impl.__dict__[INDEX_ATTR]).__name__ == "_StaleIndex"
+    assert "other" in get_member_index(Impl)
+    assert get_member_index(Impl) is Impl.__dict__[INDEX_ATTR]
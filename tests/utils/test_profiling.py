@@ -0,0 +1,118 @@
+import json
+import re
+import threading
+
+import pytest
+
+from interface_meta import InterfaceMeta, override
+from interface_meta.utils.profiling import MethodProfiler, is_profiling_supported
+
+requires_monitoring = pytest.mark.skipif(not is_profiling_supported(), reason="Requires `sys.monitoring` (Python 3.12+).")
+
+
+def _make_interface():
+    class Base(metaclass=InterfaceMeta):
+        def method(self, x):
+            pass
+
+        @property
+        def prop(self):
+            return 1
+
+    class Impl(Base):
+        @override
+        def method(self, x):
+            if x < 0:
+                raise ValueError(x)
+            return self.helper(x)
+
+        def helper(self, x):
+            return x
+
+    class Child(Impl):
+        pass
+
+    return Base, Impl, Child
+
+
+@pytest.mark.skipif(is_profiling_supported(), reason="Requires Python < 3.12.")
+def test_profiling_unsupported():
+    Base, _, _ = _make_interface()
+    with pytest.raises(RuntimeError, match=re.escape("requires `sys.monitoring`")):
+        MethodProfiler(Base).start()
+
+
+@requires_monitoring
+def test_profiling(tmp_path):
+    Base, Impl, Child = _make_interface()
+
+    with pytest.raises(ValueError):
+        MethodProfiler()
+
+    profiler = MethodProfiler(Child)  # Profiles the interface of `Child`
+    Impl().method(1)
+    with profiler:
+        assert profiler.running
+        for i in range(10):
+            Child().method(i)
+        with pytest.raises(ValueError):
+            Impl().method(-1)
+        assert Base().prop == 1
+
+        # Classes created while profiling are also profiled
+        class Late(Base):
+            @override
+            def method(self, x):
+                return x
+
+        Late().method(1)
+    Impl().method(1)
+    assert not profiler.running
+
+    profiles = {(p.interface.rsplit(".", 1)[-1], p.implementation.rsplit(".", 1)[-1], p.method): p for p in profiler.snapshot()}
+    assert set(profiles) == {("Base", "Impl", "method"), ("Base", "Base", "prop"), ("Base", "Late", "method")}
+    impl_method = profiles["Base", "Impl", "method"]
+    assert (impl_method.calls, impl_method.timed_calls) == (11, 10)
+    assert sum(count for _, count in impl_method.histogram) == 10
+    assert impl_method.mean_time > 0
+
+    # Profiling can be resumed, and snapshots dumped
+    profiler.reset()
+    assert profiler.snapshot() == []
+    profiler.start()
+    Child().method(1)
+    profiler.stop()
+    profiler.dump(tmp_path / "profile.json")
+    (profile,) = json.loads((tmp_path / "profile.json").read_text())
+    assert (profile["method"], profile["calls"]) == ("method", 1)
+
+
+@requires_monitoring
+def test_profiling_threads():
+    Base, Impl, _ = _make_interface()
+
+    def call():
+        for i in range(100):
+            Impl().method(i)
+
+    with MethodProfiler(Base) as profiler:
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # Statistics of all threads are merged in snapshots
+        (profile,) = profiler.snapshot()
+        assert (profile.calls, profile.timed_calls) == (400, 400)
+        call()
+    (profile,) = profiler.snapshot()
+    assert (profile.calls, profile.timed_calls) == (500, 500)
+    assert sum(count for _, count in profile.histogram) == 500
+
+
+@requires_monitoring
+def test_profiling_exclusive():
+    Base, _, _ = _make_interface()
+    with MethodProfiler(Base):
+        with pytest.raises(RuntimeError, match="already in use"):
+            MethodProfiler(Base).start()
@@ -0,0 +1,106 @@
+import sys
+import threading
+
+import pytest
+
+from interface_meta.utils.registry import ImplementationRegistry, get_registry, register_implementation
+
+
+class Interface:
+    pass
+
+
+def test_register_implementation():
+    class Base:
+        pass
+
+    class Impl(Base):
+        pass
+
+    Base.__interface__ = Base
+    assert get_registry(Impl) is None
+    registry = register_implementation(Base)
+    assert get_registry(Impl) is registry
+    assert len(registry) == 0
+
+    register_implementation(Impl, keys="impl")
+    assert registry.get("impl") is Impl
+    assert registry.get("Impl") is Impl
+    assert registry.get("missing", default=Base) is Base
+    assert list(registry) == [Impl]
+
+
+def test_registry_threaded_registration():
+    registry = ImplementationRegistry(Interface)
+    classes = [type(f"Impl{i}", (Interface,), {}) for i in range(400)]
+
+    def register(chunk):
+        for cls in chunk:
+            registry.register(cls, keys=(cls.__name__.lower(),))
+
+    threads = [threading.Thread(target=register, args=(classes[i::8],)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(registry.concrete, key=classes.index) == classes
+    assert all(registry[cls.__name__.lower()] is cls for cls in classes)
+
+
+PLUGIN_INTERFACE = """
+from interface_meta import InterfaceMeta
+
+class Backend(metaclass=InterfaceMeta):
+    INTERFACE_REGISTRY = True
+    INTERFACE_ENTRY_POINT_GROUP = "plugin_pkg.backends"
+    INTERFACE_PLUGIN_MANIFEST = {
+        "plugin_pkg.csv": "csv",
+        "plugin_pkg.sql": ("sql", "sqlite"),
+    }
+"""
+
+PLUGIN_IMPLEMENTATION = """
+from .interface import Backend
+
+class {name}(Backend):
+    INTERFACE_REGISTRY_KEYS = {keys!r}
+"""
+
+
+@pytest.fixture
+def plugin_package(tmp_path, monkeypatch):
+    package = tmp_path / "plugin_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "interface.py").write_text(PLUGIN_INTERFACE)
+    (package / "csv.py").write_text(PLUGIN_IMPLEMENTATION.format(name="CSV", keys=("csv",)))
+    (package / "sql.py").write_text(PLUGIN_IMPLEMENTATION.format(name="SQL", keys=("sql", "sqlite")))
+    (package / "parquet.py").write_text(PLUGIN_IMPLEMENTATION.format(name="Parquet", keys=()))
+    dist_info = tmp_path / "plugin_pkg-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: plugin_pkg\nVersion: 1.0\n")
+    (dist_info / "entry_points.txt").write_text("[plugin_pkg.backends]\nparquet = plugin_pkg.parquet:Parquet\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield package
+    for name in list(sys.modules):
+        if name.startswith("plugin_pkg"):
+            del sys.modules[name]
+
+
+def test_registry_plugins(plugin_package):
+    from plugin_pkg.interface import Backend
+
+    registry = get_registry(Backend)
+    assert set(registry.available()) == {"csv", "sql", "sqlite", "parquet"}
+    assert registry.implementations == ()
+    assert "plugin_pkg.csv" not in sys.modules
+
+    assert registry["sqlite"].__name__ == "SQL"
+    assert "plugin_pkg.sql" in sys.modules
+    assert "plugin_pkg.csv" not in sys.modules
+
+    # Entry points may refer to classes that do not declare the key
+    assert registry["parquet"].__name__ == "Parquet"
+    assert registry.get("missing") is None
+    assert [cls.__name__ for cls in registry.concrete] == ["SQL", "Parquet"]
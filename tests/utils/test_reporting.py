@@ -15,3 +15,92 @@ def test_report_violation_logs_warning(caplog):
 def test_report_violation_raises():
     with pytest.raises(InterfaceConformanceError, match="something went wrong"):
         report_violation("something went wrong", raise_on_violation=True)
+
+
+def test_report_violation_structured_and_deduplicated(caplog):
+    import logging
+
+    from interface_meta.utils.reporting import MISSING_OVERRIDE, Violation, collect_violations
+
+    violation = Violation(MISSING_OVERRIDE, "Child", "method", "Base")
+    with caplog.at_level(logging.WARNING, logger="interface_meta"), collect_violations() as violations:
+        report_violation(violation, raise_on_violation=False)
+        report_violation(violation, raise_on_violation=False)
+
+    assert violations == [violation, violation]
+    assert violation.as_dict() == {
+        "kind": MISSING_OVERRIDE,
+        "class": "Child",
+        "qualname": None,
+        "member": "method",
+        "interface": "Base",
+        "message": "`Child.method` overrides interface `Base.method` without using the `@override` decorator.",
+    }
+    assert [record.name for record in caplog.records] == ["interface_meta"]
+    assert caplog.text.count("without using the `@override` decorator") == 1
+
+
+def test_report_violation_distinguishes_same_named_classes(caplog):
+    import logging
+
+    from interface_meta import InterfaceMeta
+
+    class Base(metaclass=InterfaceMeta):
+        def method(self):
+            pass
+
+    def make_child():
+        class Child(Base):
+            def method(self):
+                pass
+
+        return Child
+
+    class Child(Base):
+        def method(self):
+            pass
+
+    with caplog.at_level(logging.WARNING, logger="interface_meta"):
+        make_child()
+
+    assert caplog.text.count("`Child.method` overrides interface `Base.method`") == 2
+
+
+def test_report_violation_formats_lazily():
+    import logging
+
+    from interface_meta.utils.reporting import SIGNATURE_MISMATCH, Violation, logger
+
+    class Unformattable:
+        def __str__(self):
+            raise AssertionError("Should not be formatted.")
+
+    level = logger.level
+    logger.setLevel(logging.ERROR)
+    try:
+        report_violation(Violation(SIGNATURE_MISMATCH, "Child", "method", "Base", (Unformattable(), Unformattable())), raise_on_violation=False)
+    finally:
+        logger.setLevel(level)
+
+
+def test_collect_violations_per_thread():
+    import threading
+
+    from interface_meta.utils.reporting import collect_violations
+
+    started, reported = threading.Event(), threading.Event()
+
+    def report():
+        started.wait()
+        report_violation("from another thread", raise_on_violation=False)
+        reported.set()
+
+    thread = threading.Thread(target=report)
+    thread.start()
+    with collect_violations() as violations:
+        started.set()
+        reported.wait()
+        report_violation("from this thread", raise_on_violation=False)
+    thread.join()
+
+    assert [violation.message for violation in violations] == ["from this thread"]
@@ -0,0 +1,225 @@
+import json
+import textwrap
+
+import pytest
+
+from interface_meta.__main__ import main
+from interface_meta.utils.reporting import collect_violations
+from interface_meta.utils.static import StaticChecker, check_paths
+
+SOURCES = [
+    """
+    from interface_meta import InterfaceMeta, override
+
+    class Base(metaclass=InterfaceMeta):
+        ATTRIBUTE = 1
+
+        def method(self, a, b=1, *, c=None):
+            pass
+
+        @property
+        def prop(self):
+            pass
+
+        @classmethod
+        def cmethod(cls, a):
+            pass
+
+        def _private(self):
+            pass
+
+    class Impl(Base):
+        def ATTRIBUTE(self):
+            pass
+
+        def method(self, a, b=2):
+            pass
+
+        @override
+        @property
+        def prop(self):
+            pass
+
+        @prop.setter
+        def prop(self, value):
+            pass
+
+        @override
+        def cmethod(self, a):
+            pass
+
+        @override
+        def unknown(self):
+            pass
+
+        @Base.override(force=True)
+        def _private(self, x):
+            pass
+    """,
+    """
+    import interface_meta
+    from interface_meta import override, skip
+
+    class Meta(interface_meta.InterfaceMeta):
+        INTERFACE_EXPLICIT_OVERRIDES = False
+
+    class Base(metaclass=Meta):
+        INTERFACE_SKIPPED_NAMES = {"skipped"}
+
+        value: int
+
+        def method(self, a, /, b, *args, **kwargs):
+            pass
+
+        def skipped(self):
+            pass
+
+        @skip
+        def ignored(self):
+            pass
+
+    class Impl(Base):
+        value = 1
+
+        def method(self, a, /, b, c=None, *args, **kwargs):
+            pass
+
+        def skipped(self, x):
+            pass
+
+        def ignored(self, x):
+            pass
+
+        @override
+        @staticmethod
+        def other():
+            pass
+
+    class Deeper(Impl):
+        INTERFACE_EXPLICIT_OVERRIDES = True
+
+        def method(self, a, b, *args, **kwargs):
+            pass
+    """,
+    """
+    import functools
+    from interface_meta import InterfaceMeta, override
+
+    def logged(f):
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            return f(*args, **kwargs)
+
+        return wrapper
+
+    class Base(metaclass=InterfaceMeta):
+        ATTRIBUTE = None
+
+        def method(self, a):
+            pass
+
+        @property
+        def value(self):
+            pass
+
+        def other(self, a):
+            pass
+
+    class Impl(Base):
+        ATTRIBUTE = dict()
+
+        @logged
+        def method(self, a):
+            pass
+
+        @functools.cached_property
+        def value(self):
+            pass
+
+        @override
+        @logged
+        def other(self, a):
+            pass
+    """,
+]
+
+
+def _get_runtime_violations(source):
+    with collect_violations() as violations:
+        exec(compile(source, "<test>", "exec"), {"__name__": "static_test"})
+    return {(v.kind, v.clsname, v.name, v.ref_clsname) for v in violations}
+
+
+def _get_static_violations(source):
+    checker = StaticChecker()
+    checker.add_source(source, "static_test")
+    return {(v.violation.kind, v.violation.clsname, v.violation.name, v.violation.ref_clsname) for v in checker.check()}
+
+
+@pytest.mark.parametrize("source", [textwrap.dedent(source) for source in SOURCES])
+def test_static_matches_runtime(source):
+    runtime = _get_runtime_violations(source)
+    assert runtime
+    assert _get_static_violations(source) == runtime
+
+
+def test_static_cross_module(tmp_path):
+    package = tmp_path / "pkg"
+    (package / "sub").mkdir(parents=True)
+    (package / "__init__.py").write_text("from .interfaces import Base\n")
+    (package / "interfaces.py").write_text(
+        textwrap.dedent(
+            """
+            from interface_meta import InterfaceMeta
+
+            class Base(metaclass=InterfaceMeta):
+                def method(self, a):
+                    pass
+            """
+        )
+    )
+    (package / "sub" / "__init__.py").write_text("")
+    (package / "sub" / "impl.py").write_text(
+        textwrap.dedent(
+            """
+            from .. import Base
+            from external import Mixin
+
+            class Impl(Base):
+                @Base.override
+                def method(self, b):
+                    pass
+
+            class Mixed(Mixin, Base):
+                @Base.override
+                def other(self):
+                    pass
+            """
+        )
+    )
+
+    violations = check_paths([package / "sub"], search_paths=[package])
+    assert [(v.lineno, v.violation.kind, v.violation.clsname) for v in violations] == [(7, "signature_mismatch", "Impl")]
+    assert violations[0].path.endswith("impl.py")
+    assert str(violations[0]).endswith("does not conform to interface `Base.method(self, a)`.")
+
+    # Without the search path, the interface cannot be resolved
+    assert check_paths([package / "sub"]) == []
+
+
+def test_static_syntax_error(tmp_path):
+    (tmp_path / "broken.py").write_text("class Broken(:\n")
+    (violation,) = check_paths([tmp_path])
+    assert violation.violation.kind == "generic"
+    assert "Unable to parse" in violation.violation.message
+
+
+def test_check_cli(tmp_path, capsys):
+    (tmp_path / "mod.py").write_text(textwrap.dedent(SOURCES[0]))
+    assert main(["check", str(tmp_path), "--json"]) == 1
+    violations = json.loads(capsys.readouterr().out)
+    assert {v["kind"] for v in violations} == {"type_change", "missing_override", "signature_mismatch", "unknown_override"}
+    assert all(v["path"].endswith("mod.py") for v in violations)
+
+    (tmp_path / "mod.py").write_text("")
+    assert main(["check", str(tmp_path)]) == 0
@@ -0,0 +1,90 @@
+import json
+import sys
+import textwrap
+
+import pytest
+
+from interface_meta.__main__ import main
+from interface_meta.utils.verification import iter_submodules, verify_packages
+
+INTERFACE = """
+from interface_meta import InterfaceMeta
+
+class Base(metaclass=InterfaceMeta):
+    INTERFACE_CHECK_MODE = "deferred"
+
+    def method(self, a):
+        pass
+"""
+
+IMPLEMENTATION = """
+from .interfaces import Base
+
+class {name}(Base):
+    def method(self, b):
+        pass
+"""
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    root = tmp_path / "verify_pkg"
+    (root / "impls").mkdir(parents=True)
+    (root / "__init__.py").write_text("")
+    (root / "interfaces.py").write_text(textwrap.dedent(INTERFACE))
+    (root / "impls" / "__init__.py").write_text("")
+    (root / "impls" / "a.py").write_text(IMPLEMENTATION.replace(".interfaces", "..interfaces").format(name="A"))
+    (root / "impls" / "b.py").write_text(IMPLEMENTATION.replace(".interfaces", "..interfaces").format(name="B"))
+    (root / "shared.py").write_text("from .impls.a import A\n")
+    (root / "broken.py").write_text("raise RuntimeError('boom')\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield root
+    for name in list(sys.modules):
+        if name.startswith("verify_pkg"):
+            del sys.modules[name]
+
+
+def test_iter_submodules(package):
+    assert sorted(iter_submodules("verify_pkg")) == [
+        "verify_pkg",
+        "verify_pkg.broken",
+        "verify_pkg.impls",
+        "verify_pkg.impls.a",
+        "verify_pkg.impls.b",
+        "verify_pkg.interfaces",
+        "verify_pkg.shared",
+    ]
+    assert "verify_pkg" not in sys.modules
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_verify_packages(package, jobs):
+    results = verify_packages(["verify_pkg"], jobs=jobs)
+    assert results["modules"] == 7
+    assert [(v["kind"], v["class"]) for v in results["violations"]] == [
+        ("missing_override", "A"),
+        ("signature_mismatch", "A"),
+        ("missing_override", "B"),
+        ("signature_mismatch", "B"),
+    ]
+    assert results["errors"] == [{"module": "verify_pkg.broken", "error": "RuntimeError: boom"}]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_verify_packages_same_named_classes(package, jobs):
+    (package / "impls" / "c.py").write_text(IMPLEMENTATION.replace(".interfaces", "..interfaces").format(name="A"))
+    results = verify_packages(["verify_pkg.impls"], jobs=jobs)
+    assert [(v["kind"], v["qualname"]) for v in results["violations"]] == [
+        ("missing_override", "verify_pkg.impls.a.A"),
+        ("signature_mismatch", "verify_pkg.impls.a.A"),
+        ("missing_override", "verify_pkg.impls.c.A"),
+        ("signature_mismatch", "verify_pkg.impls.c.A"),
+        ("missing_override", "verify_pkg.impls.b.B"),
+        ("signature_mismatch", "verify_pkg.impls.b.B"),
+    ]
+
+
+def test_verify_cli(package, capsys):
+    assert main(["verify", "verify_pkg.impls", "-j", "1"]) == 1
+    results = json.loads(capsys.readouterr().out)
+    assert len(results["violations"]) == 4